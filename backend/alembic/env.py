@@ -30,6 +30,15 @@ target_metadata = Base.metadata
 from app.models import Location, Plant  # noqa: F401
 
 
+# Tables managed outside of the models (APScheduler creates its own job store table)
+EXCLUDED_TABLES = {"apscheduler_jobs"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip tables autogenerate should not manage."""
+    return not (type_ == "table" and name in EXCLUDED_TABLES)
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -45,6 +54,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -54,7 +64,9 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_object=include_object
+    )
 
     with context.begin_transaction():
         context.run_migrations()
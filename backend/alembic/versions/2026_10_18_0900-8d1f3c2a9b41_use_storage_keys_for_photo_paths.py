@@ -0,0 +1,35 @@
+"""use storage keys for photo paths
+
+Revision ID: 8d1f3c2a9b41
+Revises: 651a9a684242
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8d1f3c2a9b41'
+down_revision = '651a9a684242'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Photo paths used to be relative to the working directory ("uploads/photos/...").
+    # They are now storage keys relative to the storage root ("photos/...").
+    op.execute(
+        "UPDATE photos SET file_path = substr(file_path, 9) WHERE file_path LIKE 'uploads/%'"
+    )
+    op.execute(
+        "UPDATE photos SET thumbnail_path = substr(thumbnail_path, 9) "
+        "WHERE thumbnail_path LIKE 'uploads/%'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE photos SET file_path = 'uploads/' || file_path")
+    op.execute(
+        "UPDATE photos SET thumbnail_path = 'uploads/' || thumbnail_path "
+        "WHERE thumbnail_path IS NOT NULL"
+    )
@@ -0,0 +1,42 @@
+"""add photo processing queue
+
+Revision ID: c4e7a1d2f5b3
+Revises: 8d1f3c2a9b41
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e7a1d2f5b3'
+down_revision = '8d1f3c2a9b41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing photos were processed synchronously at upload time
+    op.add_column('photos', sa.Column('processing_status', sa.String(length=20), nullable=False, server_default='ready'))
+    op.alter_column('photos', 'processing_status', server_default=None)
+
+    op.create_table('photo_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('photo_id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['photo_id'], ['photos.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_photo_jobs_status_run_after', 'photo_jobs', ['status', 'run_after'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_photo_jobs_status_run_after', table_name='photo_jobs')
+    op.drop_table('photo_jobs')
+    op.drop_column('photos', 'processing_status')
@@ -0,0 +1,33 @@
+"""add photo exif metadata
+
+Revision ID: e2b9d4f6a1c8
+Revises: c4e7a1d2f5b3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b9d4f6a1c8'
+down_revision = 'c4e7a1d2f5b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('photos', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('photos', sa.Column('longitude', sa.Float(), nullable=True))
+    op.create_index(
+        'ix_photos_plant_id_taken_at',
+        'photos',
+        ['plant_id', sa.text('taken_at DESC NULLS LAST')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_photos_plant_id_taken_at', table_name='photos')
+    op.drop_column('photos', 'longitude')
+    op.drop_column('photos', 'latitude')
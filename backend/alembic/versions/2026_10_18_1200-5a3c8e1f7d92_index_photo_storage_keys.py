@@ -0,0 +1,26 @@
+"""index photo storage keys
+
+Revision ID: 5a3c8e1f7d92
+Revises: e2b9d4f6a1c8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5a3c8e1f7d92'
+down_revision = 'e2b9d4f6a1c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Storage reconciliation looks up listed files by key, one batch at a time
+    op.create_index(op.f('ix_photos_file_path'), 'photos', ['file_path'], unique=False)
+    op.create_index(op.f('ix_photos_thumbnail_path'), 'photos', ['thumbnail_path'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_photos_thumbnail_path'), table_name='photos')
+    op.drop_index(op.f('ix_photos_file_path'), table_name='photos')
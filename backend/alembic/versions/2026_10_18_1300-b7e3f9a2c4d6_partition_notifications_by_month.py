@@ -0,0 +1,90 @@
+"""partition notifications by month
+
+Revision ID: b7e3f9a2c4d6
+Revises: 5a3c8e1f7d92
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3f9a2c4d6'
+down_revision = '5a3c8e1f7d92'
+branch_labels = None
+depends_on = None
+
+notification_type = postgresql.ENUM(
+    'WATERING_DUE', 'WATERING_OVERDUE', 'FERTILIZATION_DUE', 'FERTILIZATION_OVERDUE',
+    'TREATMENT_REMINDER', name='notificationtype', create_type=False,
+)
+
+
+def upgrade() -> None:
+    op.rename_table('notifications', 'notifications_unpartitioned')
+    op.execute('ALTER TABLE notifications_unpartitioned RENAME CONSTRAINT notifications_pkey TO notifications_unpartitioned_pkey')
+
+    op.create_table('notifications',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('type', notification_type, nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('plant_id', sa.Uuid(), nullable=True),
+    sa.Column('plant_name', sa.String(length=255), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('read_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)',
+    )
+
+    # One partition per month from the oldest notification to three months ahead;
+    # later months are created by the cleanup job
+    op.execute("""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', coalesce((SELECT min(created_at) FROM notifications_unpartitioned), now())),
+                    date_trunc('month', now()) + interval '3 months',
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF notifications FOR VALUES FROM (%L) TO (%L)',
+                    'notifications_' || to_char(month, 'YYYY_MM'),
+                    month,
+                    (month + interval '1 month')::date
+                );
+            END LOOP;
+        END
+        $$
+    """)
+    op.execute('CREATE TABLE notifications_default PARTITION OF notifications DEFAULT')
+
+    op.execute('INSERT INTO notifications SELECT id, type, title, message, plant_id, plant_name, is_read, created_at, read_at FROM notifications_unpartitioned')
+    op.drop_table('notifications_unpartitioned')
+
+
+def downgrade() -> None:
+    op.create_table('notifications_unpartitioned',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('type', notification_type, nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('plant_id', sa.Uuid(), nullable=True),
+    sa.Column('plant_name', sa.String(length=255), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('read_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name='notifications_unpartitioned_pkey')
+    )
+    op.execute('INSERT INTO notifications_unpartitioned SELECT id, type, title, message, plant_id, plant_name, is_read, created_at, read_at FROM notifications')
+    # Dropping the parent drops every partition
+    op.drop_table('notifications')
+    op.rename_table('notifications_unpartitioned', 'notifications')
+    op.execute('ALTER TABLE notifications RENAME CONSTRAINT notifications_unpartitioned_pkey TO notifications_pkey')
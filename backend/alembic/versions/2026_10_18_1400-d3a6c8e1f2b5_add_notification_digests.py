@@ -0,0 +1,27 @@
+"""add notification digests
+
+Revision ID: d3a6c8e1f2b5
+Revises: b7e3f9a2c4d6
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3a6c8e1f2b5'
+down_revision = 'b7e3f9a2c4d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('notifications', sa.Column('location_id', sa.Uuid(), nullable=True))
+    op.add_column('notifications', sa.Column('plant_ids', postgresql.ARRAY(sa.Uuid()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('notifications', 'plant_ids')
+    op.drop_column('notifications', 'location_id')
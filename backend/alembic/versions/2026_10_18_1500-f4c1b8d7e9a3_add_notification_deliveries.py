@@ -0,0 +1,39 @@
+"""add notification deliveries
+
+Revision ID: f4c1b8d7e9a3
+Revises: d3a6c8e1f2b5
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4c1b8d7e9a3'
+down_revision = 'd3a6c8e1f2b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_deliveries',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('notification_id', sa.UUID(), nullable=False),
+    sa.Column('channel', sa.String(length=20), nullable=False),
+    sa.Column('target', sa.Text(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notification_deliveries_status_run_after', 'notification_deliveries', ['status', 'run_after'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_deliveries_status_run_after', table_name='notification_deliveries')
+    op.drop_table('notification_deliveries')
@@ -0,0 +1,32 @@
+"""add location reminder times
+
+Revision ID: a8d2e5f1c7b4
+Revises: f4c1b8d7e9a3
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d2e5f1c7b4'
+down_revision = 'f4c1b8d7e9a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('locations', sa.Column('timezone', sa.String(length=64), server_default='UTC', nullable=False))
+    op.add_column('locations', sa.Column('reminder_hour', sa.Integer(), server_default='8', nullable=False))
+    op.create_index(op.f('ix_plants_location_id'), 'plants', ['location_id'], unique=False)
+    op.create_index(op.f('ix_watering_logs_plant_id'), 'watering_logs', ['plant_id'], unique=False)
+    op.create_index(op.f('ix_fertilization_logs_plant_id'), 'fertilization_logs', ['plant_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_fertilization_logs_plant_id'), table_name='fertilization_logs')
+    op.drop_index(op.f('ix_watering_logs_plant_id'), table_name='watering_logs')
+    op.drop_index(op.f('ix_plants_location_id'), table_name='plants')
+    op.drop_column('locations', 'reminder_hour')
+    op.drop_column('locations', 'timezone')
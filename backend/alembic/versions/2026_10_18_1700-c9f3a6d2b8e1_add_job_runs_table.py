@@ -0,0 +1,40 @@
+"""add job runs table
+
+Revision ID: c9f3a6d2b8e1
+Revises: a8d2e5f1c7b4
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9f3a6d2b8e1'
+down_revision = 'a8d2e5f1c7b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('job_runs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('job_id', sa.String(length=100), nullable=False),
+    sa.Column('trigger', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('duration_seconds', sa.Float(), nullable=True),
+    sa.Column('items_processed', sa.Integer(), nullable=True),
+    sa.Column('details', sa.JSON(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_runs_job_id_started_at', 'job_runs', ['job_id', 'started_at'], unique=False)
+    op.create_index('uq_job_runs_running_job_id', 'job_runs', ['job_id'], unique=True, postgresql_where=sa.text("status = 'running'"))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_job_runs_running_job_id', table_name='job_runs', postgresql_where=sa.text("status = 'running'"))
+    op.drop_index('ix_job_runs_job_id_started_at', table_name='job_runs')
+    op.drop_table('job_runs')
@@ -0,0 +1,40 @@
+"""unique active photo jobs
+
+Revision ID: e6b2d9f4a7c1
+Revises: c9f3a6d2b8e1
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6b2d9f4a7c1'
+down_revision = 'c9f3a6d2b8e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep one active job per photo, preferring one a worker is already running
+    op.execute(
+        """
+        DELETE FROM photo_jobs
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY photo_id ORDER BY status = 'running' DESC, created_at, id
+                ) AS n
+                FROM photo_jobs
+                WHERE status IN ('queued', 'running')
+            ) AS ranked
+            WHERE n > 1
+        )
+        """
+    )
+    op.create_index('uq_photo_jobs_active_photo_id', 'photo_jobs', ['photo_id'], unique=True, postgresql_where=sa.text("status IN ('queued', 'running')"))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_photo_jobs_active_photo_id', table_name='photo_jobs', postgresql_where=sa.text("status IN ('queued', 'running')"))
@@ -0,0 +1,26 @@
+"""add photo upright copies
+
+Revision ID: f2a7c4e9b3d8
+Revises: e6b2d9f4a7c1
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a7c4e9b3d8'
+down_revision = 'e6b2d9f4a7c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('photos', sa.Column('upright_path', sa.String(length=500), nullable=True))
+    op.create_index(op.f('ix_photos_upright_path'), 'photos', ['upright_path'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_photos_upright_path'), table_name='photos')
+    op.drop_column('photos', 'upright_path')
@@ -0,0 +1,26 @@
+"""Shared API dependencies."""
+
+import secrets
+
+from fastapi import Header, HTTPException, status
+
+from app.config import settings
+
+
+def is_admin_token(token: str | None) -> bool:
+    """Check a token against the configured admin token (never valid when unset)."""
+    if not settings.admin_token or token is None:
+        return False
+    return secrets.compare_digest(token, settings.admin_token)
+
+
+async def require_admin(x_admin_token: str | None = Header(None)) -> None:
+    """Require the ``X-Admin-Token`` header to match the configured admin token."""
+    if not settings.admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Admin API is disabled"
+        )
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token"
+        )
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.api.v1 import locations, plants, watering, fertilization, treatments, photos, growth_logs, dashboard, notifications
+from app.api.v1 import locations, plants, watering, fertilization, treatments, photos, growth_logs, dashboard, notifications, admin
 
 api_router = APIRouter()
 
@@ -16,6 +16,7 @@ api_router.include_router(photos.router)
 api_router.include_router(growth_logs.router)
 api_router.include_router(dashboard.router)
 api_router.include_router(notifications.router, prefix="/notifications", tags=["notifications"])
+api_router.include_router(admin.router)
 
 
 @api_router.get("/")
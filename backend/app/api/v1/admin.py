@@ -0,0 +1,147 @@
+"""Admin API endpoints for background jobs, request profiles and slow queries."""
+
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_admin
+from app.database import get_db
+from app.models.job_run import JobTrigger
+from app.profiling import PROFILE_SUFFIX, get_profile_path, list_profiles
+from app.scheduler import JOBS, JOBS_BY_ID, has_leader, request_job_run
+from app.schemas.job_run import JobDurationStats, JobInfo, JobRunResponse
+from app.schemas.profiling import ProfileInfo
+from app.schemas.slow_query import SlowQueryGroupResponse, SlowQueryResponse
+from app.services.job_run_service import JobAlreadyRunningError, JobRunService
+from app.slow_queries import slow_query_log
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+def get_job_run_service(db: AsyncSession = Depends(get_db)) -> JobRunService:
+    """Dependency to get job run service."""
+    return JobRunService(db)
+
+
+def get_job_definition(job_id: str) -> dict:
+    """Get a registered job or raise 404."""
+    definition = JOBS_BY_ID.get(job_id)
+    if definition is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} not found"
+        )
+    return definition
+
+
+@router.get("/jobs", response_model=list[JobInfo])
+async def get_jobs(service: JobRunService = Depends(get_job_run_service)):
+    """List background jobs with their latest run."""
+    latest = await service.get_latest_runs()
+    return [
+        JobInfo(
+            id=definition["id"],
+            name=definition["name"],
+            schedule=str(definition["trigger"]),
+            last_run=latest.get(definition["id"]),
+        )
+        for definition in JOBS
+    ]
+
+
+@router.get("/jobs/runs", response_model=list[JobRunResponse])
+async def get_job_runs(
+    job_id: str | None = Query(None, description="Only return runs of this job"),
+    run_status: str | None = Query(
+        None, alias="status", description="Filter by status: running, succeeded or failed"
+    ),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    service: JobRunService = Depends(get_job_run_service),
+):
+    """Get job run history, most recent first."""
+    return await service.get_runs(job_id, run_status, skip, limit)
+
+
+@router.post(
+    "/jobs/{job_id}/run", response_model=JobRunResponse, status_code=status.HTTP_202_ACCEPTED
+)
+async def trigger_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    service: JobRunService = Depends(get_job_run_service),
+):
+    """
+    Ask the scheduler leader to run a job now; follow it in the run history.
+
+    Returns 409 if the job is already running anywhere in the cluster,
+    whether scheduled or triggered manually, and 503 if no process is
+    currently the scheduler leader.
+    """
+    get_job_definition(job_id)
+    if not await has_leader(db):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="No scheduler leader is running; try again shortly",
+        )
+    try:
+        run = await service.start(job_id, JobTrigger.MANUAL.value)
+    except JobAlreadyRunningError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    await request_job_run(db, job_id, run.id)
+    return run
+
+
+@router.get("/jobs/{job_id}/durations", response_model=JobDurationStats)
+async def get_job_durations(
+    job_id: str,
+    days: int = Query(30, ge=1, le=365, description="Number of days to include"),
+    service: JobRunService = Depends(get_job_run_service),
+):
+    """Get the duration histogram and daily duration trend of a job."""
+    get_job_definition(job_id)
+    return await service.get_duration_stats(job_id, days)
+
+
+@router.get("/profiles", response_model=list[ProfileInfo])
+async def get_profiles():
+    """List the request profiles saved by this API process, newest first."""
+    return await asyncio.to_thread(list_profiles)
+
+
+@router.get("/profiles/{profile_id}", response_class=FileResponse)
+async def download_profile(profile_id: str):
+    """Download a saved profile; open it at https://www.speedscope.app."""
+    path = await asyncio.to_thread(get_profile_path, profile_id)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Profile {profile_id} not found"
+        )
+    return FileResponse(
+        path, media_type="application/json", filename=f"{profile_id}{PROFILE_SUFFIX}"
+    )
+
+
+@router.get("/slow-queries", response_model=list[SlowQueryResponse])
+async def get_slow_queries(
+    caller: str | None = Query(None, description="Only queries whose caller contains this"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+):
+    """Get the slow queries recorded by this API process, most recent first."""
+    return slow_query_log.entries(limit=limit, caller=caller)
+
+
+@router.get("/slow-queries/top", response_model=list[SlowQueryGroupResponse])
+async def get_top_slow_queries(
+    limit: int = Query(20, ge=1, le=200, description="Maximum number of statements to return"),
+):
+    """Get the recorded slow queries grouped by statement, by total time."""
+    return slow_query_log.top(limit)
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries():
+    """Clear the slow query log of this API process."""
+    slow_query_log.clear()
@@ -1,13 +1,17 @@
 """
 Dashboard API endpoints
+
+Responses are served from a short-lived, precompressed cache, cleared
+when plants, care logs, schedules or treatments change.
 """
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.response_cache import ResponseCache
 from app.schemas.dashboard import (
     ActiveTreatment,
     CalendarEvent,
@@ -20,51 +24,73 @@ from app.services.dashboard_service import DashboardService
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+dashboard_cache = ResponseCache(
+    "dashboard",
+    tables={
+        "plants",
+        "locations",
+        "watering_schedules",
+        "watering_logs",
+        "fertilization_schedules",
+        "fertilization_logs",
+        "treatments",
+        "treatment_applications",
+    },
+)
+
 
 @router.get("/overview", response_model=OverviewStats)
-async def get_dashboard_overview(db: AsyncSession = Depends(get_db)):
+async def get_dashboard_overview(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get overview statistics for dashboard
     """
     service = DashboardService(db)
-    stats = await service.get_overview_stats()
-    return stats
+    return await dashboard_cache.respond(
+        request, "overview", service.get_overview_stats, OverviewStats
+    )
 
 
 @router.get("/tasks", response_model=DueTasks)
-async def get_due_tasks(db: AsyncSession = Depends(get_db)):
+async def get_due_tasks(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get all due tasks (watering, fertilization)
     """
     service = DashboardService(db)
-    tasks = await service.get_due_tasks()
-    return tasks
+    return await dashboard_cache.respond(
+        request, ("tasks", date.today()), service.get_due_tasks, DueTasks
+    )
 
 
 @router.get("/treatments/active", response_model=list[ActiveTreatment])
-async def get_active_treatments(db: AsyncSession = Depends(get_db)):
+async def get_active_treatments(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get all active treatments
     """
     service = DashboardService(db)
-    treatments = await service.get_active_treatments()
-    return treatments
+    return await dashboard_cache.respond(
+        request, "active_treatments", service.get_active_treatments, list[ActiveTreatment]
+    )
 
 
 @router.get("/activities/recent", response_model=list[RecentActivity])
 async def get_recent_activities(
-    limit: int = 10, db: AsyncSession = Depends(get_db)
+    request: Request, limit: int = 10, db: AsyncSession = Depends(get_db)
 ):
     """
     Get recent activities
     """
     service = DashboardService(db)
-    activities = await service.get_recent_activities(limit=limit)
-    return activities
+    return await dashboard_cache.respond(
+        request,
+        ("recent_activities", limit),
+        lambda: service.get_recent_activities(limit=limit),
+        list[RecentActivity],
+    )
 
 
 @router.get("/calendar", response_model=list[CalendarEvent])
 async def get_calendar_events(
+    request: Request,
     start_date: date = Query(..., description="Start date for calendar range"),
     end_date: date = Query(..., description="End date for calendar range"),
     db: AsyncSession = Depends(get_db),
@@ -73,5 +99,9 @@ async def get_calendar_events(
     Get all calendar events (watering, fertilization, treatments) for a date range
     """
     service = CalendarService(db)
-    events = await service.get_calendar_events(start_date, end_date)
-    return events
+    # The service's dataclasses are serialized as is; the response model only documents the shape
+    return await dashboard_cache.respond(
+        request,
+        ("calendar", start_date, end_date),
+        lambda: service.get_calendar_events(start_date, end_date),
+    )
@@ -1,12 +1,19 @@
 """Notification API endpoints."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import AsyncSessionLocal, get_db
+from app.events import notification_broadcaster
 from app.schemas.notification import (
+    NotificationItem,
     NotificationResponse,
     NotificationStats,
     NotificationMarkRead,
@@ -40,6 +47,58 @@ async def get_notification_stats(
     return await service.get_stats()
 
 
+@router.get("/stream")
+async def stream_notifications(request: Request):
+    """
+    Stream notification changes as Server-Sent Events.
+
+    Sends a ``stats`` event on connect, then one event per created, read or
+    deleted notification, or per batch created by a job. Events carry the
+    unread count and ids, not notifications; clients fetch those. The stream
+    does not hold a database connection.
+    """
+    async with AsyncSessionLocal() as db:
+        stats = await NotificationService(db).get_stats()
+
+    return StreamingResponse(
+        _event_stream(request, stats.model_dump(mode="json")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _event_stream(request: Request, stats: dict) -> AsyncIterator[str]:
+    """Format broadcast events for an SSE client until it disconnects."""
+    yield f"event: stats\ndata: {json.dumps(stats)}\n\n"
+
+    async with notification_broadcaster.subscribe() as queue:
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.notification_stream_keepalive_seconds
+                )
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+
+            yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/{notification_id}/items", response_model=list[NotificationItem])
+async def get_notification_items(
+    notification_id: UUID,
+    service: NotificationService = Depends(get_notification_service),
+):
+    """Get the plants covered by a notification, expanding digest notifications."""
+    items = await service.get_notification_items(notification_id)
+    if items is None:
+        from fastapi import HTTPException
+
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return items
+
+
 @router.post("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_as_read(
     notification_id: UUID,
@@ -1,14 +1,19 @@
 """API endpoints for photo operations."""
-from pathlib import Path
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.responses import FileResponse, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.services.photo_service import PhotoService
-from app.schemas.photo import PhotoResponse, PhotoUpdate
+from app.schemas.photo import (
+    PhotoBatchUploadResponse,
+    PhotoProcessingStatusResponse,
+    PhotoResponse,
+    PhotoUpdate,
+)
+from app.storage import get_storage
 
 router = APIRouter(prefix="/photos", tags=["photos"])
 
@@ -23,20 +28,43 @@ async def get_photo(
     return await service.get_photo_by_id(photo_id)
 
 
+@router.get("/{photo_id}/status", response_model=PhotoProcessingStatusResponse)
+async def get_photo_status(
+    photo_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the post-processing status of a photo."""
+    service = PhotoService(db)
+    return await service.get_processing_status(photo_id)
+
+
 @router.get("/{photo_id}/file")
 async def get_photo_file(
     photo_id: UUID,
     thumbnail: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get the actual photo file."""
+    """
+    Get the actual photo file.
+
+    Object storage backends redirect to a presigned URL so the bytes never pass
+    through the API workers; the local backend serves the file directly.
+    """
     service = PhotoService(db)
     photo = await service.get_photo_by_id(photo_id)
+    storage = get_storage()
+
+    if thumbnail and photo.thumbnail_path:
+        key = photo.thumbnail_path
+    else:
+        key = photo.upright_path or photo.file_path
 
-    file_path = Path(photo.thumbnail_path if thumbnail and photo.thumbnail_path else photo.file_path)
+    url = await storage.presigned_url(key, content_type=photo.mime_type)
+    if url:
+        return RedirectResponse(url, status_code=307)
 
-    if not file_path.exists():
-        from fastapi import HTTPException
+    file_path = storage.local_path(key)
+    if file_path is None or not file_path.exists():
         raise HTTPException(status_code=404, detail="Photo file not found")
 
     return FileResponse(file_path, media_type=photo.mime_type)
@@ -84,3 +112,15 @@ async def upload_plant_photo(
     """Upload a photo for a plant."""
     service = PhotoService(db)
     return await service.upload_photo(plant_id, file, caption)
+
+
+@router.post("/plants/{plant_id}/photos/batch", response_model=PhotoBatchUploadResponse)
+async def upload_plant_photos(
+    plant_id: UUID,
+    files: list[UploadFile] = File(...),
+    caption: str | None = Form(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Upload several photos for a plant, reporting the result of each file."""
+    service = PhotoService(db)
+    return await service.upload_photos(plant_id, files, caption)
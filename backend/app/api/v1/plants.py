@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.responses import ORJSONResponse
 from app.schemas.plant import PlantCreate, PlantResponse, PlantUpdate, PlantWithLocation
 from app.schemas.timeline import TimelineItem
 from app.services.plant_service import PlantService
@@ -95,7 +96,8 @@ async def get_plant_timeline(
 ):
     """Get timeline of all activities for a plant."""
     timeline_service = TimelineService(db)
-    return await timeline_service.get_plant_timeline(plant_id)
+    # Serialized as is; the response model only documents the shape
+    return ORJSONResponse(await timeline_service.get_plant_timeline(plant_id))
 
 
 @router.put("/{plant_id}", response_model=PlantResponse)
@@ -0,0 +1,28 @@
+"""Start and stop the scheduler and queue workers."""
+
+import logging
+
+from app.config import settings
+from app.delivery import close_senders, get_delivery_targets
+from app.scheduler import start_scheduler, stop_scheduler
+from app.workers.notification_delivery import delivery_worker
+from app.workers.photo_processing import photo_worker
+
+logger = logging.getLogger(__name__)
+
+
+def start_background_jobs() -> None:
+    """Start the scheduler and every enabled queue worker on the running event loop."""
+    start_scheduler()
+    if settings.photo_worker_enabled:
+        photo_worker.start()
+    if settings.notification_delivery_enabled and get_delivery_targets():
+        delivery_worker.start()
+
+
+async def stop_background_jobs() -> None:
+    """Stop the scheduler and queue workers, letting in-flight work finish."""
+    await stop_scheduler()
+    await photo_worker.stop()
+    await delivery_worker.stop()
+    await close_senders()
@@ -0,0 +1,70 @@
+"""
+Queue existing photos for EXIF extraction and orientation normalization.
+
+Walks the photos table in ID order, one batch at a time, and enqueues a
+processing job for each photo that does not already have one queued or
+running, so the command can be re-run safely. The photo processing worker then extracts
+``taken_at`` and GPS data, stores an upright copy of sideways originals and
+re-renders the thumbnail.
+
+Usage:
+    python -m app.commands.backfill_photo_exif [--batch-size 500] [--all] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database import AsyncSessionLocal
+from app.repositories.photo_job_repository import PhotoJobRepository
+from app.repositories.photo_repository import PhotoRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill(batch_size: int, missing_only: bool, dry_run: bool) -> int:
+    """Enqueue photos in batches. Returns the number of photos queued."""
+    found = queued = 0
+    after_id = None
+
+    while True:
+        # A fresh session per batch keeps the identity map from growing
+        async with AsyncSessionLocal() as db:
+            photo_ids = await PhotoRepository(db).get_ids_batch(
+                after_id, batch_size, missing_taken_at_only=missing_only
+            )
+            if not photo_ids:
+                break
+
+            if dry_run:
+                queued += len(photo_ids)
+            else:
+                queued += await PhotoJobRepository(db).enqueue(photo_ids)
+                await db.commit()
+
+        found += len(photo_ids)
+        after_id = photo_ids[-1]
+        logger.info(f"Queued {queued} of {found} photos so far")
+
+    return queued
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500, help="Photos per batch")
+    parser.add_argument(
+        "--all", action="store_true", help="Include photos that already have taken_at set"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Count matching photos without queueing them"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    count = asyncio.run(backfill(args.batch_size, not args.all, args.dry_run))
+    action = "Found" if args.dry_run else "Queued"
+    logger.info(f"{action} {count} photos for EXIF backfill")
+
+
+if __name__ == "__main__":
+    main()
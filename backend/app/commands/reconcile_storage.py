@@ -0,0 +1,41 @@
+"""
+Reconcile stored photo files with the photos table.
+
+Deletes orphaned files, reports photos whose files are missing and prints
+storage usage per plant.
+
+Usage:
+    python -m app.commands.reconcile_storage [--dry-run]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database import AsyncSessionLocal
+from app.schemas.storage import StorageReconciliationReport
+from app.services.storage_reconciliation_service import StorageReconciliationService
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile(dry_run: bool) -> StorageReconciliationReport:
+    """Run a reconciliation pass."""
+    async with AsyncSessionLocal() as db:
+        return await StorageReconciliationService(db).reconcile(dry_run=dry_run)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report orphaned files without deleting them"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    report = asyncio.run(reconcile(args.dry_run))
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
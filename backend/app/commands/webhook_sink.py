@@ -0,0 +1,57 @@
+"""
+Run a local HTTP sink that prints received webhook deliveries.
+
+Point NOTIFICATION_WEBHOOK_URLS at it to test webhook delivery locally. Use
+--status to answer with an error code and exercise retries.
+
+Usage:
+    python -m app.commands.webhook_sink [--port 8025] [--status 200]
+"""
+
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(status: int) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler that prints each POST body and answers ``status``."""
+
+    class SinkHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            signature = self.headers.get("X-Plants-Signature")
+            try:
+                payload = json.dumps(json.loads(body), indent=2)
+            except ValueError:
+                payload = body.decode(errors="replace")
+
+            print(f"POST {self.path} -> {status}" + (f" (signature {signature})" if signature else ""))
+            print(payload, flush=True)
+
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # Requests are printed above
+
+    return SinkHandler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8025, help="Port to listen on")
+    parser.add_argument("--status", type=int, default=200, help="HTTP status to respond with")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.status))
+    print(f"Webhook sink listening on http://{args.host}:{args.port}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Response compression: content negotiation, compressors and level choice.
+
+Brotli is used when the client accepts it and the optional ``brotli``
+package is installed, gzip otherwise. Responses compressed per request use
+the configured levels, dropped to the fastest level while the process is
+CPU bound, so compression does not add to the queueing of a saturated
+event loop. Bodies compressed once and served many times (the response
+cache) use ``PRECOMPRESSED_LEVELS`` instead.
+"""
+
+import time
+import zlib
+from enum import Enum
+
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+class Encoding(str, Enum):
+    """Content encodings the API can send."""
+
+    BROTLI = "br"
+    GZIP = "gzip"
+
+
+# Slower levels pay off for bodies compressed once; brotli above 8 costs
+# several times more for almost no gain on JSON
+PRECOMPRESSED_LEVELS = {Encoding.BROTLI: 8, Encoding.GZIP: 9}
+BUSY_LEVEL = 1
+
+# zlib window bits for a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def brotli_available() -> bool:
+    """Check whether the brotli package is installed."""
+    return brotli is not None
+
+
+def available_encodings() -> list[Encoding]:
+    """Supported encodings, most preferred first."""
+    return [Encoding.BROTLI, Encoding.GZIP] if brotli_available() else [Encoding.GZIP]
+
+
+def negotiate(accept_encoding: str | None) -> Encoding | None:
+    """Pick the encoding for an ``Accept-Encoding`` header; None means send as is."""
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in available_encodings():
+        weight = weights.get(encoding.value, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: str | None) -> bool:
+    """Whether a media type is worth compressing (text, JSON; not photos or event streams)."""
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type.endswith("+json")
+        or media_type in _COMPRESSIBLE_TYPES
+    )
+
+
+class Compressor:
+    """Incremental brotli or gzip compressor."""
+
+    def __init__(self, encoding: Encoding, level: int):
+        if encoding is Encoding.BROTLI:
+            compressor = brotli.Compressor(quality=level)
+            self._compress, self._finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+            self._compress, self._finish = compressor.compress, compressor.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def compress(data: bytes, encoding: Encoding, level: int) -> bytes:
+    """Compress a whole body."""
+    compressor = Compressor(encoding, level)
+    return compressor.compress(data) + compressor.finish()
+
+
+class CpuMonitor:
+    """Share of one core used by this process, measured over at least ``interval`` seconds."""
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._wall = time.monotonic()
+        self._cpu = time.process_time()
+        self._utilization = 0.0
+
+    def utilization(self) -> float:
+        now = time.monotonic()
+        if now - self._wall >= self.interval:
+            cpu = time.process_time()
+            self._utilization = (cpu - self._cpu) / (now - self._wall)
+            self._wall, self._cpu = now, cpu
+        return self._utilization
+
+
+cpu_monitor = CpuMonitor()
+
+
+def dynamic_level(encoding: Encoding) -> int:
+    """The level for compressing a response now, lower while the process is busy."""
+    if cpu_monitor.utilization() >= settings.compression_busy_cpu:
+        return BUSY_LEVEL
+    if encoding is Encoding.BROTLI:
+        return settings.compression_brotli_level
+    return settings.compression_gzip_level
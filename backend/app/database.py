@@ -1,18 +1,54 @@
 """Database connection and session management."""
 
+import time
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+from app.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_CONNECTIONS_IN_USE
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Connection pool reporting checkout wait time and connections in use.
+
+    The wait includes opening a new connection when the pool has none idle.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        connection = super()._do_get()
+        DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+        DB_POOL_CONNECTIONS_IN_USE.inc()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        DB_POOL_CONNECTIONS_IN_USE.dec()
+        super()._do_return_conn(record)
+
+
+def create_engine(pool_size: int, max_overflow: int) -> AsyncEngine:
+    """Create the async engine with the given connection pool size."""
+    return create_async_engine(
+        settings.database_url,
+        echo=settings.environment == "development",
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+
 
 # Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.environment == "development",
-    future=True,
-)
+engine = create_engine(settings.db_pool_size, settings.db_max_overflow)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -24,6 +60,18 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def configure_engine(pool_size: int, max_overflow: int) -> None:
+    """
+    Replace the engine with one using a different pool size.
+
+    Used by processes with their own pool settings (such as the background
+    worker). Call it at startup, before any session is opened.
+    """
+    global engine
+    engine = create_engine(pool_size, max_overflow)
+    AsyncSessionLocal.configure(bind=engine)
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
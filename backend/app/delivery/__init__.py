@@ -0,0 +1,70 @@
+"""Notification delivery channels (email and webhooks)."""
+
+from app.config import settings
+from app.delivery.base import ChannelSender, DeliveryError, RateLimiter
+from app.models.notification_delivery import DeliveryChannel
+
+_senders: dict[str, ChannelSender] = {}
+
+
+def get_delivery_targets() -> list[tuple[str, str]]:
+    """Get the ``(channel, target)`` pairs every new notification is sent to."""
+    targets = []
+    if settings.smtp_host and settings.notification_email_recipients:
+        targets.append(
+            (DeliveryChannel.EMAIL.value, ", ".join(settings.notification_email_recipients))
+        )
+    targets.extend(
+        (DeliveryChannel.WEBHOOK.value, url) for url in settings.notification_webhook_urls
+    )
+    return targets
+
+
+def get_sender(channel: str) -> ChannelSender:
+    """Get the process-wide sender for a channel, creating it on first use."""
+    if channel not in _senders:
+        _senders[channel] = _create_sender(channel)
+    return _senders[channel]
+
+
+def _create_sender(channel: str) -> ChannelSender:
+    if channel == DeliveryChannel.EMAIL.value:
+        from app.delivery.email import EmailSender
+
+        return EmailSender(
+            host=settings.smtp_host,
+            port=settings.smtp_port,
+            sender=settings.smtp_sender,
+            username=settings.smtp_username,
+            password=settings.smtp_password,
+            start_tls=settings.smtp_start_tls,
+            rate_per_minute=settings.notification_email_rate_per_minute,
+        )
+
+    if channel == DeliveryChannel.WEBHOOK.value:
+        from app.delivery.webhook import WebhookSender
+
+        return WebhookSender(
+            secret=settings.notification_webhook_secret,
+            timeout=settings.notification_webhook_timeout_seconds,
+            rate_per_minute=settings.notification_webhook_rate_per_minute,
+        )
+
+    raise ValueError(f"Unknown delivery channel: {channel}")
+
+
+async def close_senders() -> None:
+    """Close every sender that has been created."""
+    while _senders:
+        _, sender = _senders.popitem()
+        await sender.close()
+
+
+__all__ = [
+    "ChannelSender",
+    "DeliveryError",
+    "RateLimiter",
+    "get_delivery_targets",
+    "get_sender",
+    "close_senders",
+]
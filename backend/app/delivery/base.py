@@ -0,0 +1,69 @@
+"""Delivery channel interface and rate limiting."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+
+
+class DeliveryError(Exception):
+    """Raised when a channel fails to send. Permanent errors are not retried."""
+
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how often a channel sends.
+
+    Tokens refill at ``rate_per_minute``; up to ``burst`` sends can go out back
+    to back after an idle period. Each notification sent takes a token, so a
+    batch sent as one message or request takes one per notification in it.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int | None = None):
+        self.rate = rate_per_minute / 60
+        self.capacity = burst or max(1, int(rate_per_minute // 6))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Wait until ``tokens`` sends are allowed, then consume them.
+
+        A batch larger than the burst goes out once the bucket is full and
+        leaves it in debt, so the sends after it wait for the refill.
+        """
+        needed = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+
+
+class ChannelSender(ABC):
+    """
+    Sends batches of notifications to one kind of channel.
+
+    A sender is shared per process and keeps its connections open between
+    batches. Each batch goes out as a single message or request.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self.rate_limiter = RateLimiter(rate_per_minute)
+
+    @abstractmethod
+    async def send(self, target: str, notifications: list[dict]) -> None:
+        """Send ``notifications`` to ``target``, raising DeliveryError on failure."""
+
+    async def close(self) -> None:
+        """Release any connections held by the sender."""
@@ -0,0 +1,92 @@
+"""Email delivery over SMTP."""
+
+import asyncio
+from email.message import EmailMessage
+
+from app.delivery.base import ChannelSender, DeliveryError
+
+try:
+    import aiosmtplib
+except ImportError:  # pragma: no cover - optional dependency
+    aiosmtplib = None
+
+
+class EmailSender(ChannelSender):
+    """
+    Sends notifications as plain-text emails.
+
+    A single SMTP connection is reused across batches and reopened when the
+    server drops it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        username: str | None = None,
+        password: str | None = None,
+        start_tls: bool = False,
+        timeout: float = 30,
+        rate_per_minute: float = 30,
+    ):
+        """Initialize the sender. The connection is opened on first use."""
+        if aiosmtplib is None:
+            raise RuntimeError(
+                "Email delivery requires the 'aiosmtplib' package. "
+                "Install it with: poetry install --extras email"
+            )
+        super().__init__(rate_per_minute)
+        self.sender = sender
+        self._smtp = aiosmtplib.SMTP(
+            hostname=host,
+            port=port,
+            username=username,
+            password=password,
+            start_tls=start_tls,
+            timeout=timeout,
+        )
+        self._lock = asyncio.Lock()
+
+    def _build_message(self, target: str, notifications: list[dict]) -> EmailMessage:
+        """Build one email covering a batch of notifications."""
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = target
+        if len(notifications) == 1:
+            message["Subject"] = notifications[0]["title"]
+        else:
+            message["Subject"] = f"{len(notifications)} plant care reminders"
+        message.set_content(
+            "\n\n".join(f"{n['title']}\n{n['message']}" for n in notifications)
+        )
+        return message
+
+    async def send(self, target: str, notifications: list[dict]) -> None:
+        """Email ``notifications`` to the comma-separated recipients in ``target``."""
+        message = self._build_message(target, notifications)
+
+        async with self._lock:
+            try:
+                if not self._smtp.is_connected:
+                    await self._smtp.connect()
+                try:
+                    await self._smtp.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # The server closed the idle connection; reconnect once
+                    await self._smtp.connect()
+                    await self._smtp.send_message(message)
+            except aiosmtplib.SMTPRecipientsRefused as e:
+                raise DeliveryError(f"Recipients refused: {e}", permanent=True) from e
+            except (aiosmtplib.SMTPException, OSError) as e:
+                self._smtp.close()
+                raise DeliveryError(f"SMTP error: {e}") from e
+
+    async def close(self) -> None:
+        """Close the SMTP connection."""
+        async with self._lock:
+            if self._smtp.is_connected:
+                try:
+                    await self._smtp.quit()
+                except aiosmtplib.SMTPException:
+                    self._smtp.close()
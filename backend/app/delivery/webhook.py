@@ -0,0 +1,61 @@
+"""Webhook delivery over HTTP."""
+
+import hashlib
+import hmac
+import json
+
+import httpx
+
+from app.delivery.base import ChannelSender, DeliveryError
+
+# Client errors that are worth retrying; any other 4xx is treated as permanent
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429}
+
+
+class WebhookSender(ChannelSender):
+    """
+    POSTs notifications as JSON to webhook URLs.
+
+    One HTTP client with keep-alive connections is shared by every URL. When a
+    secret is configured, the body is signed with HMAC-SHA256 in the
+    ``X-Plants-Signature`` header.
+    """
+
+    def __init__(
+        self,
+        secret: str | None = None,
+        timeout: float = 10,
+        max_connections: int = 10,
+        rate_per_minute: float = 60,
+    ):
+        """Initialize the sender and its HTTP client."""
+        super().__init__(rate_per_minute)
+        self.secret = secret
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def send(self, target: str, notifications: list[dict]) -> None:
+        """POST ``{"notifications": [...]}`` to the URL in ``target``."""
+        body = json.dumps({"notifications": notifications}).encode()
+        headers = {"Content-Type": "application/json"}
+        if self.secret:
+            signature = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+            headers["X-Plants-Signature"] = f"sha256={signature}"
+
+        try:
+            response = await self._client.post(target, content=body, headers=headers)
+        except httpx.HTTPError as e:
+            raise DeliveryError(f"Webhook request failed: {e!r}") from e
+
+        if response.status_code >= 400:
+            raise DeliveryError(
+                f"Webhook returned HTTP {response.status_code}",
+                permanent=response.status_code < 500
+                and response.status_code not in RETRYABLE_STATUS_CODES,
+            )
+
+    async def close(self) -> None:
+        """Close the HTTP client and its connections."""
+        await self._client.aclose()
@@ -0,0 +1,142 @@
+"""Cross-process notification events over Postgres LISTEN/NOTIFY."""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+import asyncpg
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_CHANNEL = "notification_events"
+
+
+def notify_statement(event: dict) -> Select:
+    """The statement queueing an event on the notification channel."""
+    return select(func.pg_notify(NOTIFICATION_CHANNEL, json.dumps(event)))
+
+
+async def publish_notification_event(db: AsyncSession, event: dict) -> None:
+    """
+    Queue an event on the notification channel.
+
+    ``pg_notify`` is transactional: listeners only receive the event once the
+    caller commits, and never if it rolls back.
+    """
+    await db.execute(notify_statement(event))
+
+
+class NotificationBroadcaster:
+    """
+    Fans out notification events to the subscribers of this process.
+
+    Each process holds a single dedicated LISTEN connection, opened when the
+    first client subscribes (or on ``start``), so the number of open streams
+    does not affect the database connection count. Events with a handler
+    registered through ``on`` go to that handler instead of the subscribers.
+    """
+
+    RECONNECT_DELAY_SECONDS = 1.0
+    MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+    def __init__(self, dsn: str, queue_size: int = 100):
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+        self._handlers: dict[str, Callable[[dict], None]] = {}
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of clients currently subscribed in this process."""
+        return len(self._subscribers)
+
+    def on(self, event_name: str, handler: Callable[[dict], None]) -> None:
+        """Handle the events named ``event_name`` in this process, instead of streaming them."""
+        self._handlers[event_name] = handler
+
+    def start(self) -> None:
+        """Listen even while no client is subscribed, so handlers receive their events."""
+        self._ensure_listening()
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """Subscribe to events; yields a queue that receives each event as a dict."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        self._ensure_listening()
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def _ensure_listening(self) -> None:
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._listen(), name="notification-listener")
+
+    def _dispatch(self, connection, pid, channel, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed notification event: {payload!r}")
+            return
+
+        handler = self._handlers.get(event.get("event"))
+        if handler is not None:
+            handler(event)
+            return
+
+        for queue in self._subscribers:
+            if queue.full():
+                # A slow client loses its oldest event rather than stalling everyone
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _listen(self) -> None:
+        delay = self.RECONNECT_DELAY_SECONDS
+        while not self._stopping:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Notification listener failed to connect, retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SECONDS)
+                continue
+
+            delay = self.RECONNECT_DELAY_SECONDS
+            lost = asyncio.Event()
+            connection.add_termination_listener(lambda _: lost.set())
+            try:
+                await connection.add_listener(NOTIFICATION_CHANNEL, self._dispatch)
+                logger.info("Notification listener connected")
+                # Events are delivered by the listener callback until the connection drops
+                await lost.wait()
+                logger.warning("Notification listener connection lost, reconnecting")
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+
+    async def close(self) -> None:
+        """Stop listening and close the connection."""
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+notification_broadcaster = NotificationBroadcaster(
+    settings.database_url.replace("+asyncpg", "", 1),
+    queue_size=settings.notification_stream_queue_size,
+)
@@ -0,0 +1,143 @@
+"""
+Readiness checks for load balancer probes.
+
+Each check reports its status and latency. The database check is cached for
+``health_db_cache_seconds`` and shared by concurrent probes, so a burst of
+probes costs at most one query.
+"""
+
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import text
+
+from app import database
+from app.config import settings
+from app.metrics import record_cache_lookup
+from app.scheduler import leader_election
+from app.schemas.health import DependencyCheck, ReadinessResponse
+from app.storage import LocalStorage, get_storage
+
+OK = "ok"
+FAIL = "fail"
+SKIPPED = "skipped"
+
+
+async def _timed(check: Callable[[], Awaitable[str | None]]) -> DependencyCheck:
+    """Run ``check``, which raises on failure and may return a detail message."""
+    start = time.perf_counter()
+    try:
+        detail = await check()
+        status = OK
+    except Exception as e:
+        detail = str(e) or type(e).__name__
+        status = FAIL
+    return DependencyCheck(
+        status=status, latency_ms=round((time.perf_counter() - start) * 1000, 2), detail=detail
+    )
+
+
+class CachedCheck:
+    """Caches a check's result for ``ttl`` seconds; concurrent callers share one run."""
+
+    def __init__(self, name: str, check: Callable[[], Awaitable[DependencyCheck]], ttl: float):
+        self.name = name
+        self.check = check
+        self.ttl = ttl
+        self._result: DependencyCheck | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __call__(self) -> DependencyCheck:
+        async with self._lock:
+            hit = self._result is not None and time.monotonic() - self._checked_at < self.ttl
+            record_cache_lookup(self.name, hit)
+            if hit:
+                return self._result.model_copy(update={"cached": True})
+
+            self._result = await self.check()
+            self._checked_at = time.monotonic()
+            return self._result
+
+
+async def check_database() -> DependencyCheck:
+    """Run ``SELECT 1`` within ``health_db_timeout_seconds``."""
+
+    async def query() -> None:
+        async with database.engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    return await _timed(
+        lambda: asyncio.wait_for(query(), timeout=settings.health_db_timeout_seconds)
+    )
+
+
+def check_pool() -> DependencyCheck:
+    """Fail when the share of pool connections in use reaches ``health_max_pool_saturation``."""
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    in_use = database.engine.pool.checkedout()
+    saturation = in_use / capacity if capacity else 0.0
+    return DependencyCheck(
+        status=FAIL if saturation >= settings.health_max_pool_saturation else OK,
+        latency_ms=0.0,
+        detail=f"{in_use}/{capacity} connections in use",
+    )
+
+
+async def check_upload_dir() -> DependencyCheck:
+    """Check the local upload directory is writable and has ``health_min_free_disk_mb`` free."""
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        return DependencyCheck(status=SKIPPED, detail="Not using local storage")
+
+    def probe() -> str:
+        root = storage.root
+        root.mkdir(parents=True, exist_ok=True)
+        probe_path = root / f".health-{uuid.uuid4().hex}"
+        with open(probe_path, "wb") as f:
+            f.write(b"ok")
+        os.unlink(probe_path)
+
+        free_mb = shutil.disk_usage(root).free // (1024 * 1024)
+        if free_mb < settings.health_min_free_disk_mb:
+            raise RuntimeError(
+                f"Only {free_mb}MB free, minimum is {settings.health_min_free_disk_mb}MB"
+            )
+        return f"{free_mb}MB free"
+
+    return await _timed(lambda: asyncio.to_thread(probe))
+
+
+def check_scheduler() -> DependencyCheck:
+    """Check the scheduler leader election is running, if this process runs background jobs."""
+    if not settings.api_background_jobs_enabled:
+        return DependencyCheck(status=SKIPPED, detail="Background jobs run in a separate worker")
+
+    if not leader_election.running:
+        return DependencyCheck(status=FAIL, latency_ms=0.0, detail="Scheduler is not running")
+    role = "leader" if leader_election.is_leader else "follower"
+    return DependencyCheck(status=OK, latency_ms=0.0, detail=role)
+
+
+cached_check_database = CachedCheck(
+    "health_database", check_database, settings.health_db_cache_seconds
+)
+
+
+async def check_readiness() -> ReadinessResponse:
+    """Run every readiness check; ready only if none failed."""
+    database_check, upload_check = await asyncio.gather(
+        cached_check_database(), check_upload_dir()
+    )
+    checks = {
+        "database": database_check,
+        "pool": check_pool(),
+        "upload_dir": upload_check,
+        "scheduler": check_scheduler(),
+    }
+    ready = all(check.status != FAIL for check in checks.values())
+    return ReadinessResponse(status="ready" if ready else "not_ready", checks=checks)
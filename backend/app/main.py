@@ -3,12 +3,27 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.v1 import api_router
+from app.background import start_background_jobs, stop_background_jobs
 from app.config import settings
-from app.scheduler import start_scheduler, stop_scheduler
+from app.events import notification_broadcaster
+from app.health import check_readiness
+from app.metrics import mark_process_dead, render_metrics
+from app.middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+)
+from app.query_stats import install_query_hooks
+from app.schemas.health import ReadinessResponse
+from app.storage import close_storage
+from app.tracing import setup_tracing, shutdown_tracing
+from app.utils.image_processor import shutdown_image_executor
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +33,20 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     # Startup
     logger.info("Starting up application...")
-    start_scheduler()
+    if settings.api_background_jobs_enabled:
+        start_background_jobs()
+    if settings.response_cache_seconds > 0:
+        # Clears the response caches on writes committed by other processes
+        notification_broadcaster.start()
     yield
     # Shutdown
     logger.info("Shutting down application...")
-    stop_scheduler()
+    await stop_background_jobs()
+    await notification_broadcaster.close()
+    await close_storage()
+    shutdown_image_executor()
+    shutdown_tracing()
+    mark_process_dead()
 
 
 app = FastAPI(
@@ -32,6 +56,16 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Profile requests on demand for admins (innermost, so it sees routing and serialization)
+app.add_middleware(ProfilingMiddleware)
+
+# Count SQL queries per request (Server-Timing header, N+1 warnings)
+install_query_hooks()
+app.add_middleware(QueryStatsMiddleware)
+# Compress responses (inside the metrics, so latency includes compression)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -44,6 +78,9 @@ app.add_middleware(
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
+# Trace requests, SQL, services and repositories (when TRACING_EXPORTER is set)
+setup_tracing(f"{settings.tracing_service_name}-api", app)
+
 
 @app.get("/health")
 async def health_check():
@@ -52,3 +89,35 @@ async def health_check():
         "status": "healthy",
         "environment": settings.environment,
     }
+
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and its event loop is responsive."""
+    return {"status": "alive"}
+
+
+@app.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "Not ready"}},
+)
+async def readiness_check():
+    """
+    Readiness probe: checks the database, pool saturation, upload directory and
+    scheduler. Returns 503 if any check fails, so the load balancer stops
+    routing traffic to this process.
+    """
+    readiness = await check_readiness()
+    if readiness.status != "ready":
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=readiness.model_dump()
+        )
+    return readiness
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
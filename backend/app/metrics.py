@@ -0,0 +1,110 @@
+"""
+Prometheus metrics.
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set (required with several API or worker
+processes), every process writes its samples to files in that directory and
+``/metrics`` aggregates them, so any worker serving the scrape reports the
+whole host. The directory must exist and be emptied before the processes start.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route"]
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# Database
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_QUERIES = Counter("db_queries_total", "SQL statements executed")
+DB_QUERY_DURATION = Counter("db_query_duration_seconds_total", "Time spent executing SQL")
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total", "SQL statements slower than the slow query threshold"
+)
+
+# Photos
+PHOTO_UPLOAD_BYTES = Histogram(
+    "photo_upload_bytes",
+    "Size of uploaded photos",
+    buckets=(64e3, 256e3, 512e3, 1e6, 2e6, 4e6, 8e6, 16e6),
+)
+THUMBNAIL_DURATION = Histogram(
+    "photo_thumbnail_duration_seconds",
+    "Time to decode a photo and render its thumbnail",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+# Scheduled jobs
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Scheduled and manual job run duration",
+    ["job_id", "status"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800),
+)
+
+# Response compression: ratio = compressed / uncompressed bytes
+HTTP_COMPRESSION_INPUT_BYTES = Counter(
+    "http_compression_input_bytes_total", "Response bytes before compression", ["encoding"]
+)
+HTTP_COMPRESSION_OUTPUT_BYTES = Counter(
+    "http_compression_output_bytes_total", "Response bytes after compression", ["encoding"]
+)
+
+# Caches: hit ratio = hits / (hits + misses)
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Cache lookups", ["cache", "result"])
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a lookup in the named cache."""
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def record_compression(encoding: str, input_bytes: int, output_bytes: int) -> None:
+    """Count the bytes of a response before and after compression."""
+    HTTP_COMPRESSION_INPUT_BYTES.labels(encoding).inc(input_bytes)
+    HTTP_COMPRESSION_OUTPUT_BYTES.labels(encoding).inc(output_bytes)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Render all metrics (of every process in multiprocess mode) and their content type."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this process's live gauges from the aggregate when it exits."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
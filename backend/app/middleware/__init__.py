@@ -0,0 +1,13 @@
+"""ASGI middleware."""
+
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
+
+__all__ = [
+    "CompressionMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "QueryStatsMiddleware",
+]
@@ -0,0 +1,104 @@
+"""Middleware compressing responses with brotli or gzip."""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.compression import Compressor, dynamic_level, is_compressible, negotiate
+from app.config import settings
+from app.metrics import record_compression
+
+
+def _compressible(message: Message) -> bool:
+    """Whether a response, from its start message, may be compressed."""
+    status = message["status"]
+    if not 200 <= status < 300 or status in (204, 206):
+        return False
+    headers = Headers(raw=message.get("headers", []))
+    return "content-encoding" not in headers and is_compressible(headers.get("content-type"))
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses in the best encoding the client accepts.
+
+    Responses are sent as is when they are smaller than
+    ``compression_minimum_size``, already encoded (such as precompressed
+    cache hits), not successful, or of a type that does not compress
+    (photos, event streams). Streamed responses are compressed chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not settings.compression_enabled:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        held_start: Message | None = None
+        compressor: Compressor | None = None
+        input_bytes = output_bytes = 0
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal held_start, compressor, input_bytes, output_bytes
+            if message["type"] == "http.response.start":
+                if _compressible(message):
+                    # Held until the first body chunk, which tells whether it is worth it
+                    held_start = message
+                else:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body":
+                # Such as a file sent by path, which the server reads itself
+                if held_start is not None:
+                    await send(held_start)
+                    held_start = None
+                await send(message)
+                return
+            if held_start is None and compressor is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                start, held_start = held_start, None
+                if not more_body and len(body) < settings.compression_minimum_size:
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = Compressor(encoding, dynamic_level(encoding))
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding.value
+                headers.add_vary_header("Accept-Encoding")
+                del headers["Content-Length"]
+                del headers["Accept-Ranges"]
+                etag = headers.get("ETag")
+                if etag and not etag.startswith("W/"):
+                    # The compressed body is no longer byte-identical to the original
+                    headers["ETag"] = f"W/{etag}"
+                if not more_body:
+                    data = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(data))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": data})
+                    record_compression(encoding.value, len(body), len(data))
+                    return
+                await send(start)
+
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.finish()
+            input_bytes += len(body)
+            output_bytes += len(data)
+            if data or not more_body:
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+            if not more_body:
+                record_compression(encoding.value, input_bytes, output_bytes)
+
+        await self.app(scope, receive, send_compressed)
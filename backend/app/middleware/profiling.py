@@ -0,0 +1,104 @@
+"""Middleware profiling requests on demand for admins."""
+
+import asyncio
+import logging
+
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.responses import HTMLResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.deps import is_admin_token
+from app.config import settings
+from app.profiling import (
+    ProfileFormat,
+    RequestProfiler,
+    new_profile_id,
+    parse_profile_format,
+    profiling_available,
+    save_profile,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a request when asked with an ``X-Profile`` header or ``profile``
+    query parameter and a valid ``X-Admin-Token``.
+
+    ``speedscope`` (or ``1``) saves a speedscope file, whose id is returned in
+    the ``X-Profile-Id`` header, for download from the admin API. ``html``
+    returns pyinstrument's HTML report instead of the response. Requests
+    without a valid token, or made while another request is being profiled,
+    are served normally.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        if settings.profiling_enabled and not profiling_available():
+            raise RuntimeError(
+                "Request profiling requires the 'pyinstrument' package. "
+                "Install it with: poetry install --extras profiling"
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.profiling_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        profile_format = parse_profile_format(
+            headers.get("x-profile") or QueryParams(scope["query_string"]).get("profile")
+        )
+        if profile_format is None or not is_admin_token(headers.get("x-admin-token")):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = RequestProfiler.try_start(settings.profiling_interval_ms / 1000)
+        if profiler is None:
+            logger.info(f"Not profiling {scope['method']} {scope['path']}: another profile is running")
+            await self.app(scope, receive, send)
+            return
+
+        if profile_format == ProfileFormat.HTML:
+            await self._profile_html(profiler, scope, receive, send)
+        else:
+            await self._profile_speedscope(profiler, scope, receive, send)
+
+    async def _profile_speedscope(
+        self, profiler: RequestProfiler, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        profile_id = new_profile_id(scope["method"], scope["path"])
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.stop()
+            document = profiler.speedscope(f"{scope['method']} {scope['path']}")
+            await asyncio.to_thread(save_profile, profile_id, document)
+            logger.info(f"Saved profile {profile_id}")
+
+    async def _profile_html(
+        self, profiler: RequestProfiler, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        status_code = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+
+        response = HTMLResponse(
+            profiler.html(), headers={"X-Profiled-Status": str(status_code)}
+        )
+        await response(scope, receive, send)
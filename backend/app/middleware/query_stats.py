@@ -0,0 +1,94 @@
+"""Middleware reporting the SQL queries run by each request."""
+
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.query_stats import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+
+def route_template(scope: Scope) -> str | None:
+    """Get the path template of the matched route (``/api/v1/plants/{plant_id}``)."""
+    # FastAPI resolves routes of included routers into an effective route
+    # context; older versions set the full route in the scope directly
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    return getattr(route, "path_format", None)
+
+
+def server_timing(stats: QueryStats, elapsed: float) -> str:
+    """Format query stats as a ``Server-Timing`` header value."""
+    return (
+        f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+        f"total;dur={elapsed * 1000:.2f}"
+    )
+
+
+class QueryStatsMiddleware:
+    """
+    Counts the queries and database time of each request.
+
+    The totals are sent in a ``Server-Timing`` header (as of when the response
+    starts) and logged once the response completes. Requests over
+    ``query_budget`` and statements repeated more than
+    ``query_repeat_threshold`` times (likely N+1 loops) are logged as warnings.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        with track_queries(settings.query_budget) as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing", server_timing(stats, time.perf_counter() - start)
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status_code, stats, time.perf_counter() - start)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, stats: QueryStats, elapsed: float) -> None:
+        path = route_template(scope) or scope["path"]
+        request = f"{scope['method']} {path}"
+        fields = {
+            "method": scope["method"],
+            "path": path,
+            "status": status_code,
+            "queries": stats.count,
+            "db_ms": round(stats.duration * 1000, 2),
+            "duration_ms": round(elapsed * 1000, 2),
+        }
+        logger.info(
+            " ".join(f"{key}={value}" for key, value in fields.items()), extra=fields
+        )
+
+        if stats.over_budget:
+            logger.warning(
+                f"{request} ran {stats.count} queries, over the budget of {stats.budget}",
+                extra=fields,
+            )
+        for statement, count in stats.repeated_statements(settings.query_repeat_threshold):
+            logger.warning(
+                f"Possible N+1 in {request}: statement ran {count} times: {statement[:200]}",
+                extra=fields,
+            )
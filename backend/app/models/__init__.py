@@ -6,8 +6,11 @@ from app.models.watering import WateringSchedule, WateringLog
 from app.models.fertilization import FertilizationSchedule, FertilizationLog
 from app.models.treatment import Treatment, TreatmentApplication
 from app.models.photo import Photo
+from app.models.photo_job import PhotoJob
 from app.models.growth_log import GrowthLog
 from app.models.notification import Notification
+from app.models.notification_delivery import NotificationDelivery
+from app.models.job_run import JobRun
 
 __all__ = [
     "Location",
@@ -19,6 +22,9 @@ __all__ = [
     "Treatment",
     "TreatmentApplication",
     "Photo",
+    "PhotoJob",
     "GrowthLog",
     "Notification",
+    "NotificationDelivery",
+    "JobRun",
 ]
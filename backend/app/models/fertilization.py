@@ -50,7 +50,10 @@ class FertilizationLog(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     plant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("plants.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("plants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     fertilization_schedule_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,62 @@
+"""Job run model: the history of scheduled and manually triggered jobs."""
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import JSON, DateTime, Float, Index, Integer, String, Text, UUID, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class JobRunStatus(str, Enum):
+    """Job run status enumeration."""
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobTrigger(str, Enum):
+    """What started a job run."""
+
+    SCHEDULED = "scheduled"
+    MANUAL = "manual"
+
+
+class JobRun(Base):
+    """
+    A single run of a background job.
+
+    At most one run per job can be running at a time across the cluster: a
+    partial unique index rejects a second running row for the same job.
+    """
+
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        Index("ix_job_runs_job_id_started_at", "job_id", "started_at"),
+        Index(
+            "uq_job_runs_running_job_id",
+            "job_id",
+            unique=True,
+            postgresql_where=text("status = 'running'"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    job_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    trigger: Mapped[str] = mapped_column(String(20), nullable=False)  # scheduled/manual
+    status: Mapped[str] = mapped_column(
+        String(20), default=JobRunStatus.RUNNING.value, nullable=False
+    )  # running/succeeded/failed
+    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+    items_processed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    details: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<JobRun(id={self.id}, job_id={self.job_id}, status={self.status})>"
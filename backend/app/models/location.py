@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, Enum, String, Text
+from sqlalchemy import JSON, DateTime, Enum, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -34,6 +34,9 @@ class Location(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     zone: Mapped[str | None] = mapped_column(String(100), nullable=True)
     extra_data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # IANA timezone and local hour at which due-task reminders are sent
+    timezone: Mapped[str] = mapped_column(String(64), default="UTC", nullable=False)
+    reminder_hour: Mapped[int] = mapped_column(Integer, default=8, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
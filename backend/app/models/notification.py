@@ -4,7 +4,8 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, String, Text, Enum as SQLEnum
+from sqlalchemy import Boolean, DateTime, String, Text, Uuid, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -21,9 +22,17 @@ class NotificationType(str, Enum):
 
 
 class Notification(Base):
-    """Notification model for in-app notifications."""
+    """
+    Notification model for in-app notifications.
+
+    The table is range partitioned by month on ``created_at`` (partitions are
+    named ``notifications_YYYY_MM``), so retention drops whole partitions.
+    ``created_at`` is part of the primary key because Postgres requires the
+    partition key in every unique constraint.
+    """
 
     __tablename__ = "notifications"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     type: Mapped[NotificationType] = mapped_column(SQLEnum(NotificationType), nullable=False)
@@ -31,8 +40,13 @@ class Notification(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
     plant_id: Mapped[UUID] = mapped_column(nullable=True)  # Optional reference to plant
     plant_name: Mapped[str] = mapped_column(String(255), nullable=True)  # Denormalized for quick access
+    # Digest notifications group the plants of one location instead of naming a single plant
+    location_id: Mapped[UUID] = mapped_column(nullable=True)
+    plant_ids: Mapped[list[UUID]] = mapped_column(ARRAY(Uuid), nullable=True)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, default=datetime.utcnow, nullable=False
+    )
     read_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
     def __repr__(self) -> str:
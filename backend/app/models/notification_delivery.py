@@ -0,0 +1,62 @@
+"""Notification delivery model: the outbox for email and webhook channels."""
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class DeliveryChannel(str, Enum):
+    """Notification delivery channel enumeration."""
+
+    EMAIL = "email"
+    WEBHOOK = "webhook"
+
+
+class DeliveryStatus(str, Enum):
+    """Notification delivery status enumeration."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+class NotificationDelivery(Base):
+    """
+    A notification waiting to be sent to one channel target.
+
+    Rows are written in the same transaction as the notification (a
+    transactional outbox), claimed with ``FOR UPDATE SKIP LOCKED`` by the
+    delivery worker and deleted once sent. The notification is snapshotted in
+    ``payload`` because retention may drop it before delivery completes.
+    """
+
+    __tablename__ = "notification_deliveries"
+    __table_args__ = (
+        Index("ix_notification_deliveries_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    notification_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    channel: Mapped[str] = mapped_column(String(20), nullable=False)  # email/webhook
+    target: Mapped[str] = mapped_column(Text, nullable=False)  # recipients or webhook URL
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), default=DeliveryStatus.QUEUED.value, nullable=False
+    )  # queued/running/failed
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<NotificationDelivery(id={self.id}, channel={self.channel}, "
+            f"status={self.status})>"
+        )
@@ -1,9 +1,10 @@
 """Photo model for plant images."""
 import uuid
 from datetime import datetime
+from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, DateTime, Integer, Text, ForeignKey, UUID
+from sqlalchemy import String, DateTime, Float, Index, Integer, Text, ForeignKey, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -13,6 +14,15 @@ if TYPE_CHECKING:
     from app.models.growth_log import GrowthLog
 
 
+class PhotoProcessingStatus(str, Enum):
+    """Processing status of an uploaded photo."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    READY = "ready"
+    FAILED = "failed"
+
+
 class Photo(Base):
     """Photo model for storing plant images."""
 
@@ -24,8 +34,10 @@ class Photo(Base):
     plant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("plants.id", ondelete="CASCADE"), nullable=False
     )
-    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
-    thumbnail_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    thumbnail_path: Mapped[str | None] = mapped_column(String(500), nullable=True, index=True)
+    # Upright copy of the original, set when its EXIF orientation needed a rotation
+    upright_path: Mapped[str | None] = mapped_column(String(500), nullable=True, index=True)
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # in bytes
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -33,6 +45,11 @@ class Photo(Base):
     height: Mapped[int | None] = mapped_column(Integer, nullable=True)
     caption: Mapped[str | None] = mapped_column(Text, nullable=True)
     taken_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    processing_status: Mapped[str] = mapped_column(
+        String(20), default=PhotoProcessingStatus.PENDING.value, nullable=False
+    )  # pending/processing/ready/failed
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
@@ -43,3 +60,7 @@ class Photo(Base):
 
     def __repr__(self) -> str:
         return f"<Photo(id={self.id}, plant_id={self.plant_id}, filename={self.original_filename})>"
+
+
+# Date-ordered galleries: newest capture first, photos without a capture date last
+Index("ix_photos_plant_id_taken_at", Photo.plant_id, Photo.taken_at.desc().nulls_last())
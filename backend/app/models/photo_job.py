@@ -0,0 +1,56 @@
+"""Photo processing job model for the background work queue."""
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UUID, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PhotoJobStatus(str, Enum):
+    """Photo job status enumeration."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+class PhotoJob(Base):
+    """
+    Queued post-processing work for an uploaded photo.
+
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` so several workers can
+    drain the queue concurrently, and deleted once the work succeeds. A
+    partial unique index allows one queued or running job per photo.
+    """
+
+    __tablename__ = "photo_jobs"
+    __table_args__ = (
+        Index("ix_photo_jobs_status_run_after", "status", "run_after"),
+        Index(
+            "uq_photo_jobs_active_photo_id",
+            "photo_id",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    photo_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("photos.id", ondelete="CASCADE"), nullable=False
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), default=PhotoJobStatus.QUEUED.value, nullable=False
+    )  # queued/running/failed
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<PhotoJob(id={self.id}, photo_id={self.photo_id}, status={self.status})>"
@@ -33,7 +33,8 @@ class Plant(Base):
     category: Mapped[str] = mapped_column(String(50), nullable=False)  # flower/tree/grass/other
     species: Mapped[str | None] = mapped_column(String(100), nullable=True)
     location_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("locations.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=True), ForeignKey("locations.id", ondelete="SET NULL"), nullable=True,
+        index=True,
     )
     acquisition_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -48,7 +48,10 @@ class WateringLog(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     plant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("plants.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("plants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     watering_schedule_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
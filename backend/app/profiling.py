@@ -0,0 +1,242 @@
+"""
+Statistical profiling of single requests.
+
+The event loop is sampled with pyinstrument in async mode, so a profile only
+shows the profiled request's coroutines (time spent awaiting other work
+appears as ``await`` frames). Thread pools (sync dependencies, ``to_thread``
+file I/O) are sampled separately and added to speedscope profiles as one
+profile per pool. Requires the optional ``pyinstrument`` package.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from types import FrameType
+
+from app.config import settings
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+except ImportError:  # pragma: no cover - optional dependency
+    Profiler = None
+
+
+PROFILE_SUFFIX = ".speedscope.json"
+PROFILE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+# Innermost frames of threads waiting for work rather than running it
+_IDLE_FRAMES = {("thread.py", "_worker")}
+_WAIT_FILES = ("threading.py", "queue.py", "selectors.py")
+
+Frame = tuple[str, str, int]
+
+
+class ProfileFormat(str, Enum):
+    """How a profiled request is reported."""
+
+    SPEEDSCOPE = "speedscope"  # Saved to profiling_dir, id in the X-Profile-Id header
+    HTML = "html"  # Returned instead of the response body
+
+
+def profiling_available() -> bool:
+    """Check whether the profiler package is installed."""
+    return Profiler is not None
+
+
+def parse_profile_format(value: str | None) -> ProfileFormat | None:
+    """Map an ``X-Profile`` header or ``profile`` query value to a format."""
+    if not value:
+        return None
+    value = value.lower()
+    if value in ("1", "true", "yes"):
+        return ProfileFormat.SPEEDSCOPE
+    try:
+        return ProfileFormat(value)
+    except ValueError:
+        return None
+
+
+def new_profile_id(method: str, path: str) -> str:
+    """A sortable, filesystem-safe id such as ``20260101T120000-GET-api_v1_plants-1a2b3c4d``."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_")[:60] or "root"
+    return f"{datetime.utcnow():%Y%m%dT%H%M%S}-{method}-{slug}-{uuid.uuid4().hex[:8]}"
+
+
+def _stack(frame: FrameType | None) -> list[Frame]:
+    """Root-first list of (function, file, line) for a frame."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_qualname, code.co_filename, frame.f_lineno))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _is_idle(stack: list[Frame]) -> bool:
+    """Whether a thread is parked (waiting for work, a lock or I/O readiness)."""
+    if not stack:
+        return True
+    name, filename, _ = stack[-1]
+    return filename.endswith(_WAIT_FILES) or (Path(filename).name, name) in _IDLE_FRAMES
+
+
+class ThreadSampler:
+    """
+    Samples the busy threads of the process, other than the event loop.
+
+    Threads are not tied to a request, so work that other requests run in the
+    same pools during the profile is included too.
+    """
+
+    def __init__(self, interval: float, loop_thread_id: int):
+        self.interval = interval
+        self.loop_thread_id = loop_thread_id
+        self.samples: dict[str, list[tuple[list[Frame], float]]] = defaultdict(list)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler-thread-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in (own_id, self.loop_thread_id):
+                    continue
+                stack = _stack(frame)
+                if not _is_idle(stack):
+                    # Pool threads are named after their pool plus a counter
+                    pool = re.sub(r"[_\s-]*\d+$", "", names.get(thread_id, "thread"))
+                    self.samples[pool].append((stack, now - last))
+            last = now
+
+
+class RequestProfiler:
+    """Profiles the current request; only one request per process at a time."""
+
+    _lock = threading.Lock()
+
+    def __init__(self, interval: float):
+        self._profiler = Profiler(interval=interval, async_mode="enabled")
+        self._threads = ThreadSampler(interval, threading.get_ident())
+
+    @classmethod
+    def try_start(cls, interval: float) -> "RequestProfiler | None":
+        """Start profiling, or return None if another request is being profiled."""
+        if not cls._lock.acquire(blocking=False):
+            return None
+        try:
+            profiler = cls(interval)
+            profiler._profiler.start()
+            profiler._threads.start()
+        except BaseException:
+            cls._lock.release()
+            raise
+        return profiler
+
+    def stop(self) -> None:
+        try:
+            self._threads.stop()
+            self._profiler.stop()
+        finally:
+            self._lock.release()
+
+    def html(self) -> str:
+        return self._profiler.output(HTMLRenderer())
+
+    def speedscope(self, name: str) -> dict:
+        """Build a speedscope document: the event loop first, then one profile per thread pool."""
+        document = json.loads(self._profiler.output(SpeedscopeRenderer()))
+        document["name"] = name
+        document["profiles"][0]["name"] = "Event loop (this request)"
+        document["activeProfileIndex"] = 0
+
+        frames = document["shared"]["frames"]
+        frame_index = {(f["name"], f.get("file"), f.get("line")): i for i, f in enumerate(frames)}
+
+        def index_of(frame: Frame) -> int:
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+            return frame_index[frame]
+
+        for pool, samples in sorted(self._threads.samples.items()):
+            weights = [weight for _, weight in samples]
+            document["profiles"].append({
+                "type": "sampled",
+                "name": f"Threads: {pool}",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": [[index_of(frame) for frame in stack] for stack, _ in samples],
+                "weights": weights,
+            })
+        return document
+
+
+def _profile_dir() -> Path:
+    return Path(settings.profiling_dir)
+
+
+def _newest_first(directory: Path) -> list[Path]:
+    return sorted(
+        directory.glob(f"*{PROFILE_SUFFIX}"), key=lambda path: path.stat().st_mtime, reverse=True
+    )
+
+
+def save_profile(profile_id: str, document: dict) -> Path:
+    """Write a profile and drop the oldest ones beyond ``profiling_max_files``."""
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{profile_id}{PROFILE_SUFFIX}"
+    path.write_text(json.dumps(document))
+
+    for old in _newest_first(directory)[settings.profiling_max_files :]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+@dataclass
+class StoredProfile:
+    id: str
+    size: int
+    created_at: datetime
+
+
+def list_profiles() -> list[StoredProfile]:
+    """Saved profiles, newest first."""
+    profiles = []
+    for path in _newest_first(_profile_dir()):
+        stat = path.stat()
+        profiles.append(StoredProfile(
+            id=path.name.removesuffix(PROFILE_SUFFIX),
+            size=stat.st_size,
+            created_at=datetime.utcfromtimestamp(stat.st_mtime),
+        ))
+    return profiles
+
+
+def get_profile_path(profile_id: str) -> Path | None:
+    """Path of a saved profile, or None if there is none with this id."""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = _profile_dir() / f"{profile_id}{PROFILE_SUFFIX}"
+    return path if path.is_file() else None
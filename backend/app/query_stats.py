@@ -0,0 +1,123 @@
+"""
+Per-request (or per-job) SQL query counting.
+
+SQLAlchemy cursor events count every statement and its database time into
+the ``QueryStats`` of the current context, set with ``track_queries``. The
+same statement executed many times in one request usually means an N+1 loop.
+Process-wide totals are also exported as Prometheus metrics, slow
+statements are passed on to the slow query log, and statements run inside
+a trace get a span.
+"""
+
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from opentelemetry.trace import Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.metrics import DB_QUERIES, DB_QUERY_DURATION
+from app.slow_queries import slow_query_log
+from app.tracing import start_db_span
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised in strict mode when a request runs more queries than its budget."""
+
+
+@dataclass
+class QueryStats:
+    """Queries executed within a request or job."""
+
+    budget: int | None = None
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether more queries ran than the budget allows."""
+        return self.budget is not None and self.count > self.budget
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed more than ``threshold`` times, most repeated first."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(budget: int | None = None) -> Iterator[QueryStats]:
+    """Count the queries executed in this context (and tasks started from it)."""
+    stats = QueryStats(budget=budget)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _is_strict() -> bool:
+    return settings.query_budget_strict or settings.environment == "test"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    DB_QUERIES.inc()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.statements[statement] += 1
+        if stats.over_budget and _is_strict():
+            raise QueryBudgetExceededError(
+                f"Query budget of {stats.budget} exceeded by: {statement[:200]}"
+            )
+    conn.info.setdefault("query_starts", []).append(
+        (context, time.perf_counter(), start_db_span(statement))
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_starts")
+    if not starts:
+        return
+    _, start_time, span = starts.pop()
+    elapsed = time.perf_counter() - start_time
+    if span is not None:
+        span.end()
+    DB_QUERY_DURATION.inc(elapsed)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.duration += elapsed
+    slow_query_log.observe(statement, parameters, elapsed)
+
+
+def _handle_error(exception_context):
+    # A failed statement gets no after_cursor_execute; drop its start time. A
+    # statement refused before it started (over its query budget) pushed nothing.
+    starts = exception_context.connection and exception_context.connection.info.get(
+        "query_starts"
+    )
+    if starts and starts[-1][0] is exception_context.execution_context:
+        _, _, span = starts.pop()
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+
+def install_query_hooks() -> None:
+    """Listen to cursor events on every engine, including ones created later."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
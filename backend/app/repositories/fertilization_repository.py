@@ -2,11 +2,12 @@
 from datetime import date, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import Date, and_, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.fertilization import FertilizationSchedule, FertilizationLog
+from app.models.plant import Plant
 from app.schemas.fertilization import (
     FertilizationScheduleCreate,
     FertilizationScheduleUpdate,
@@ -179,20 +180,89 @@ class FertilizationRepository:
 
         return next_date
 
-    async def get_plants_due_for_fertilization(
-        self, days_ahead: int = 0
+    async def get_schedules_due_between(
+        self, start_date: date, end_date: date
     ) -> list[tuple[FertilizationSchedule, date]]:
-        """Get plants that are due for fertilization within the specified days ahead."""
-        active_schedules = await self.get_active_schedules()
-        due_plants = []
+        """
+        Get active schedules whose next fertilization date falls between the given dates.
+
+        Next dates are computed in a single query, as in ``get_plants_due_for_fertilization``.
+        """
+        today = date.today()
+        next_date = _next_date()
 
-        target_date = date.today() + timedelta(days=days_ahead)
+        result = await self.db.execute(
+            select(FertilizationSchedule, next_date)
+            .where(
+                FertilizationSchedule.is_active == True,  # noqa: E712
+                FertilizationSchedule.start_date <= today,
+                or_(
+                    FertilizationSchedule.end_date.is_(None),
+                    FertilizationSchedule.end_date >= today,
+                ),
+                next_date.between(start_date, end_date),
+                or_(FertilizationSchedule.end_date.is_(None), next_date <= FertilizationSchedule.end_date),
+            )
+            .order_by(next_date)
+        )
+        return [(schedule, due_date) for schedule, due_date in result.all()]
 
-        for schedule in active_schedules:
-            next_date = await self.calculate_next_fertilization_date(schedule)
-            if next_date and next_date <= target_date:
-                due_plants.append((schedule, next_date))
+    async def get_plants_due_for_fertilization(
+        self,
+        days_ahead: int = 0,
+        today: date | None = None,
+        location_ids: list[UUID] | None = None,
+        include_unlocated: bool = False,
+    ) -> list[tuple[FertilizationSchedule, date]]:
+        """
+        Get plants that are due for fertilization within the specified days ahead.
+
+        Next dates are computed in a single query from each plant's latest log.
+        ``today`` defaults to the server date; pass the local date when checking
+        plants in another timezone. When ``location_ids`` is given, only plants
+        in those locations (and plants without a location if
+        ``include_unlocated``) are checked.
+        """
+        today = today or date.today()
+        target_date = today + timedelta(days=days_ahead)
+
+        next_date = _next_date()
+
+        query = (
+            select(FertilizationSchedule, next_date)
+            .options(selectinload(FertilizationSchedule.plant))
+            .where(
+                FertilizationSchedule.is_active == True,  # noqa: E712
+                FertilizationSchedule.start_date <= today,
+                or_(
+                    FertilizationSchedule.end_date.is_(None),
+                    FertilizationSchedule.end_date >= today,
+                ),
+                next_date <= target_date,
+                or_(FertilizationSchedule.end_date.is_(None), next_date <= FertilizationSchedule.end_date),
+            )
+            .order_by(next_date)
+        )
+        if location_ids is not None:
+            in_locations = Plant.location_id.in_(location_ids)
+            query = query.join(Plant, Plant.id == FertilizationSchedule.plant_id).where(
+                or_(in_locations, Plant.location_id.is_(None))
+                if include_unlocated
+                else in_locations
+            )
 
-        # Sort by next fertilization date
-        due_plants.sort(key=lambda x: x[1])
-        return due_plants
+        result = await self.db.execute(query)
+        return [(schedule, due_date) for schedule, due_date in result.all()]
+
+
+def _next_date():
+    """The next fertilization date of a schedule: a frequency after the latest log, or the start date."""
+    last_fertilization = (
+        select(func.max(FertilizationLog.fertilized_at))
+        .where(FertilizationLog.plant_id == FertilizationSchedule.plant_id)
+        .scalar_subquery()
+    )
+    return (
+        func.coalesce(cast(last_fertilization, Date), FertilizationSchedule.start_date)
+        + FertilizationSchedule.frequency_days
+    ).label("next_date")
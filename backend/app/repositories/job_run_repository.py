@@ -0,0 +1,158 @@
+"""Repository for background job run history."""
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import Date, cast, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job_run import JobRun, JobRunStatus
+
+
+class JobRunRepository:
+    """Repository for job run operations."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the repository."""
+        self.db = db
+
+    async def start(self, job_id: str, trigger: str, stale_after: timedelta) -> JobRun | None:
+        """
+        Record the start of a run.
+
+        Returns None if the job is already running anywhere in the cluster.
+        Runs left running longer than ``stale_after`` belong to a process that
+        died; they are marked failed first so they do not block the job forever.
+        """
+        now = datetime.utcnow()
+        await self.db.execute(
+            update(JobRun)
+            .where(
+                JobRun.job_id == job_id,
+                JobRun.status == JobRunStatus.RUNNING.value,
+                JobRun.started_at < now - stale_after,
+            )
+            .values(
+                status=JobRunStatus.FAILED.value,
+                finished_at=now,
+                error="Abandoned: the process running the job stopped",
+            )
+        )
+        await self.db.commit()
+
+        run = JobRun(job_id=job_id, trigger=trigger, started_at=now)
+        self.db.add(run)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # The partial unique index allows a single running row per job
+            await self.db.rollback()
+            return None
+        return run
+
+    async def _finish(self, run_id: UUID, **values) -> JobRun | None:
+        now = datetime.utcnow()
+        result = await self.db.scalars(
+            update(JobRun)
+            .where(JobRun.id == run_id)
+            .values(
+                finished_at=now,
+                duration_seconds=func.extract("epoch", now - JobRun.started_at),
+                **values,
+            )
+            .returning(JobRun)
+            .execution_options(synchronize_session=False)
+        )
+        run = result.one_or_none()
+        await self.db.commit()
+        return run
+
+    async def succeed(
+        self, run_id: UUID, items_processed: int | None, details: dict | None = None
+    ) -> JobRun | None:
+        """Record a successful run."""
+        return await self._finish(
+            run_id,
+            status=JobRunStatus.SUCCEEDED.value,
+            items_processed=items_processed,
+            details=details,
+        )
+
+    async def fail(self, run_id: UUID, error: str) -> JobRun | None:
+        """Record a failed run."""
+        return await self._finish(run_id, status=JobRunStatus.FAILED.value, error=error)
+
+    async def get_runs(
+        self,
+        job_id: str | None = None,
+        status: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[JobRun]:
+        """Get runs, most recent first."""
+        query = select(JobRun).order_by(JobRun.started_at.desc()).offset(skip).limit(limit)
+        if job_id:
+            query = query.where(JobRun.job_id == job_id)
+        if status:
+            query = query.where(JobRun.status == status)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_latest_runs(self) -> dict[str, JobRun]:
+        """Get the most recent run of every job, keyed by job id."""
+        result = await self.db.execute(
+            select(JobRun)
+            .distinct(JobRun.job_id)
+            .order_by(JobRun.job_id, JobRun.started_at.desc())
+        )
+        return {run.job_id: run for run in result.scalars().all()}
+
+    async def get_duration_histogram(
+        self, job_id: str, since: datetime, bounds: list[float]
+    ) -> tuple[list[int], int, float]:
+        """
+        Count finished runs per duration bucket in one query.
+
+        Returns cumulative counts for each upper bound in ``bounds`` (like a
+        Prometheus histogram), the total count and the total duration.
+        """
+        duration = JobRun.duration_seconds
+        result = await self.db.execute(
+            select(
+                *(func.count().filter(duration <= bound) for bound in bounds),
+                func.count(),
+                func.coalesce(func.sum(duration), 0.0),
+            ).where(
+                JobRun.job_id == job_id,
+                JobRun.started_at >= since,
+                duration.is_not(None),
+            )
+        )
+        *buckets, count, total = result.one()
+        return list(buckets), count, float(total)
+
+    async def get_daily_durations(
+        self, job_id: str, since: datetime
+    ) -> list[tuple[date, int, float, float, float | None]]:
+        """Get the run count, mean and max duration and mean items processed per day."""
+        day = cast(JobRun.started_at, Date)
+        result = await self.db.execute(
+            select(
+                day,
+                func.count(),
+                func.avg(JobRun.duration_seconds),
+                func.max(JobRun.duration_seconds),
+                func.avg(JobRun.items_processed),
+            )
+            .where(
+                JobRun.job_id == job_id,
+                JobRun.started_at >= since,
+                JobRun.duration_seconds.is_not(None),
+            )
+            .group_by(day)
+            .order_by(day)
+        )
+        return [
+            (run_date, runs, float(mean), float(maximum), float(items) if items is not None else None)
+            for run_date, runs, mean, maximum, items in result.all()
+        ]
@@ -20,6 +20,18 @@ class LocationRepository:
         result = await self.db.execute(select(Location).order_by(Location.name))
         return list(result.scalars().all())
 
+    async def get_all_with_plant_counts(self) -> list[tuple[Location, int]]:
+        """Get all locations with the number of plants in each."""
+        from app.models.plant import Plant
+
+        result = await self.db.execute(
+            select(Location, func.count(Plant.id))
+            .outerjoin(Plant, Plant.location_id == Location.id)
+            .group_by(Location.id)
+            .order_by(Location.name)
+        )
+        return [(location, plants_count) for location, plants_count in result.all()]
+
     async def get_by_id(self, location_id: UUID) -> Location | None:
         """Get location by ID."""
         result = await self.db.execute(select(Location).where(Location.id == location_id))
@@ -72,3 +84,10 @@ class LocationRepository:
             select(func.count()).select_from(Plant).where(Plant.location_id == location_id)
         )
         return result.scalar_one()
+
+    async def get_reminder_times(self) -> list[tuple[UUID, str, int]]:
+        """Get the id, timezone and reminder hour of every location."""
+        result = await self.db.execute(
+            select(Location.id, Location.timezone, Location.reminder_hour)
+        )
+        return [tuple(row) for row in result.all()]
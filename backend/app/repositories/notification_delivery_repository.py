@@ -0,0 +1,137 @@
+"""Repository for the notification delivery outbox."""
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification_delivery import DeliveryStatus, NotificationDelivery
+
+
+class NotificationDeliveryRepository:
+    """Repository for notification delivery queue operations."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the repository."""
+        self.db = db
+
+    async def enqueue(self, deliveries: list[dict]) -> None:
+        """Queue deliveries (``notification_id``, ``channel``, ``target``, ``payload``). The caller commits."""
+        if deliveries:
+            await self.db.execute(insert(NotificationDelivery), deliveries)
+
+    async def claim_batch(
+        self, limit: int, lock_timeout: timedelta, max_attempts: int
+    ) -> list[NotificationDelivery]:
+        """
+        Claim up to ``limit`` runnable deliveries, oldest first.
+
+        Uses ``FOR UPDATE SKIP LOCKED`` so concurrent workers never claim the
+        same delivery. Deliveries left running longer than ``lock_timeout``
+        belong to a worker that died and are claimed again, unless that was
+        their last attempt, in which case they are marked failed.
+        """
+        now = datetime.utcnow()
+        await self.db.execute(
+            update(NotificationDelivery)
+            .where(
+                NotificationDelivery.status == DeliveryStatus.RUNNING.value,
+                NotificationDelivery.locked_at < now - lock_timeout,
+                NotificationDelivery.attempts >= max_attempts,
+            )
+            .values(
+                status=DeliveryStatus.FAILED.value,
+                locked_at=None,
+                last_error=f"Not finished after {max_attempts} attempts",
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        claimable = (
+            select(NotificationDelivery.id)
+            .where(
+                or_(
+                    and_(
+                        NotificationDelivery.status == DeliveryStatus.QUEUED.value,
+                        NotificationDelivery.run_after <= now,
+                    ),
+                    and_(
+                        NotificationDelivery.status == DeliveryStatus.RUNNING.value,
+                        NotificationDelivery.locked_at < now - lock_timeout,
+                        NotificationDelivery.attempts < max_attempts,
+                    ),
+                )
+            )
+            .order_by(NotificationDelivery.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.scalars(
+            update(NotificationDelivery)
+            .where(NotificationDelivery.id.in_(claimable.scalar_subquery()))
+            .values(
+                status=DeliveryStatus.RUNNING.value,
+                attempts=NotificationDelivery.attempts + 1,
+                locked_at=now,
+            )
+            .returning(NotificationDelivery)
+            .execution_options(synchronize_session=False)
+        )
+        deliveries = list(result.all())
+        await self.db.commit()
+        return deliveries
+
+    async def complete(self, delivery_ids: list[UUID]) -> None:
+        """Remove deliveries that were sent. The caller commits."""
+        await self.db.execute(
+            delete(NotificationDelivery).where(NotificationDelivery.id.in_(delivery_ids))
+        )
+
+    async def retry_later(self, delivery_id: UUID, run_after: datetime, error: str) -> None:
+        """Put a failed delivery back in the queue. The caller commits."""
+        await self.db.execute(
+            update(NotificationDelivery)
+            .where(NotificationDelivery.id == delivery_id)
+            .values(
+                status=DeliveryStatus.QUEUED.value,
+                run_after=run_after,
+                locked_at=None,
+                last_error=error,
+            )
+        )
+
+    async def delete_failed(self, before: datetime, batch_size: int) -> int:
+        """
+        Delete failed deliveries created before ``before``.
+
+        Rows are deleted in batches of ``batch_size``, each in its own
+        transaction, so a large cleanup never holds locks for long.
+        """
+        batch = (
+            select(NotificationDelivery.id)
+            .where(
+                NotificationDelivery.status == DeliveryStatus.FAILED.value,
+                NotificationDelivery.created_at < before,
+            )
+            .limit(batch_size)
+        )
+
+        count = 0
+        while True:
+            result = await self.db.execute(
+                delete(NotificationDelivery).where(
+                    NotificationDelivery.id.in_(batch.scalar_subquery())
+                )
+            )
+            await self.db.commit()
+            count += result.rowcount
+            if result.rowcount < batch_size:
+                return count
+
+    async def fail(self, delivery_id: UUID, error: str) -> None:
+        """Mark a delivery as permanently failed. The caller commits."""
+        await self.db.execute(
+            update(NotificationDelivery)
+            .where(NotificationDelivery.id == delivery_id)
+            .values(status=DeliveryStatus.FAILED.value, locked_at=None, last_error=error)
+        )
@@ -1,13 +1,19 @@
 """Notification repository for database operations."""
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.notification import Notification
-from app.schemas.notification import NotificationCreate
+from app.delivery import get_delivery_targets
+from app.events import publish_notification_event
+from app.models.notification import Notification, NotificationType
+from app.repositories.notification_delivery_repository import NotificationDeliveryRepository
+from app.schemas.notification import NotificationCreate, NotificationResponse
+
+PARTITION_NAME_FORMAT = f"{Notification.__tablename__}_%Y_%m"
+DEFAULT_PARTITION = f"{Notification.__tablename__}_default"
 
 
 class NotificationRepository:
@@ -20,10 +26,61 @@ class NotificationRepository:
         """Create a new notification."""
         notification = Notification(**notification_data.model_dump())
         self.db.add(notification)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(notification)
+        await self._publish("notification.created", notification)
+        await self._enqueue_deliveries([notification])
+        await self.db.commit()
         return notification
 
+    async def create_many(self, notifications_data: list[NotificationCreate]) -> list[Notification]:
+        """Create several notifications in one transaction."""
+        notifications = [Notification(**data.model_dump()) for data in notifications_data]
+        if not notifications:
+            return []
+
+        self.db.add_all(notifications)
+        await self.db.flush()
+        await self._publish("notifications.created", count=len(notifications))
+        await self._enqueue_deliveries(notifications)
+        await self.db.commit()
+        return notifications
+
+    async def _enqueue_deliveries(self, notifications: list[Notification]) -> None:
+        """Queue new notifications for every delivery channel, in the same transaction."""
+        targets = get_delivery_targets()
+        if not targets:
+            return
+
+        await NotificationDeliveryRepository(self.db).enqueue(
+            [
+                {
+                    "notification_id": notification.id,
+                    "channel": channel,
+                    "target": target,
+                    "payload": _serialize(notification),
+                }
+                for notification in notifications
+                for channel, target in targets
+            ]
+        )
+
+    async def _publish(
+        self, event: str, notification: Notification | None = None, **fields
+    ) -> None:
+        """
+        Publish a change event, delivered to stream subscribers on commit.
+
+        Events carry the unread count and the notification's id and type, not
+        the notification itself: NOTIFY payloads are limited to 8000 bytes,
+        which a digest's plant ids alone can exceed. Clients fetch what they show.
+        """
+        payload = {"event": event, "unread": await self.get_unread_count(), **fields}
+        if notification is not None:
+            payload["notification_id"] = str(notification.id)
+            payload["type"] = NotificationType(notification.type).value
+        await publish_notification_event(self.db, payload)
+
     async def get_by_id(self, notification_id: UUID) -> Notification | None:
         """Get a notification by ID."""
         query = select(Notification).where(Notification.id == notification_id)
@@ -50,60 +107,182 @@ class NotificationRepository:
         if notification:
             notification.is_read = True
             notification.read_at = datetime.utcnow()
+            await self.db.flush()
+            await self._publish("notification.read", notification)
             await self.db.commit()
             await self.db.refresh(notification)
         return notification
 
     async def mark_all_as_read(self) -> int:
-        """Mark all notifications as read."""
-        query = select(Notification).where(Notification.is_read == False)
-        result = await self.db.execute(query)
-        notifications = result.scalars().all()
-
-        count = 0
-        for notification in notifications:
-            notification.is_read = True
-            notification.read_at = datetime.utcnow()
-            count += 1
+        """Mark all notifications as read with a single UPDATE."""
+        result = await self.db.execute(
+            update(Notification)
+            .where(Notification.is_read == False)
+            .values(is_read=True, read_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        count = result.rowcount
 
         if count > 0:
+            await self._publish("notifications.read_all")
             await self.db.commit()
 
         return count
 
+    async def get_notified_plants_since(self, since: datetime) -> set[tuple[str, UUID]]:
+        """Get the ``(type, plant_id)`` pairs notified since ``since``, including digests."""
+        query = select(
+            Notification.type, Notification.plant_id, Notification.plant_ids
+        ).where(Notification.created_at >= since)
+        result = await self.db.execute(query)
+
+        notified = set()
+        for type_, plant_id, plant_ids in result.all():
+            for notified_plant_id in plant_ids or [plant_id]:
+                notified.add((type_.value, notified_plant_id))
+        return notified
+
     async def get_unread_count(self) -> int:
         """Get count of unread notifications."""
         query = select(func.count(Notification.id)).where(Notification.is_read == False)
         result = await self.db.execute(query)
         return result.scalar() or 0
 
+    async def get_counts_by_type(self) -> dict[str, tuple[int, int]]:
+        """Get ``(total, unread)`` counts per notification type in a single query."""
+        query = select(
+            Notification.type,
+            func.count(),
+            func.count().filter(Notification.is_read == False),
+        ).group_by(Notification.type)
+        result = await self.db.execute(query)
+        return {type_.value: (total, unread) for type_, total, unread in result.all()}
+
     async def delete(self, notification_id: UUID) -> bool:
         """Delete a notification."""
         notification = await self.get_by_id(notification_id)
         if notification:
             await self.db.delete(notification)
+            await self.db.flush()
+            await self._publish("notification.deleted", notification)
             await self.db.commit()
             return True
         return False
 
-    async def delete_old_read_notifications(self, days: int = 30) -> int:
-        """Delete read notifications older than specified days."""
-        from datetime import timedelta
+    async def get_partitions(self) -> dict[str, date]:
+        """Get the monthly partitions of the table, mapped to the month they hold."""
+        result = await self.db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"
+            ),
+            {"parent": Notification.__tablename__},
+        )
+        partitions = {}
+        for name in result.scalars():
+            try:
+                partitions[name] = datetime.strptime(name, PARTITION_NAME_FORMAT).date()
+            except ValueError:
+                continue  # The default partition
+        return partitions
+
+    async def ensure_partitions(self, months_ahead: int) -> list[str]:
+        """
+        Create the partitions for this month and the next ``months_ahead`` months.
+
+        Each month is created in its own transaction, so a failure leaves the
+        months created before it in place.
+        """
+        existing = await self.get_partitions()
+        # Months follow created_at, which is stored in UTC
+        this_month = datetime.utcnow().date().replace(day=1)
 
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        created = []
+        for offset in range(months_ahead + 1):
+            month = _add_months(this_month, offset)
+            name = month.strftime(PARTITION_NAME_FORMAT)
+            if name in existing:
+                continue
+            try:
+                await self._create_partition(name, month)
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                raise
+            created.append(name)
 
-        query = select(Notification).where(
-            and_(Notification.is_read == True, Notification.read_at < cutoff_date)
+        return created
+
+    async def _create_partition(self, name: str, month: date) -> None:
+        """
+        Create the partition for ``month``, moving its rows out of the default partition.
+
+        Postgres refuses to create a partition while the default partition
+        holds rows in its range (notifications written before the month's
+        partition existed), so the default is detached, emptied of that range
+        into the new partition, and attached again.
+        """
+        parent = Notification.__tablename__
+        # DDL takes no bind parameters; the name and bounds are generated by the caller
+        start, end = month.isoformat(), _add_months(month, 1).isoformat()
+        await self.db.execute(text(f"ALTER TABLE {parent} DETACH PARTITION {DEFAULT_PARTITION}"))
+        await self.db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {parent} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        )
+        await self.db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE created_at >= '{start}' AND created_at < '{end}' RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            )
+        )
+        await self.db.execute(
+            text(f"ALTER TABLE {parent} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
         )
 
-        result = await self.db.execute(query)
-        notifications = result.scalars().all()
+    async def drop_expired_partitions(
+        self, retention_months: int, batch_size: int = 1000
+    ) -> list[str]:
+        """
+        Drop the partitions whose whole month is older than ``retention_months``.
 
-        count = len(notifications)
-        for notification in notifications:
-            await self.db.delete(notification)
+        Dropping a partition removes its notifications without scanning or
+        deleting rows. Stray rows in the default partition are deleted in
+        batches of ``batch_size``, each in its own transaction, so a large
+        cleanup never holds locks for long.
+        """
+        cutoff = _add_months(datetime.utcnow().date().replace(day=1), -retention_months)
 
-        if count > 0:
+        dropped = []
+        for name, month in sorted((await self.get_partitions()).items()):
+            if _add_months(month, 1) <= cutoff:
+                await self.db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+        await self.db.commit()
+
+        # ctid is only unique within one partition, so the default partition is named
+        batch = text(
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE ctid IN ("
+            f"SELECT ctid FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff LIMIT :limit)"
+        )
+        params = {"cutoff": datetime.combine(cutoff, datetime.min.time()), "limit": batch_size}
+        while True:
+            result = await self.db.execute(batch, params)
             await self.db.commit()
+            if result.rowcount < batch_size:
+                return dropped
 
-        return count
+
+def _serialize(notification: Notification) -> dict:
+    """Convert a notification to its JSON API representation."""
+    return NotificationResponse.model_validate(notification).model_dump(mode="json")
+
+
+def _add_months(month: date, months: int) -> date:
+    """Get the first day of the month ``months`` after ``month``."""
+    years, month_index = divmod(month.month - 1 + months, 12)
+    return date(month.year + years, month_index + 1, 1)
@@ -0,0 +1,147 @@
+"""Repository for photo processing jobs."""
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import and_, delete, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.photo import Photo, PhotoProcessingStatus
+from app.models.photo_job import PhotoJob, PhotoJobStatus
+
+
+class PhotoJobRepository:
+    """Repository for photo job queue operations."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the repository."""
+        self.db = db
+
+    async def enqueue(self, photo_ids: list[UUID]) -> int:
+        """
+        Queue processing jobs for photos. The caller commits.
+
+        Photos that already have a queued or running job are skipped. Returns
+        the number of jobs queued.
+        """
+        if not photo_ids:
+            return 0
+        result = await self.db.execute(
+            insert(PhotoJob)
+            .values([{"photo_id": photo_id} for photo_id in photo_ids])
+            .on_conflict_do_nothing(
+                index_elements=[PhotoJob.photo_id],
+                index_where=text("status IN ('queued', 'running')"),
+            )
+        )
+        return result.rowcount
+
+    async def get_latest_by_photo_id(self, photo_id: UUID) -> PhotoJob | None:
+        """Get the most recent job for a photo."""
+        result = await self.db.execute(
+            select(PhotoJob)
+            .where(PhotoJob.photo_id == photo_id)
+            .order_by(PhotoJob.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def claim_batch(
+        self, limit: int, lock_timeout: timedelta, max_attempts: int
+    ) -> list[PhotoJob]:
+        """
+        Claim up to ``limit`` runnable jobs.
+
+        Uses ``FOR UPDATE SKIP LOCKED`` so concurrent workers never claim the
+        same job. Jobs left running longer than ``lock_timeout`` belong to a
+        worker that died and are claimed again, unless that was their last
+        attempt, in which case they and their photos are marked failed.
+        """
+        now = datetime.utcnow()
+        await self._fail_abandoned(now - lock_timeout, max_attempts)
+
+        claimable = (
+            select(PhotoJob.id)
+            .where(
+                or_(
+                    and_(
+                        PhotoJob.status == PhotoJobStatus.QUEUED.value,
+                        PhotoJob.run_after <= now,
+                    ),
+                    and_(
+                        PhotoJob.status == PhotoJobStatus.RUNNING.value,
+                        PhotoJob.locked_at < now - lock_timeout,
+                        PhotoJob.attempts < max_attempts,
+                    ),
+                )
+            )
+            .order_by(PhotoJob.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.scalars(
+            update(PhotoJob)
+            .where(PhotoJob.id.in_(claimable.scalar_subquery()))
+            .values(
+                status=PhotoJobStatus.RUNNING.value,
+                attempts=PhotoJob.attempts + 1,
+                locked_at=now,
+            )
+            .returning(PhotoJob)
+            .execution_options(synchronize_session=False)
+        )
+        jobs = list(result.all())
+        await self.db.commit()
+        return jobs
+
+    async def _fail_abandoned(self, locked_before: datetime, max_attempts: int) -> None:
+        """Fail jobs whose worker died during their last attempt, along with their photos."""
+        photo_ids = (
+            await self.db.scalars(
+                update(PhotoJob)
+                .where(
+                    PhotoJob.status == PhotoJobStatus.RUNNING.value,
+                    PhotoJob.locked_at < locked_before,
+                    PhotoJob.attempts >= max_attempts,
+                )
+                .values(
+                    status=PhotoJobStatus.FAILED.value,
+                    locked_at=None,
+                    last_error=f"Not finished after {max_attempts} attempts",
+                )
+                .returning(PhotoJob.photo_id)
+                .execution_options(synchronize_session=False)
+            )
+        ).all()
+        if photo_ids:
+            await self.db.execute(
+                update(Photo)
+                .where(Photo.id.in_(photo_ids))
+                .values(processing_status=PhotoProcessingStatus.FAILED.value)
+                .execution_options(synchronize_session=False)
+            )
+
+    async def complete(self, job_id: UUID) -> None:
+        """Remove a job that finished successfully. The caller commits."""
+        await self.db.execute(delete(PhotoJob).where(PhotoJob.id == job_id))
+
+    async def retry_later(self, job_id: UUID, run_after: datetime, error: str) -> None:
+        """Put a failed job back in the queue. The caller commits."""
+        await self.db.execute(
+            update(PhotoJob)
+            .where(PhotoJob.id == job_id)
+            .values(
+                status=PhotoJobStatus.QUEUED.value,
+                run_after=run_after,
+                locked_at=None,
+                last_error=error,
+            )
+        )
+
+    async def fail(self, job_id: UUID, error: str) -> None:
+        """Mark a job as permanently failed. The caller commits."""
+        await self.db.execute(
+            update(PhotoJob)
+            .where(PhotoJob.id == job_id)
+            .values(status=PhotoJobStatus.FAILED.value, locked_at=None, last_error=error)
+        )
@@ -1,7 +1,9 @@
 """Repository for photo operations."""
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, insert, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.photo import Photo
@@ -21,12 +23,59 @@ class PhotoRepository:
         return result.scalar_one_or_none()
 
     async def get_by_plant_id(self, plant_id: UUID) -> list[Photo]:
-        """Get all photos for a plant."""
+        """Get all photos for a plant, newest capture date first."""
         result = await self.db.execute(
-            select(Photo).where(Photo.plant_id == plant_id).order_by(Photo.created_at.desc())
+            select(Photo)
+            .where(Photo.plant_id == plant_id)
+            .order_by(Photo.taken_at.desc().nulls_last(), Photo.created_at.desc())
         )
         return list(result.scalars().all())
 
+    async def get_ids_batch(
+        self, after_id: UUID | None, limit: int, missing_taken_at_only: bool = True
+    ) -> list[UUID]:
+        """Get the next batch of photo IDs in ID order (keyset pagination)."""
+        query = select(Photo.id).order_by(Photo.id).limit(limit)
+        if after_id is not None:
+            query = query.where(Photo.id > after_id)
+        if missing_taken_at_only:
+            query = query.where(Photo.taken_at.is_(None))
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_referenced_paths(self, keys: list[str]) -> set[str]:
+        """Get which of the given storage keys are referenced by a photo."""
+        if not keys:
+            return set()
+        result = await self.db.execute(
+            union(
+                select(Photo.file_path).where(Photo.file_path.in_(keys)),
+                select(Photo.upright_path).where(Photo.upright_path.in_(keys)),
+                select(Photo.thumbnail_path).where(Photo.thumbnail_path.in_(keys)),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def stream_storage_rows(self, batch_size: int) -> AsyncIterator[list[Row]]:
+        """
+        Stream the storage columns of every photo in batches.
+
+        Uses a server-side cursor, so the session cannot run other queries
+        until iteration finishes.
+        """
+        result = await self.db.stream(
+            select(
+                Photo.id,
+                Photo.plant_id,
+                Photo.file_path,
+                Photo.upright_path,
+                Photo.thumbnail_path,
+                Photo.file_size,
+            ).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions(batch_size):
+            yield list(partition)
+
     async def create(
         self,
         plant_id: UUID,
@@ -38,9 +87,9 @@ class PhotoRepository:
         width: int | None,
         height: int | None,
         caption: str | None = None,
-        taken_at=None,
+        taken_at: datetime | None = None,
     ) -> Photo:
-        """Create a new photo record."""
+        """Create a new photo record. The caller commits."""
         photo = Photo(
             plant_id=plant_id,
             file_path=file_path,
@@ -54,10 +103,17 @@ class PhotoRepository:
             taken_at=taken_at,
         )
         self.db.add(photo)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(photo)
         return photo
 
+    async def create_many(self, photos: list[dict]) -> list[Photo]:
+        """Create several photo records with a single INSERT statement. The caller commits."""
+        result = await self.db.scalars(
+            insert(Photo).returning(Photo, sort_by_parameter_order=True), photos
+        )
+        return list(result.all())
+
     async def update(self, photo_id: UUID, photo_data: PhotoUpdate) -> Photo | None:
         """Update a photo."""
         photo = await self.get_by_id(photo_id)
@@ -45,6 +45,14 @@ class PlantRepository:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, plant_ids: list[UUID]) -> list[Plant]:
+        """Get the plants with the given IDs, skipping any that no longer exist."""
+        if not plant_ids:
+            return []
+        query = select(Plant).options(joinedload(Plant.location)).filter(Plant.id.in_(plant_ids))
+        result = await self.db.execute(query)
+        return list(result.scalars().unique().all())
+
     async def get_by_location(self, location_id: UUID) -> list[Plant]:
         """Get all plants in a specific location."""
         query = (
@@ -2,10 +2,11 @@
 from datetime import date, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import Date, and_, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.plant import Plant
 from app.models.watering import WateringSchedule, WateringLog
 from app.schemas.watering import (
     WateringScheduleCreate,
@@ -171,20 +172,89 @@ class WateringRepository:
 
         return next_date
 
-    async def get_plants_due_for_watering(
-        self, days_ahead: int = 0
+    async def get_schedules_due_between(
+        self, start_date: date, end_date: date
     ) -> list[tuple[WateringSchedule, date]]:
-        """Get plants that are due for watering within the specified days ahead."""
-        active_schedules = await self.get_active_schedules()
-        due_plants = []
+        """
+        Get active schedules whose next watering date falls between the given dates.
+
+        Next dates are computed in a single query, as in ``get_plants_due_for_watering``.
+        """
+        today = date.today()
+        next_date = _next_date()
 
-        target_date = date.today() + timedelta(days=days_ahead)
+        result = await self.db.execute(
+            select(WateringSchedule, next_date)
+            .where(
+                WateringSchedule.is_active == True,  # noqa: E712
+                WateringSchedule.start_date <= today,
+                or_(
+                    WateringSchedule.end_date.is_(None),
+                    WateringSchedule.end_date >= today,
+                ),
+                next_date.between(start_date, end_date),
+                or_(WateringSchedule.end_date.is_(None), next_date <= WateringSchedule.end_date),
+            )
+            .order_by(next_date)
+        )
+        return [(schedule, due_date) for schedule, due_date in result.all()]
 
-        for schedule in active_schedules:
-            next_date = await self.calculate_next_watering_date(schedule)
-            if next_date and next_date <= target_date:
-                due_plants.append((schedule, next_date))
+    async def get_plants_due_for_watering(
+        self,
+        days_ahead: int = 0,
+        today: date | None = None,
+        location_ids: list[UUID] | None = None,
+        include_unlocated: bool = False,
+    ) -> list[tuple[WateringSchedule, date]]:
+        """
+        Get plants that are due for watering within the specified days ahead.
+
+        Next dates are computed in a single query from each plant's latest log.
+        ``today`` defaults to the server date; pass the local date when checking
+        plants in another timezone. When ``location_ids`` is given, only plants
+        in those locations (and plants without a location if
+        ``include_unlocated``) are checked.
+        """
+        today = today or date.today()
+        target_date = today + timedelta(days=days_ahead)
+
+        next_date = _next_date()
+
+        query = (
+            select(WateringSchedule, next_date)
+            .options(selectinload(WateringSchedule.plant))
+            .where(
+                WateringSchedule.is_active == True,  # noqa: E712
+                WateringSchedule.start_date <= today,
+                or_(
+                    WateringSchedule.end_date.is_(None),
+                    WateringSchedule.end_date >= today,
+                ),
+                next_date <= target_date,
+                or_(WateringSchedule.end_date.is_(None), next_date <= WateringSchedule.end_date),
+            )
+            .order_by(next_date)
+        )
+        if location_ids is not None:
+            in_locations = Plant.location_id.in_(location_ids)
+            query = query.join(Plant, Plant.id == WateringSchedule.plant_id).where(
+                or_(in_locations, Plant.location_id.is_(None))
+                if include_unlocated
+                else in_locations
+            )
 
-        # Sort by next watering date
-        due_plants.sort(key=lambda x: x[1])
-        return due_plants
+        result = await self.db.execute(query)
+        return [(schedule, due_date) for schedule, due_date in result.all()]
+
+
+def _next_date():
+    """The next watering date of a schedule: a frequency after the latest log, or the start date."""
+    last_watering = (
+        select(func.max(WateringLog.watered_at))
+        .where(WateringLog.plant_id == WateringSchedule.plant_id)
+        .scalar_subquery()
+    )
+    return (
+        func.coalesce(cast(last_watering, Date), WateringSchedule.start_date)
+        + WateringSchedule.frequency_days
+    ).label("next_date")
@@ -0,0 +1,211 @@
+"""
+Short-lived caches of serialized, precompressed responses.
+
+For hot read endpoints whose payload is the same for every caller (the
+dashboard), the JSON body is kept for ``response_cache_seconds`` along with
+its brotli and gzip versions, each compressed once on first use, so a hit
+costs no queries, serialization or compression. Commits that change a table
+a cache depends on, through the unit of work or a bulk insert, update or
+delete, clear that cache in this process, and in every other process through
+an event on the notification channel.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.compression import PRECOMPRESSED_LEVELS, Encoding, compress, negotiate
+from app.config import settings
+from app.events import notification_broadcaster, notify_statement
+from app.metrics import record_cache_lookup, record_compression
+from app.responses import dumps
+
+CACHE_INVALIDATED_EVENT = "cache.invalidated"
+
+_caches: list["ResponseCache"] = []
+
+
+@dataclass
+class CachedBody:
+    """A serialized response body and its compressed versions."""
+
+    body: bytes
+    expires_at: float
+    encoded: dict[Encoding, bytes] = field(default_factory=dict)
+
+
+@lru_cache
+def _adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def serialize(value: Any, model: Any = None) -> bytes:
+    """JSON for a value, through its response model as FastAPI would, or with orjson."""
+    if model is None:
+        return dumps(value)
+    adapter = _adapter(model)
+    return adapter.dump_json(adapter.validate_python(value))
+
+
+class ResponseCache:
+    """TTL cache of JSON response bodies, cleared when one of ``tables`` changes."""
+
+    def __init__(self, name: str, tables: set[str]):
+        self.name = name
+        self.tables = tables
+        self._entries: OrderedDict[Hashable, CachedBody] = OrderedDict()
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        # Bumped on clear, so a build that raced a write is not stored
+        self._generation = 0
+        _caches.append(self)
+
+    async def respond(
+        self,
+        request: Request,
+        key: Hashable,
+        build: Callable[[], Awaitable[Any]],
+        model: Any = None,
+    ) -> Response:
+        """
+        Respond with the body cached under ``key``, building it on a miss.
+
+        ``build`` returns the payload, serialized through ``model`` (the
+        endpoint's response model) if given. The body is sent in the
+        encoding the client prefers; the compression middleware leaves
+        encoded responses alone.
+        """
+        entry = await self._get(key, build, model)
+        encoding = negotiate(request.headers.get("accept-encoding"))
+        if (
+            encoding is None
+            or not settings.compression_enabled
+            or len(entry.body) < settings.compression_minimum_size
+        ):
+            return Response(entry.body, media_type="application/json")
+
+        encoded = entry.encoded.get(encoding)
+        if encoded is None:
+            # A slow level, paid once per entry, so off the event loop
+            encoded = await asyncio.to_thread(
+                compress, entry.body, encoding, PRECOMPRESSED_LEVELS[encoding]
+            )
+            entry.encoded[encoding] = encoded
+        record_compression(encoding.value, len(entry.body), len(encoded))
+        return Response(
+            encoded,
+            media_type="application/json",
+            headers={"Content-Encoding": encoding.value, "Vary": "Accept-Encoding"},
+        )
+
+    async def _get(
+        self, key: Hashable, build: Callable[[], Awaitable[Any]], model: Any
+    ) -> CachedBody:
+        ttl = settings.response_cache_seconds
+        if ttl <= 0:
+            return CachedBody(serialize(await build(), model), expires_at=0.0)
+
+        entry = self._fresh(key)
+        record_cache_lookup(self.name, entry is not None)
+        if entry is not None:
+            return entry
+
+        # Concurrent misses for the same key share one build
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._fresh(key)
+                if entry is None:
+                    generation = self._generation
+                    entry = CachedBody(serialize(await build(), model), time.monotonic() + ttl)
+                    if generation == self._generation:
+                        self._store(key, entry)
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+        return entry
+
+    def _fresh(self, key: Hashable) -> CachedBody | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Hashable, entry: CachedBody) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.response_cache_max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+
+
+def _clear_caches(tables: set[str]) -> None:
+    for cache in _caches:
+        if cache.tables & tables:
+            cache.clear()
+
+
+def _record_changed_tables(session: Session, tables: set[str]) -> None:
+    """Note tables changed in the session's transaction, telling other processes once each."""
+    changed = session.info.setdefault("changed_tables", set())
+    cached = {
+        table for table in tables - changed if any(table in cache.tables for cache in _caches)
+    }
+    changed |= tables
+    if cached and settings.response_cache_seconds > 0:
+        # Like any NOTIFY, only delivered if the transaction commits
+        invalidation = {"event": CACHE_INVALIDATED_EVENT, "tables": sorted(cached)}
+        session.connection().execute(notify_statement(invalidation))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session: Session, flush_context) -> None:
+    _record_changed_tables(
+        session,
+        {
+            instance.__table__.name
+            for instance in itertools.chain(session.new, session.dirty, session.deleted)
+        },
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_changed_tables(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk insert, update and delete statements bypass the unit of work
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _record_changed_tables(
+            orm_execute_state.session, {orm_execute_state.statement.table.name}
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_changed_caches(session: Session) -> None:
+    changed = session.info.pop("changed_tables", None)
+    if changed:
+        _clear_caches(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_tables(session: Session) -> None:
+    session.info.pop("changed_tables", None)
+
+
+def _clear_invalidated_caches(invalidation: dict) -> None:
+    """Clear the caches of tables changed by a commit, possibly in another process."""
+    _clear_caches(set(invalidation["tables"]))
+
+
+notification_broadcaster.on(CACHE_INVALIDATED_EVENT, _clear_invalidated_caches)
@@ -0,0 +1,35 @@
+"""
+JSON responses serialized with orjson.
+
+Routes that return data for their ``response_model`` are already validated
+and serialized in one pass by pydantic-core, so this is not the app's default
+response class (setting one turns that path off). It is for endpoints whose
+services build the payload themselves as dataclasses: returning an
+``ORJSONResponse`` skips the response model validation, and orjson serializes
+dataclasses, UUIDs and dates natively.
+"""
+
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    # asyncpg returns its own UUID subclass, which orjson does not recognize
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to JSON with orjson."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,77 +1,389 @@
-"""Background job scheduler for notifications and maintenance tasks."""
+"""
+Background job scheduler for notifications and maintenance tasks.
 
+Every API process calls ``start_scheduler``, but only the process holding a
+Postgres advisory lock (the leader) runs jobs, so each job runs once per
+cluster. Jobs are persisted in the ``apscheduler_jobs`` table: when a new
+leader takes over after a restart or failover, runs missed in the meantime
+are caught up once (within ``scheduler_misfire_grace_seconds``). Every run,
+scheduled or manual, is recorded in the ``job_runs`` table.
+
+Manual runs requested through the admin API are recorded by the API process
+and handed to the leader over LISTEN/NOTIFY, so jobs only ever run in the
+leader, never in a web process.
+"""
+
+import asyncio
+import json
 import logging
-from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
+import asyncpg
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from opentelemetry.trace import Status, StatusCode
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import AsyncSessionLocal
+from app.metrics import JOB_DURATION
+from app.models.job_run import JobRunStatus, JobTrigger
+from app.query_stats import track_queries
+from app.services.job_run_service import JobAlreadyRunningError, JobResult, JobRunService
+from app.services.notification_delivery_service import NotificationDeliveryService
 from app.services.notification_service import NotificationService
+from app.services.storage_reconciliation_service import StorageReconciliationService
+from app.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
+# Advisory lock key identifying the scheduler leader ("plants" in ASCII)
+SCHEDULER_LOCK_ID = 0x706C616E7473
+
+# Channel on which the API asks the scheduler leader to run a job now
+JOB_RUN_CHANNEL = "job_run_requests"
+
+# Most hours of missed due task checks a run catches up on
+DUE_TASKS_CATCH_UP_HOURS = 24
 
+scheduler = AsyncIOScheduler(
+    jobstores={
+        "default": SQLAlchemyJobStore(
+            url=settings.scheduler_jobstore_url
+            or settings.database_url.replace("+asyncpg", "+psycopg2", 1)
+        ),
+        # Manual runs, which are recorded in job_runs rather than persisted here
+        "manual": MemoryJobStore(),
+    },
+    job_defaults={
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": settings.scheduler_misfire_grace_seconds,
+    },
+)
 
-async def check_due_tasks_job():
+
+async def check_due_tasks_job(db: AsyncSession) -> JobResult:
     """
     Background job to check for due tasks and create notifications.
-    Runs daily at 8:00 AM.
+    Runs hourly; each run covers the locations whose local reminder hour it is.
+
+    Hours since the last successful run (at most ``DUE_TASKS_CATCH_UP_HOURS``)
+    are checked too, so reminder hours missed while no leader was running
+    still get their notifications. Plants notified that day are not notified again.
     """
-    logger.info("Running scheduled task: check_due_tasks")
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    hours = 1
+    last_runs = await JobRunService(db).get_runs(
+        "check_due_tasks", JobRunStatus.SUCCEEDED.value, limit=1
+    )
+    if last_runs:
+        last_hour = last_runs[0].started_at.replace(
+            minute=0, second=0, microsecond=0, tzinfo=timezone.utc
+        )
+        hours = max(1, min((now - last_hour) // timedelta(hours=1), DUE_TASKS_CATCH_UP_HOURS))
+        if hours > 1:
+            logger.warning(f"Catching up on {hours - 1} missed hours of due task checks")
 
-    async with AsyncSessionLocal() as db:
-        try:
-            service = NotificationService(db)
-            count = await service.check_due_tasks()
-            logger.info(f"Created {count} notifications for due tasks")
-        except Exception as e:
-            logger.error(f"Error in check_due_tasks_job: {e}", exc_info=True)
+    service = NotificationService(db)
+    count = 0
+    for offset in reversed(range(hours)):
+        count += await service.check_due_tasks(now - timedelta(hours=offset))
+    logger.info(f"Created {count} notifications for due tasks")
+    return JobResult(count, {"hours_checked": hours})
 
 
-async def cleanup_old_notifications_job():
+async def cleanup_old_notifications_job(db: AsyncSession) -> JobResult:
     """
-    Background job to clean up old read notifications.
+    Background job to drop expired notification partitions and create upcoming ones,
+    and to delete old failed deliveries.
     Runs weekly on Sunday at 2:00 AM.
     """
-    logger.info("Running scheduled task: cleanup_old_notifications")
-
-    async with AsyncSessionLocal() as db:
-        try:
-            service = NotificationService(db)
-            count = await service.cleanup_old_notifications(days=30)
-            logger.info(f"Cleaned up {count} old notifications")
-        except Exception as e:
-            logger.error(f"Error in cleanup_old_notifications_job: {e}", exc_info=True)
+    count = await NotificationService(db).cleanup_old_notifications()
+    failed = await NotificationDeliveryService(db).delete_expired_failures()
+    logger.info(
+        f"Dropped {count} expired notification partitions and {failed} failed deliveries"
+    )
+    return JobResult(count, {"failed_deliveries_deleted": failed})
 
 
-def start_scheduler():
-    """Start the background job scheduler."""
-    # Add job to check due tasks daily at 8:00 AM
-    scheduler.add_job(
-        check_due_tasks_job,
-        trigger=CronTrigger(hour=8, minute=0),
-        id="check_due_tasks",
-        name="Check for due watering and fertilization tasks",
-        replace_existing=True,
+async def reconcile_storage_job(db: AsyncSession) -> JobResult:
+    """
+    Background job to remove orphaned photo files and report missing ones.
+    Runs weekly on Sunday at 3:00 AM.
+    """
+    report = await StorageReconciliationService(db).reconcile()
+    logger.info(
+        f"Storage reconciliation: scanned {report.files_scanned} files, "
+        f"deleted {report.deleted_files}/{report.orphaned_files} orphans "
+        f"({report.orphaned_bytes} bytes), {report.missing_files} photos missing files, "
+        f"{report.missing_thumbnails} missing thumbnails"
+    )
+    if report.missing_file_keys:
+        logger.warning(f"Photos with missing files: {report.missing_file_keys}")
+    if report.missing_thumbnail_keys:
+        logger.warning(f"Missing thumbnails: {report.missing_thumbnail_keys}")
+    return JobResult(
+        report.files_scanned,
+        {
+            "orphaned_files": report.orphaned_files,
+            "deleted_files": report.deleted_files,
+            "orphaned_bytes": report.orphaned_bytes,
+            "missing_files": report.missing_files,
+            "missing_thumbnails": report.missing_thumbnails,
+        },
     )
 
-    # Add job to cleanup old notifications weekly on Sunday at 2:00 AM
-    scheduler.add_job(
-        cleanup_old_notifications_job,
-        trigger=CronTrigger(day_of_week="sun", hour=2, minute=0),
-        id="cleanup_old_notifications",
-        name="Clean up old read notifications",
-        replace_existing=True,
+
+JOBS = [
+    {
+        "task": check_due_tasks_job,
+        "trigger": CronTrigger(minute=0),
+        "id": "check_due_tasks",
+        "name": "Check for due watering and fertilization tasks",
+    },
+    {
+        "task": cleanup_old_notifications_job,
+        "trigger": CronTrigger(day_of_week="sun", hour=2, minute=0),
+        "id": "cleanup_old_notifications",
+        "name": "Apply notification retention",
+    },
+    {
+        "task": reconcile_storage_job,
+        "trigger": CronTrigger(day_of_week="sun", hour=3, minute=0),
+        "id": "reconcile_storage",
+        "name": "Remove orphaned photo files",
+    },
+]
+JOBS_BY_ID = {definition["id"]: definition for definition in JOBS}
+
+
+async def run_job(job_id: str, run_id: UUID | None = None) -> None:
+    """
+    Run a job from ``JOBS`` and record it in the ``job_runs`` table.
+
+    Scheduled runs call this with just the job id. Manual runs record their
+    start first (so a conflict can be reported to the caller) and pass the
+    run id. The run is recorded in its own session, so a job failure that
+    rolls back the job's session is still recorded.
+    """
+    definition = JOBS_BY_ID[job_id]
+
+    with tracer.start_as_current_span(f"job {job_id}", attributes={"job.id": job_id}) as span:
+        async with AsyncSessionLocal() as recorder_db:
+            recorder = JobRunService(recorder_db)
+            if run_id is None:
+                try:
+                    run_id = (await recorder.start(job_id, JobTrigger.SCHEDULED.value)).id
+                except JobAlreadyRunningError:
+                    logger.warning(f"Skipping scheduled run of {job_id}: already running")
+                    span.set_attribute("job.skipped", True)
+                    return
+            span.set_attribute("job.run_id", str(run_id))
+
+            logger.info(f"Running job: {job_id}")
+            try:
+                with track_queries() as stats:
+                    async with AsyncSessionLocal() as db:
+                        result = await definition["task"](db)
+            except Exception as e:
+                logger.error(f"Error in {job_id}: {e}", exc_info=True)
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                run = await recorder.fail(run_id, e)
+                if run is not None:
+                    JOB_DURATION.labels(job_id, run.status).observe(run.duration_seconds)
+                return
+
+            result.details = {
+                **(result.details or {}),
+                "queries": stats.count,
+                "db_seconds": round(stats.duration, 3),
+            }
+            for statement, count in stats.repeated_statements(settings.query_repeat_threshold):
+                logger.warning(
+                    f"Possible N+1 in {job_id}: statement ran {count} times: {statement[:200]}"
+                )
+
+            span.set_attribute("job.items_processed", result.items_processed or 0)
+            run = await recorder.succeed(run_id, result)
+            if run is not None:
+                JOB_DURATION.labels(job_id, run.status).observe(run.duration_seconds)
+                logger.info(f"Finished {job_id} in {run.duration_seconds:.2f}s")
+
+
+async def has_leader(db: AsyncSession) -> bool:
+    """Whether a process currently holds the scheduler leader lock."""
+    # A bigint advisory lock key is split over classid (high half) and objid (low half)
+    return await db.scalar(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory' AND granted"
+            " AND classid::bigint = :high AND objid::bigint = :low AND objsubid = 1)"
+        ),
+        {"high": SCHEDULER_LOCK_ID >> 32, "low": SCHEDULER_LOCK_ID & 0xFFFFFFFF},
     )
 
-    scheduler.start()
-    logger.info("Scheduler started successfully")
+
+async def request_job_run(db: AsyncSession, job_id: str, run_id: UUID) -> None:
+    """Ask the scheduler leader to run a job now, as the already recorded run ``run_id``."""
+    request = json.dumps({"job_id": job_id, "run_id": str(run_id)})
+    await db.execute(select(func.pg_notify(JOB_RUN_CHANNEL, request)))
+    await db.commit()
+
+
+def _schedule_jobs() -> None:
+    """
+    Register ``JOBS`` in the persistent job store.
+
+    Jobs whose trigger is unchanged keep their stored next run time, so runs
+    missed while no leader was running are caught up instead of skipped.
+    Stored jobs no longer in ``JOBS`` are removed.
+    """
+    for definition in JOBS:
+        job_id = definition["id"]
+        job = scheduler.get_job(job_id)
+        if job is not None and str(job.trigger) == str(definition["trigger"]):
+            job.modify(func=run_job, args=(job_id,), name=definition["name"])
+            continue
+        scheduler.add_job(
+            run_job,
+            definition["trigger"],
+            args=(job_id,),
+            id=job_id,
+            name=definition["name"],
+            replace_existing=True,
+        )
+
+    for job in scheduler.get_jobs(jobstore="default"):
+        if job.id not in JOBS_BY_ID:
+            logger.info(f"Removing job {job.id} from the job store: no longer defined")
+            job.remove()
+
+
+class SchedulerLeaderElection:
+    """
+    Runs the scheduler only while this process holds the leader lock.
+
+    The lock is a session-level advisory lock held on a dedicated connection,
+    so Postgres releases it as soon as the leader's connection goes away.
+    Followers retry every ``retry_interval`` seconds; the leader checks its
+    connection on the same interval and stops scheduling if it is lost.
+    """
+
+    def __init__(self, dsn: str, lock_id: int, retry_interval: float):
+        self.dsn = dsn
+        self.lock_id = lock_id
+        self.retry_interval = retry_interval
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+        self.is_leader = False
+
+    @property
+    def running(self) -> bool:
+        """Whether this process is competing for (or holding) leadership."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start competing for leadership in the background."""
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.create_task(self._run(), name="scheduler-leader-election")
+
+    async def stop(self) -> None:
+        """Stop the scheduler if running and release leadership."""
+        self._stop.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _wait(self) -> bool:
+        """Sleep for the retry interval. Returns True if stopping."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=self.retry_interval)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Scheduler leader election failed to connect: {e}")
+                await self._wait()
+                continue
+
+            try:
+                await self._lead(connection)
+            except (
+                OSError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError,
+                asyncio.TimeoutError,
+            ) as e:
+                logger.warning(f"Scheduler leader election connection lost: {e}")
+            finally:
+                if self.is_leader:
+                    self.is_leader = False
+                    scheduler.shutdown(wait=False)
+                    logger.info("Scheduler stopped, leadership released")
+                # Closing the session releases the advisory lock
+                await connection.close(timeout=5)
+
+    async def _lead(self, connection: asyncpg.Connection) -> None:
+        """Acquire the lock, then run the scheduler until stopped or disconnected."""
+        while not await connection.fetchval("SELECT pg_try_advisory_lock($1)", self.lock_id):
+            if await self._wait():
+                return
+
+        self.is_leader = True
+        scheduler.start(paused=True)
+        _schedule_jobs()
+        scheduler.resume()
+        await connection.add_listener(JOB_RUN_CHANNEL, self._run_requested)
+        logger.info("Acquired scheduler leadership, scheduler started")
+
+        while not await self._wait():
+            await connection.fetchval("SELECT 1", timeout=self.retry_interval)
+
+
+    def _run_requested(self, connection, pid, channel, payload: str) -> None:
+        """Schedule a manual run requested with ``request_job_run`` to start now."""
+        try:
+            request = json.loads(payload)
+            job_id, run_id = request["job_id"], UUID(request["run_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed job run request: {payload!r}")
+            return
+        if job_id not in JOBS_BY_ID:
+            logger.warning(f"Ignoring run request for unknown job {job_id}")
+            return
+
+        scheduler.add_job(
+            run_job,
+            args=(job_id, run_id),
+            id=f"{job_id}:{run_id}",
+            name=f"{JOBS_BY_ID[job_id]['name']} (manual)",
+            jobstore="manual",
+        )
+
+
+leader_election = SchedulerLeaderElection(
+    settings.database_url.replace("+asyncpg", "", 1),
+    lock_id=SCHEDULER_LOCK_ID,
+    retry_interval=settings.scheduler_leader_retry_seconds,
+)
+
+
+def start_scheduler():
+    """Start competing for scheduler leadership; the leader runs the jobs."""
+    leader_election.start()
 
 
-def stop_scheduler():
-    """Stop the background job scheduler."""
-    scheduler.shutdown(wait=True)
-    logger.info("Scheduler stopped")
+async def stop_scheduler():
+    """Stop the scheduler and release leadership."""
+    await leader_election.stop()
@@ -0,0 +1,19 @@
+"""Health check schemas."""
+
+from pydantic import BaseModel
+
+
+class DependencyCheck(BaseModel):
+    """Result of checking a single dependency."""
+
+    status: str  # ok/fail/skipped
+    latency_ms: float | None = None
+    detail: str | None = None
+    cached: bool = False
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness of this process and the state of each dependency."""
+
+    status: str  # ready/not_ready
+    checks: dict[str, DependencyCheck]
@@ -0,0 +1,60 @@
+"""Background job schemas."""
+
+from datetime import date, datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class JobRunResponse(BaseModel):
+    """Schema for a job run."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    job_id: str
+    trigger: str
+    status: str
+    started_at: datetime
+    finished_at: datetime | None = None
+    duration_seconds: float | None = None
+    items_processed: int | None = None
+    details: dict | None = None
+    error: str | None = None
+
+
+class JobInfo(BaseModel):
+    """A registered background job and its latest run."""
+
+    id: str
+    name: str
+    schedule: str
+    last_run: JobRunResponse | None = None
+
+
+class JobDurationBucket(BaseModel):
+    """Number of runs that took at most ``le`` seconds (None for +Inf)."""
+
+    le: float | None
+    count: int
+
+
+class JobDurationDay(BaseModel):
+    """Run durations for a single day."""
+
+    date: date
+    runs: int
+    mean_seconds: float
+    max_seconds: float
+    mean_items_processed: float | None = None
+
+
+class JobDurationStats(BaseModel):
+    """Duration histogram and daily trend of a job's finished runs."""
+
+    job_id: str
+    since: datetime
+    count: int
+    sum_seconds: float
+    buckets: list[JobDurationBucket]
+    daily: list[JobDurationDay]
@@ -3,8 +3,19 @@
 from datetime import datetime
 from typing import Any
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+def _validate_timezone(v: str | None) -> str | None:
+    """Check that a timezone is a known IANA name."""
+    if v is not None:
+        try:
+            ZoneInfo(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {v}")
+    return v
 
 
 class LocationBase(BaseModel):
@@ -17,6 +28,16 @@ class LocationBase(BaseModel):
     extra_data: dict[str, Any] | None = Field(
         None, description="Additional data (coordinates, layout info, etc.)"
     )
+    timezone: str = Field("UTC", max_length=64, description="IANA timezone, e.g. Europe/Paris")
+    reminder_hour: int = Field(
+        8, ge=0, le=23, description="Local hour at which due-task reminders are sent"
+    )
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, v: str) -> str:
+        """Validate the timezone name."""
+        return _validate_timezone(v)
 
 
 class LocationCreate(LocationBase):
@@ -33,6 +54,22 @@ class LocationUpdate(BaseModel):
     description: str | None = None
     zone: str | None = Field(None, max_length=100)
     extra_data: dict[str, Any] | None = None
+    timezone: str | None = Field(None, max_length=64)
+    reminder_hour: int | None = Field(None, ge=0, le=23)
+
+    @field_validator("timezone", "reminder_hour")
+    @classmethod
+    def reject_null(cls, v: Any) -> Any:
+        """Refuse null for fields every location has; they may only be left out."""
+        if v is None:
+            raise ValueError("May be omitted but not null")
+        return v
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, v: str | None) -> str | None:
+        """Validate the timezone name."""
+        return _validate_timezone(v)
 
 
 class LocationResponse(LocationBase):
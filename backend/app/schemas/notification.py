@@ -14,6 +14,8 @@ class NotificationBase(BaseModel):
     message: str
     plant_id: UUID | None = None
     plant_name: str | None = None
+    location_id: UUID | None = None
+    plant_ids: list[UUID] | None = None
 
 
 class NotificationCreate(NotificationBase):
@@ -33,14 +35,31 @@ class NotificationResponse(NotificationBase):
     read_at: datetime | None = None
 
 
+class NotificationItem(BaseModel):
+    """A single plant covered by a notification."""
+
+    plant_id: UUID
+    plant_name: str
+    location_id: UUID | None = None
+    location_name: str | None = None
+
+
 class NotificationMarkRead(BaseModel):
     """Schema for marking notification as read."""
 
     is_read: bool = True
 
 
+class NotificationTypeStats(BaseModel):
+    """Notification counts for a single notification type."""
+
+    total: int
+    unread: int
+
+
 class NotificationStats(BaseModel):
     """Schema for notification statistics."""
 
     total: int
     unread: int
+    by_type: dict[str, NotificationTypeStats] = {}
@@ -34,9 +34,40 @@ class PhotoResponse(PhotoBase):
     plant_id: UUID
     file_path: str
     thumbnail_path: str | None
+    upright_path: str | None = None
     original_filename: str
     file_size: int
     mime_type: str
     width: int | None
     height: int | None
+    latitude: float | None = None
+    longitude: float | None = None
+    processing_status: str
     created_at: datetime
+
+
+class PhotoUploadResult(BaseModel):
+    """Result for a single file in a batch upload."""
+
+    filename: str
+    success: bool = False
+    photo: PhotoResponse | None = None
+    error: str | None = None
+
+
+class PhotoBatchUploadResponse(BaseModel):
+    """Schema for batch upload response."""
+
+    uploaded: int
+    failed: int
+    results: list[PhotoUploadResult]
+
+
+class PhotoProcessingStatusResponse(BaseModel):
+    """Schema for photo post-processing status."""
+
+    photo_id: UUID
+    processing_status: str  # pending/processing/ready/failed
+    attempts: int
+    last_error: str | None = None
+    thumbnail_path: str | None = None
@@ -0,0 +1,15 @@
+"""Request profiling schemas."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ProfileInfo(BaseModel):
+    """A saved request profile."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    size: int
+    created_at: datetime
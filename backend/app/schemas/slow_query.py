@@ -0,0 +1,36 @@
+"""Slow query log schemas."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SlowQueryResponse(BaseModel):
+    """A statement that exceeded the slow query threshold."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: list[str] | None = None
+    caller: str | None = None
+    trace_id: str | None = None
+    plan_status: str
+    plan: str | None = None
+    plan_error: str | None = None
+
+
+class SlowQueryGroupResponse(BaseModel):
+    """Slow queries sharing the same normalized statement."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str
+    count: int
+    total_ms: float
+    max_ms: float
+    last_seen: datetime
+    callers: list[str]
+    plan: str | None = None
@@ -0,0 +1,29 @@
+"""Storage maintenance schemas."""
+
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class PlantStorageUsage(BaseModel):
+    """Storage used by one plant's photos."""
+
+    plant_id: UUID
+    photo_count: int
+    bytes: int
+
+
+class StorageReconciliationReport(BaseModel):
+    """Result of reconciling stored files with the photos table."""
+
+    dry_run: bool
+    files_scanned: int = 0
+    orphaned_files: int = 0
+    orphaned_bytes: int = 0
+    deleted_files: int = 0
+    photos_scanned: int = 0
+    missing_files: int = 0
+    missing_file_keys: list[str] = []  # capped sample for logging
+    missing_thumbnails: int = 0
+    missing_thumbnail_keys: list[str] = []  # capped sample for logging
+    usage_by_plant: list[PlantStorageUsage] = []
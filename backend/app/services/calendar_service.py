@@ -2,7 +2,9 @@
 Calendar service for aggregating scheduled activities
 """
 
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import and_, or_, select
@@ -15,6 +17,18 @@ from app.repositories.watering_repository import WateringRepository
 from app.repositories.fertilization_repository import FertilizationRepository
 
 
+@dataclass(slots=True)
+class CalendarEntry:
+    """A scheduled activity, serialized as a ``CalendarEvent``."""
+
+    id: str
+    type: str
+    plant_id: UUID
+    title: str
+    date: date
+    details: dict[str, Any]
+
+
 class CalendarService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -23,50 +37,43 @@ class CalendarService:
 
     async def get_calendar_events(
         self, start_date: date, end_date: date
-    ) -> list[dict]:
+    ) -> list[CalendarEntry]:
         """
         Get all calendar events (watering, fertilization, treatments) for a date range
         """
         events = []
 
-        # Get all active watering schedules and calculate their next dates
-        active_watering_schedules = await self.watering_repo.get_active_schedules()
-        for schedule in active_watering_schedules:
-            next_date = await self.watering_repo.calculate_next_watering_date(schedule)
-            if next_date and start_date <= next_date <= end_date:
-                events.append(
-                    {
-                        "id": str(schedule.id),
-                        "type": "watering",
-                        "plant_id": str(schedule.plant_id),
-                        "title": "Watering",
-                        "date": next_date.isoformat(),
-                        "details": {"frequency_days": schedule.frequency_days},
-                    }
+        # Active schedules with their next dates, each computed in one query
+        for schedule, next_date in await self.watering_repo.get_schedules_due_between(
+            start_date, end_date
+        ):
+            events.append(
+                CalendarEntry(
+                    id=str(schedule.id),
+                    type="watering",
+                    plant_id=schedule.plant_id,
+                    title="Watering",
+                    date=next_date,
+                    details={"frequency_days": schedule.frequency_days},
                 )
-
-        # Get all active fertilization schedules and calculate their next dates
-        active_fertilization_schedules = (
-            await self.fertilization_repo.get_active_schedules()
-        )
-        for schedule in active_fertilization_schedules:
-            next_date = await self.fertilization_repo.calculate_next_fertilization_date(
-                schedule
             )
-            if next_date and start_date <= next_date <= end_date:
-                events.append(
-                    {
-                        "id": str(schedule.id),
-                        "type": "fertilization",
-                        "plant_id": str(schedule.plant_id),
-                        "title": "Fertilization",
-                        "date": next_date.isoformat(),
-                        "details": {
-                            "frequency_days": schedule.frequency_days,
-                            "fertilizer_type": schedule.fertilizer_type,
-                        },
-                    }
+
+        for schedule, next_date in await self.fertilization_repo.get_schedules_due_between(
+            start_date, end_date
+        ):
+            events.append(
+                CalendarEntry(
+                    id=str(schedule.id),
+                    type="fertilization",
+                    plant_id=schedule.plant_id,
+                    title="Fertilization",
+                    date=next_date,
+                    details={
+                        "frequency_days": schedule.frequency_days,
+                        "fertilizer_type": schedule.fertilizer_type,
+                    },
                 )
+            )
 
         # Get treatments (both start and end dates)
         treatment_query = select(Treatment).where(
@@ -97,20 +104,20 @@ class CalendarService:
             # Add treatment start event
             if treatment.start_date >= start_date and treatment.start_date <= end_date:
                 events.append(
-                    {
-                        "id": str(treatment.id) + "_start",
-                        "type": "treatment_start",
-                        "plant_id": str(treatment.plant_id),
-                        "title": f"Treatment Start: {treatment.issue_name}",
-                        "date": treatment.start_date.isoformat(),
-                        "details": {
-                            "treatment_id": str(treatment.id),
+                    CalendarEntry(
+                        id=str(treatment.id) + "_start",
+                        type="treatment_start",
+                        plant_id=treatment.plant_id,
+                        title=f"Treatment Start: {treatment.issue_name}",
+                        date=treatment.start_date,
+                        details={
+                            "treatment_id": treatment.id,
                             "issue_type": treatment.issue_type,
                             "issue_name": treatment.issue_name,
                             "product_name": treatment.product_name,
                             "status": treatment.status,
                         },
-                    }
+                    )
                 )
 
             # Add treatment end event if it exists and in range
@@ -120,23 +127,23 @@ class CalendarService:
                 and treatment.end_date <= end_date
             ):
                 events.append(
-                    {
-                        "id": str(treatment.id) + "_end",
-                        "type": "treatment_end",
-                        "plant_id": str(treatment.plant_id),
-                        "title": f"Treatment End: {treatment.issue_name}",
-                        "date": treatment.end_date.isoformat(),
-                        "details": {
-                            "treatment_id": str(treatment.id),
+                    CalendarEntry(
+                        id=str(treatment.id) + "_end",
+                        type="treatment_end",
+                        plant_id=treatment.plant_id,
+                        title=f"Treatment End: {treatment.issue_name}",
+                        date=treatment.end_date,
+                        details={
+                            "treatment_id": treatment.id,
                             "issue_type": treatment.issue_type,
                             "issue_name": treatment.issue_name,
                             "product_name": treatment.product_name,
                             "status": treatment.status,
                         },
-                    }
+                    )
                 )
 
         # Sort events by date
-        events.sort(key=lambda x: x["date"])
+        events.sort(key=lambda x: x.date)
 
         return events
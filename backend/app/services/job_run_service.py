@@ -0,0 +1,91 @@
+"""Service for recording and reporting background job runs."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.job_run import JobRun
+from app.repositories.job_run_repository import JobRunRepository
+from app.schemas.job_run import JobDurationBucket, JobDurationDay, JobDurationStats
+
+# Upper bounds (seconds) of the job duration histogram buckets
+DURATION_BUCKETS_SECONDS = [0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800]
+
+
+class JobAlreadyRunningError(Exception):
+    """Raised when a job is started while another run of it is in progress."""
+
+
+@dataclass
+class JobResult:
+    """What a job did: the number of rows or items it processed, plus any details."""
+
+    items_processed: int
+    details: dict | None = None
+
+
+class JobRunService:
+    """Service for job run history."""
+
+    def __init__(self, db: AsyncSession):
+        self.repository = JobRunRepository(db)
+
+    async def start(self, job_id: str, trigger: str) -> JobRun:
+        """Record the start of a run, refusing to start a job that is already running."""
+        run = await self.repository.start(
+            job_id, trigger, timedelta(seconds=settings.job_run_stale_seconds)
+        )
+        if run is None:
+            raise JobAlreadyRunningError(f"Job {job_id} is already running")
+        return run
+
+    async def succeed(self, run_id: UUID, result: JobResult) -> JobRun | None:
+        """Record a successful run and its result."""
+        return await self.repository.succeed(run_id, result.items_processed, result.details)
+
+    async def fail(self, run_id: UUID, error: Exception) -> JobRun | None:
+        """Record a failed run."""
+        return await self.repository.fail(run_id, f"{type(error).__name__}: {error}")
+
+    async def get_runs(
+        self, job_id: str | None = None, status: str | None = None, skip: int = 0, limit: int = 100
+    ) -> list[JobRun]:
+        """Get runs, most recent first."""
+        return await self.repository.get_runs(job_id, status, skip, limit)
+
+    async def get_latest_runs(self) -> dict[str, JobRun]:
+        """Get the most recent run of every job."""
+        return await self.repository.get_latest_runs()
+
+    async def get_duration_stats(self, job_id: str, days: int = 30) -> JobDurationStats:
+        """Get the duration histogram and daily trend of a job over the last ``days`` days."""
+        since = datetime.utcnow() - timedelta(days=days)
+        buckets, count, total = await self.repository.get_duration_histogram(
+            job_id, since, DURATION_BUCKETS_SECONDS
+        )
+        daily = await self.repository.get_daily_durations(job_id, since)
+
+        return JobDurationStats(
+            job_id=job_id,
+            since=since,
+            count=count,
+            sum_seconds=total,
+            buckets=[
+                JobDurationBucket(le=bound, count=bucket_count)
+                for bound, bucket_count in zip(DURATION_BUCKETS_SECONDS, buckets)
+            ]
+            + [JobDurationBucket(le=None, count=count)],
+            daily=[
+                JobDurationDay(
+                    date=day,
+                    runs=runs,
+                    mean_seconds=mean,
+                    max_seconds=maximum,
+                    mean_items_processed=items,
+                )
+                for day, runs, mean, maximum, items in daily
+            ],
+        )
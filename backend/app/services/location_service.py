@@ -17,11 +17,10 @@ class LocationService:
 
     async def get_all_locations(self) -> list[LocationWithPlantsCount]:
         """Get all locations with plant counts."""
-        locations = await self.repository.get_all()
+        locations = await self.repository.get_all_with_plant_counts()
 
         result = []
-        for location in locations:
-            plants_count = await self.repository.count_plants(location.id)
+        for location, plants_count in locations:
             location_data = LocationWithPlantsCount.model_validate(location)
             location_data.plants_count = plants_count
             result.append(location_data)
@@ -0,0 +1,108 @@
+"""Service for sending queued notifications to email and webhook channels."""
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.delivery import DeliveryError, get_sender
+from app.models.notification_delivery import NotificationDelivery
+from app.repositories.notification_delivery_repository import NotificationDeliveryRepository
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDeliveryService:
+    """Service that sends claimed outbox deliveries and records the outcome."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service."""
+        self.db = db
+        self.delivery_repo = NotificationDeliveryRepository(db)
+
+    async def deliver(self, deliveries: list[NotificationDelivery]) -> int:
+        """
+        Send a batch of claimed deliveries.
+
+        Deliveries for the same channel and target are sent together as one
+        email or request, and different targets are sent concurrently. Failed
+        deliveries are retried with jittered exponential backoff until
+        ``notification_delivery_max_attempts`` is reached.
+        Returns the number of deliveries sent.
+        """
+        groups: dict[tuple[str, str], list[NotificationDelivery]] = defaultdict(list)
+        for delivery in sorted(deliveries, key=lambda delivery: delivery.created_at):
+            groups[(delivery.channel, delivery.target)].append(delivery)
+
+        errors = await asyncio.gather(
+            *(self._send(channel, target, group) for (channel, target), group in groups.items())
+        )
+
+        sent = 0
+        for group, error in zip(groups.values(), errors):
+            if error is None:
+                await self.delivery_repo.complete([delivery.id for delivery in group])
+                sent += len(group)
+            else:
+                for delivery in group:
+                    await self._handle_failure(delivery, error)
+
+        await self.db.commit()
+        return sent
+
+    async def _send(
+        self, channel: str, target: str, group: list[NotificationDelivery]
+    ) -> DeliveryError | None:
+        """
+        Send one group, waiting for the channel's rate limit. Returns the error, if any.
+
+        The group takes one token per delivery in it, not one for the message.
+        """
+        try:
+            sender = get_sender(channel)
+            await sender.rate_limiter.acquire(len(group))
+            await sender.send(target, [delivery.payload for delivery in group])
+        except DeliveryError as e:
+            return e
+        except Exception as e:
+            logger.error(f"Unexpected error delivering to {channel} {target}: {e}", exc_info=True)
+            return DeliveryError(str(e) or type(e).__name__)
+        return None
+
+    async def delete_expired_failures(self) -> int:
+        """
+        Delete failed deliveries older than ``notification_delivery_failed_retention_days``.
+
+        They stay that long for inspection. Returns the number deleted.
+        """
+        cutoff = datetime.utcnow() - timedelta(
+            days=settings.notification_delivery_failed_retention_days
+        )
+        return await self.delivery_repo.delete_failed(
+            cutoff, settings.notification_cleanup_batch_size
+        )
+
+    async def _handle_failure(self, delivery: NotificationDelivery, error: DeliveryError) -> None:
+        """Schedule a retry for a failed delivery, or give up."""
+        if error.permanent or delivery.attempts >= settings.notification_delivery_max_attempts:
+            logger.error(
+                f"Giving up on {delivery.channel} delivery {delivery.id} "
+                f"after {delivery.attempts} attempts: {error}"
+            )
+            await self.delivery_repo.fail(delivery.id, str(error))
+            return
+
+        # Full jitter keeps retries from many deliveries from arriving in lockstep
+        delay = random.uniform(
+            0, settings.notification_delivery_retry_base_seconds * 2 ** (delivery.attempts - 1)
+        )
+        logger.warning(
+            f"{delivery.channel} delivery {delivery.id} attempt {delivery.attempts} failed, "
+            f"retrying in {delay:.0f}s: {error}"
+        )
+        await self.delivery_repo.retry_later(
+            delivery.id, datetime.utcnow() + timedelta(seconds=delay), str(error)
+        )
@@ -1,15 +1,63 @@
 """Notification service for creating and managing notifications."""
 
-from datetime import date, timedelta
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.notification import NotificationType
+from app.models.plant import Plant
+from app.repositories.location_repository import LocationRepository
 from app.repositories.notification_repository import NotificationRepository
+from app.repositories.plant_repository import PlantRepository
 from app.repositories.watering_repository import WateringRepository
 from app.repositories.fertilization_repository import FertilizationRepository
-from app.schemas.notification import NotificationCreate, NotificationStats
+from app.schemas.notification import (
+    NotificationCreate,
+    NotificationItem,
+    NotificationStats,
+    NotificationTypeStats,
+)
+
+logger = logging.getLogger(__name__)
+
+# Task name and activity used in notification titles and messages
+TASK_LABELS = {
+    NotificationType.WATERING_DUE: ("Watering", "watering"),
+    NotificationType.WATERING_OVERDUE: ("Watering", "watering"),
+    NotificationType.FERTILIZATION_DUE: ("Fertilization", "fertilization"),
+    NotificationType.FERTILIZATION_OVERDUE: ("Fertilization", "fertilization"),
+}
+OVERDUE_TYPES = {NotificationType.WATERING_OVERDUE, NotificationType.FERTILIZATION_OVERDUE}
+
+# Plants named in a digest message before the rest are summarized as "and N more"
+DIGEST_LISTED_PLANTS = 3
+
+
+@dataclass
+class DueTask:
+    """A watering or fertilization task due for a plant today."""
+
+    type: NotificationType
+    plant: Plant
+    frequency_days: int
+    days_overdue: int
+
+
+@dataclass
+class ReminderBucket:
+    """Locations of one timezone whose reminder hour has come."""
+
+    today: date
+    # Local midnight as naive UTC, the start of "today" for deduplication
+    day_start: datetime
+    location_ids: list[UUID] = field(default_factory=list)
+    include_unlocated: bool = False
 
 
 class NotificationService:
@@ -20,6 +68,8 @@ class NotificationService:
         self.notification_repo = NotificationRepository(db)
         self.watering_repo = WateringRepository(db)
         self.fertilization_repo = FertilizationRepository(db)
+        self.plant_repo = PlantRepository(db)
+        self.location_repo = LocationRepository(db)
 
     async def get_all_notifications(
         self, skip: int = 0, limit: int = 100, unread_only: bool = False
@@ -46,202 +96,241 @@ class NotificationService:
         return await self.notification_repo.mark_all_as_read()
 
     async def get_stats(self) -> NotificationStats:
-        """Get notification statistics."""
-        all_notifications = await self.notification_repo.get_all(limit=1000)
-        unread_count = await self.notification_repo.get_unread_count()
-
-        return NotificationStats(total=len(all_notifications), unread=unread_count)
+        """Get notification statistics, overall and per type."""
+        counts = await self.notification_repo.get_counts_by_type()
+
+        return NotificationStats(
+            total=sum(total for total, _ in counts.values()),
+            unread=sum(unread for _, unread in counts.values()),
+            by_type={
+                type_: NotificationTypeStats(total=total, unread=unread)
+                for type_, (total, unread) in counts.items()
+            },
+        )
 
     async def delete_notification(self, notification_id: UUID) -> bool:
         """Delete a notification."""
         return await self.notification_repo.delete(notification_id)
 
-    async def check_due_tasks(self) -> int:
+    async def get_notification_items(self, notification_id: UUID) -> list[NotificationItem] | None:
         """
-        Check for due tasks and create notifications.
-        This method is called by the scheduler.
-        Returns the number of notifications created.
+        Expand a notification into the plants it covers.
+
+        Digest notifications list every grouped plant; plants deleted since the
+        notification was created are skipped. Returns None if not found.
         """
-        notification_count = 0
+        notification = await self.notification_repo.get_by_id(notification_id)
+        if not notification:
+            return None
 
-        # Check for watering due today
-        due_watering_list = await self.watering_repo.get_plants_due_for_watering(
-            days_ahead=0
+        plant_ids = notification.plant_ids or (
+            [notification.plant_id] if notification.plant_id else []
         )
+        plants = {plant.id: plant for plant in await self.plant_repo.get_by_ids(plant_ids)}
 
-        for schedule, next_date in due_watering_list:
-            # Get plant details
-            from app.repositories.plant_repository import PlantRepository
-
-            plant_repo = PlantRepository(self.db)
-            plant = await plant_repo.get_by_id(schedule.plant_id)
-
-            if not plant:
-                continue
-
-            # Check if we already have a notification for this plant today
-            existing_notifications = await self.notification_repo.get_all(limit=1000)
-            today_notifications = [
-                n
-                for n in existing_notifications
-                if n.plant_id == plant.id
-                and n.type == NotificationType.WATERING_DUE
-                and n.created_at.date() == date.today()
-            ]
-
-            if today_notifications:
-                continue  # Already notified today
-
-            # Create notification
-            notification_data = NotificationCreate(
-                type=NotificationType.WATERING_DUE,
-                title=f"Watering Due: {plant.name}",
-                message=f"{plant.name} needs watering today (every {schedule.frequency_days} days)",
+        return [
+            NotificationItem(
                 plant_id=plant.id,
                 plant_name=plant.name,
+                location_id=plant.location_id,
+                location_name=plant.location.name if plant.location else None,
             )
+            for plant in (plants.get(plant_id) for plant_id in plant_ids)
+            if plant is not None
+        ]
 
-            await self.notification_repo.create(notification_data)
-            notification_count += 1
-
-        # Check for overdue watering (more than 1 day overdue)
-        overdue_watering_list = await self.watering_repo.get_plants_due_for_watering(
-            days_ahead=-1
-        )
-
-        for schedule, next_date in overdue_watering_list:
-            # Get plant details
-            from app.repositories.plant_repository import PlantRepository
-
-            plant_repo = PlantRepository(self.db)
-            plant = await plant_repo.get_by_id(schedule.plant_id)
-
-            if not plant:
-                continue
-
-            days_overdue = (date.today() - next_date).days
-
-            # Only create overdue notification if more than 1 day overdue
-            if days_overdue <= 1:
-                continue
-
-            # Check if we already have an overdue notification for this plant today
-            existing_notifications = await self.notification_repo.get_all(limit=1000)
-            today_notifications = [
-                n
-                for n in existing_notifications
-                if n.plant_id == plant.id
-                and n.type == NotificationType.WATERING_OVERDUE
-                and n.created_at.date() == date.today()
-            ]
-
-            if today_notifications:
-                continue  # Already notified today
-
-            # Create overdue notification
-            notification_data = NotificationCreate(
-                type=NotificationType.WATERING_OVERDUE,
-                title=f"⚠️ Watering Overdue: {plant.name}",
-                message=f"{plant.name} is {days_overdue} days overdue for watering!",
-                plant_id=plant.id,
-                plant_name=plant.name,
-            )
+    async def check_due_tasks(self, now: datetime | None = None) -> int:
+        """
+        Check for due tasks and create notifications.
+        This method is called by the scheduler every hour.
 
-            await self.notification_repo.create(notification_data)
-            notification_count += 1
+        Each location has its own timezone and reminder hour, so a run only
+        checks the plants of locations where it is currently that hour, using
+        their local date. Plants without a location use
+        ``notification_default_timezone`` and ``notification_default_reminder_hour``.
 
-        # Check for fertilization due today
-        due_fertilization_list = (
-            await self.fertilization_repo.get_plants_due_for_fertilization(
-                days_ahead=0
-            )
+        Plants already notified today for the same task type are skipped. In
+        digest mode (``notification_digest_mode``), due plants are grouped into
+        one notification per location and type.
+        Returns the number of notifications created.
+        """
+        now = now or datetime.now(timezone.utc)
+
+        notifications = []
+        for bucket in await self._get_reminder_buckets(now):
+            tasks = await self._collect_due_tasks(bucket)
+
+            notified = await self.notification_repo.get_notified_plants_since(bucket.day_start)
+            tasks = [task for task in tasks if (task.type.value, task.plant.id) not in notified]
+
+            if settings.notification_digest_mode:
+                notifications.extend(self._build_digests(tasks))
+            else:
+                notifications.extend(self._build_notification(task) for task in tasks)
+
+        created = await self.notification_repo.create_many(notifications)
+        return len(created)
+
+    async def _get_reminder_buckets(self, now: datetime) -> list[ReminderBucket]:
+        """Group the locations whose local reminder hour is ``now`` by timezone."""
+        buckets: dict[str, ReminderBucket] = {}
+
+        def bucket_for(timezone_name: str, reminder_hour: int) -> ReminderBucket | None:
+            try:
+                tz = ZoneInfo(timezone_name)
+            except (ZoneInfoNotFoundError, ValueError):
+                logger.warning(f"Skipping reminders for unknown timezone: {timezone_name}")
+                return None
+
+            local_now = now.astimezone(tz)
+            if local_now.hour != reminder_hour:
+                return None
+
+            if timezone_name not in buckets:
+                today = local_now.date()
+                day_start = datetime.combine(today, time.min, tzinfo=tz)
+                buckets[timezone_name] = ReminderBucket(
+                    today=today,
+                    day_start=day_start.astimezone(timezone.utc).replace(tzinfo=None),
+                )
+            return buckets[timezone_name]
+
+        for location_id, timezone_name, reminder_hour in (
+            await self.location_repo.get_reminder_times()
+        ):
+            bucket = bucket_for(timezone_name, reminder_hour)
+            if bucket:
+                bucket.location_ids.append(location_id)
+
+        bucket = bucket_for(
+            settings.notification_default_timezone, settings.notification_default_reminder_hour
+        )
+        if bucket:
+            bucket.include_unlocated = True
+
+        return list(buckets.values())
+
+    async def _collect_due_tasks(self, bucket: ReminderBucket) -> list[DueTask]:
+        """Get every due and overdue watering and fertilization task in a bucket."""
+        today = bucket.today
+        due_watering = await self.watering_repo.get_plants_due_for_watering(
+            today=today,
+            location_ids=bucket.location_ids,
+            include_unlocated=bucket.include_unlocated,
+        )
+        due_fertilization = await self.fertilization_repo.get_plants_due_for_fertilization(
+            today=today,
+            location_ids=bucket.location_ids,
+            include_unlocated=bucket.include_unlocated,
         )
 
-        for schedule, next_date in due_fertilization_list:
-            # Get plant details
-            from app.repositories.plant_repository import PlantRepository
+        # Load every due plant with its location in one query
+        plant_ids = {schedule.plant_id for schedule, _ in due_watering + due_fertilization}
+        plants = {plant.id: plant for plant in await self.plant_repo.get_by_ids(list(plant_ids))}
+
+        tasks = []
+        for schedules, due_type, overdue_type, overdue_after_days in (
+            (due_watering, NotificationType.WATERING_DUE, NotificationType.WATERING_OVERDUE, 1),
+            (
+                due_fertilization,
+                NotificationType.FERTILIZATION_DUE,
+                NotificationType.FERTILIZATION_OVERDUE,
+                3,
+            ),
+        ):
+            for schedule, next_date in schedules:
+                plant = plants.get(schedule.plant_id)
+                if not plant:
+                    continue
+
+                days_overdue = (today - next_date).days
+                tasks.append(DueTask(due_type, plant, schedule.frequency_days, days_overdue))
+                if days_overdue > overdue_after_days:
+                    tasks.append(DueTask(overdue_type, plant, schedule.frequency_days, days_overdue))
+
+        return tasks
+
+    @staticmethod
+    def _build_notification(task: DueTask) -> NotificationCreate:
+        """Build the notification for a single plant."""
+        task_name, activity = TASK_LABELS[task.type]
+        name = task.plant.name
+
+        if task.type in OVERDUE_TYPES:
+            title = f"⚠️ {task_name} Overdue: {name}"
+            message = f"{name} is {task.days_overdue} days overdue for {activity}!"
+        else:
+            title = f"{task_name} Due: {name}"
+            message = f"{name} needs {activity} today (every {task.frequency_days} days)"
+
+        return NotificationCreate(
+            type=task.type,
+            title=title,
+            message=message,
+            plant_id=task.plant.id,
+            plant_name=name,
+        )
 
-            plant_repo = PlantRepository(self.db)
-            plant = await plant_repo.get_by_id(schedule.plant_id)
+    def _build_digests(self, tasks: list[DueTask]) -> list[NotificationCreate]:
+        """Build one notification per location and type, covering all its plants."""
+        groups: dict[tuple[NotificationType, UUID | None], list[DueTask]] = defaultdict(list)
+        for task in tasks:
+            groups[(task.type, task.plant.location_id)].append(task)
 
-            if not plant:
+        notifications = []
+        for (type_, location_id), group in groups.items():
+            if len(group) == 1:
+                notifications.append(self._build_notification(group[0]))
                 continue
 
-            # Check if we already have a notification for this plant today
-            existing_notifications = await self.notification_repo.get_all(limit=1000)
-            today_notifications = [
-                n
-                for n in existing_notifications
-                if n.plant_id == plant.id
-                and n.type == NotificationType.FERTILIZATION_DUE
-                and n.created_at.date() == date.today()
-            ]
-
-            if today_notifications:
-                continue  # Already notified today
-
-            # Create notification
-            notification_data = NotificationCreate(
-                type=NotificationType.FERTILIZATION_DUE,
-                title=f"Fertilization Due: {plant.name}",
-                message=f"{plant.name} needs fertilization today (every {schedule.frequency_days} days)",
-                plant_id=plant.id,
-                plant_name=plant.name,
+            task_name, activity = TASK_LABELS[type_]
+            location = group[0].plant.location
+            place = f"in {location.name}" if location else "without a location"
+            names = [task.plant.name for task in group]
+            listed = ", ".join(names[:DIGEST_LISTED_PLANTS])
+            if len(names) > DIGEST_LISTED_PLANTS:
+                listed += f" and {len(names) - DIGEST_LISTED_PLANTS} more"
+
+            if type_ in OVERDUE_TYPES:
+                title = f"⚠️ {task_name} Overdue: {len(group)} plants {place}"
+                message = f"{listed} are overdue for {activity}!"
+            else:
+                title = f"{task_name} Due: {len(group)} plants {place}"
+                message = f"{listed} need {activity} today"
+
+            notifications.append(
+                NotificationCreate(
+                    type=type_,
+                    title=title,
+                    message=message,
+                    location_id=location_id,
+                    plant_ids=[task.plant.id for task in group],
+                )
             )
 
-            await self.notification_repo.create(notification_data)
-            notification_count += 1
+        return notifications
 
-        # Check for overdue fertilization (more than 3 days overdue)
-        overdue_fertilization_list = (
-            await self.fertilization_repo.get_plants_due_for_fertilization(
-                days_ahead=-3
-            )
-        )
-
-        for schedule, next_date in overdue_fertilization_list:
-            # Get plant details
-            from app.repositories.plant_repository import PlantRepository
-
-            plant_repo = PlantRepository(self.db)
-            plant = await plant_repo.get_by_id(schedule.plant_id)
-
-            if not plant:
-                continue
-
-            days_overdue = (date.today() - next_date).days
-
-            # Only create overdue notification if more than 3 days overdue
-            if days_overdue <= 3:
-                continue
+    async def cleanup_old_notifications(self) -> int:
+        """
+        Apply notification retention and create upcoming monthly partitions.
 
-            # Check if we already have an overdue notification for this plant today
-            existing_notifications = await self.notification_repo.get_all(limit=1000)
-            today_notifications = [
-                n
-                for n in existing_notifications
-                if n.plant_id == plant.id
-                and n.type == NotificationType.FERTILIZATION_OVERDUE
-                and n.created_at.date() == date.today()
-            ]
-
-            if today_notifications:
-                continue  # Already notified today
-
-            # Create overdue notification
-            notification_data = NotificationCreate(
-                type=NotificationType.FERTILIZATION_OVERDUE,
-                title=f"⚠️ Fertilization Overdue: {plant.name}",
-                message=f"{plant.name} is {days_overdue} days overdue for fertilization!",
-                plant_id=plant.id,
-                plant_name=plant.name,
+        Notifications older than ``notification_retention_months`` are removed
+        by dropping their partitions, read or not. Retention runs even when
+        creating partitions fails. Returns the number of partitions dropped.
+        """
+        try:
+            created = await self.notification_repo.ensure_partitions(
+                settings.notification_partitions_ahead
             )
+            if created:
+                logger.info(f"Created notification partitions: {', '.join(created)}")
+        except Exception as e:
+            logger.error(f"Failed to create notification partitions: {e}", exc_info=True)
 
-            await self.notification_repo.create(notification_data)
-            notification_count += 1
-
-        return notification_count
+        dropped = await self.notification_repo.drop_expired_partitions(
+            settings.notification_retention_months, settings.notification_cleanup_batch_size
+        )
+        if dropped:
+            logger.info(f"Dropped expired notification partitions: {', '.join(dropped)}")
 
-    async def cleanup_old_notifications(self, days: int = 30) -> int:
-        """Clean up old read notifications."""
-        return await self.notification_repo.delete_old_read_notifications(days)
+        return len(dropped)
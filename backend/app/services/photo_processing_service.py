@@ -0,0 +1,112 @@
+"""Service for background photo post-processing."""
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.metrics import THUMBNAIL_DURATION
+from app.models.photo import PhotoProcessingStatus
+from app.models.photo_job import PhotoJob
+from app.repositories.photo_job_repository import PhotoJobRepository
+from app.repositories.photo_repository import PhotoRepository
+from app.storage import StorageBackend, get_storage
+from app.utils.image_processor import process_image_async
+
+logger = logging.getLogger(__name__)
+
+
+class PhotoProcessingService:
+    """Service that normalizes queued photos and extracts their metadata."""
+
+    THUMBNAIL_PREFIX = "thumbnails"
+    UPRIGHT_PREFIX = "upright"
+    THUMBNAIL_SIZE = (300, 300)
+
+    def __init__(self, db: AsyncSession, storage: StorageBackend | None = None):
+        """Initialize the service."""
+        self.db = db
+        self.photo_repo = PhotoRepository(db)
+        self.job_repo = PhotoJobRepository(db)
+        self.storage = storage or get_storage()
+
+    @classmethod
+    def thumbnail_key_for(cls, file_key: str) -> str:
+        """Get the thumbnail storage key for an original's key."""
+        return f"{cls.THUMBNAIL_PREFIX}/thumb_{file_key.rsplit('/', 1)[-1]}"
+
+    @classmethod
+    def upright_key_for(cls, file_key: str) -> str:
+        """Get the storage key of the upright copy of an original."""
+        return f"{cls.UPRIGHT_PREFIX}/upright_{file_key.rsplit('/', 1)[-1]}"
+
+    async def process_job(self, job: PhotoJob) -> bool:
+        """
+        Process a claimed job.
+
+        On failure the job is retried with exponential backoff until
+        ``photo_job_max_attempts`` is reached, then the photo is marked failed.
+        Returns True if the photo was processed successfully.
+        """
+        photo = await self.photo_repo.get_by_id(job.photo_id)
+        if not photo:
+            # Photo was deleted while queued
+            await self.job_repo.complete(job.id)
+            await self.db.commit()
+            return False
+
+        photo.processing_status = PhotoProcessingStatus.PROCESSING.value
+        await self.db.commit()
+
+        try:
+            content = await self.storage.read(photo.file_path)
+            with THUMBNAIL_DURATION.time():
+                image = await process_image_async(content, self.THUMBNAIL_SIZE)
+            mime_type = image.mime_type or photo.mime_type
+
+            thumbnail_key = self.thumbnail_key_for(photo.file_path)
+            await self.storage.save(thumbnail_key, image.thumbnail, content_type=mime_type)
+
+            # Served instead of the original, which is kept as uploaded, so clients can ignore EXIF
+            upright_key = None
+            if image.upright is not None:
+                upright_key = self.upright_key_for(photo.file_path)
+                await self.storage.save(upright_key, image.upright, content_type=mime_type)
+        except Exception as e:
+            await self._handle_failure(job, photo, str(e) or type(e).__name__)
+            return False
+
+        # A capture time entered by the user takes precedence over EXIF
+        if photo.taken_at is None:
+            photo.taken_at = image.taken_at
+        if image.latitude is not None and image.longitude is not None:
+            photo.latitude = image.latitude
+            photo.longitude = image.longitude
+        photo.width = image.width
+        photo.height = image.height
+        photo.mime_type = mime_type
+        photo.thumbnail_path = thumbnail_key
+        photo.upright_path = upright_key
+        photo.processing_status = PhotoProcessingStatus.READY.value
+        await self.job_repo.complete(job.id)
+        await self.db.commit()
+        return True
+
+    async def _handle_failure(self, job: PhotoJob, photo, error: str) -> None:
+        """Schedule a retry for a failed job, or give up after the last attempt."""
+        if job.attempts >= settings.photo_job_max_attempts:
+            logger.error(f"Photo {photo.id} failed processing after {job.attempts} attempts: {error}")
+            await self.job_repo.fail(job.id, error)
+            photo.processing_status = PhotoProcessingStatus.FAILED.value
+        else:
+            delay = settings.photo_job_retry_base_seconds * 2 ** (job.attempts - 1)
+            logger.warning(
+                f"Photo {photo.id} processing attempt {job.attempts} failed, "
+                f"retrying in {delay}s: {error}"
+            )
+            await self.job_repo.retry_later(
+                job.id, datetime.utcnow() + timedelta(seconds=delay), error
+            )
+            photo.processing_status = PhotoProcessingStatus.PENDING.value
+
+        await self.db.commit()
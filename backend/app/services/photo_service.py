@@ -1,37 +1,47 @@
 """Service for photo operations."""
-import os
+import asyncio
+import logging
+import mimetypes
 import uuid
 from pathlib import Path
 from uuid import UUID
 
 from fastapi import HTTPException, UploadFile
-from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.metrics import PHOTO_UPLOAD_BYTES
+from app.repositories.photo_job_repository import PhotoJobRepository
 from app.repositories.photo_repository import PhotoRepository
 from app.repositories.plant_repository import PlantRepository
-from app.schemas.photo import PhotoResponse, PhotoUpdate
+from app.schemas.photo import (
+    PhotoBatchUploadResponse,
+    PhotoProcessingStatusResponse,
+    PhotoResponse,
+    PhotoUpdate,
+    PhotoUploadResult,
+)
+from app.storage import StorageBackend, StorageError, get_storage
+from app.workers.photo_processing import photo_worker
+
+logger = logging.getLogger(__name__)
 
 
 class PhotoService:
     """Service for photo business logic."""
 
     # Configuration
-    UPLOAD_DIR = Path("uploads/photos")
-    THUMBNAIL_DIR = Path("uploads/thumbnails")
+    PHOTO_PREFIX = "photos"
     ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-    THUMBNAIL_SIZE = (300, 300)
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, storage: StorageBackend | None = None):
         """Initialize the service."""
         self.db = db
         self.photo_repo = PhotoRepository(db)
         self.plant_repo = PlantRepository(db)
-
-        # Ensure upload directories exist
-        self.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-        self.THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
+        self.job_repo = PhotoJobRepository(db)
+        self.storage = storage or get_storage()
 
     async def get_photo_by_id(self, photo_id: UUID) -> PhotoResponse:
         """Get a photo by ID."""
@@ -53,12 +63,144 @@ class PhotoService:
     async def upload_photo(
         self, plant_id: UUID, file: UploadFile, caption: str | None = None
     ) -> PhotoResponse:
-        """Upload a photo for a plant."""
+        """
+        Upload a photo for a plant.
+
+        Returns once the original is stored; thumbnail rendering is queued for
+        the photo processing worker and tracked by ``processing_status``.
+        """
+        # Verify plant exists
+        plant = await self.plant_repo.get_by_id(plant_id)
+        if not plant:
+            raise HTTPException(status_code=404, detail="Plant not found")
+
+        content, file_ext = await self._read_upload(file)
+        file_key = self._generate_key(file_ext)
+        mime_type = self._guess_mime_type(file)
+
+        try:
+            # Save original file
+            await self.storage.save(file_key, content, content_type=mime_type)
+
+            # Create database record and its processing job in one transaction
+            photo = await self.photo_repo.create(
+                plant_id=plant_id,
+                file_path=file_key,
+                thumbnail_path=None,
+                original_filename=file.filename or file_key.rsplit("/", 1)[-1],
+                file_size=len(content),
+                mime_type=mime_type,
+                width=None,
+                height=None,
+                caption=caption,
+            )
+            await self.job_repo.enqueue([photo.id])
+            await self.db.commit()
+
+        except Exception as e:
+            # Clean up files if database operation fails
+            await self._delete_files(file_key)
+            raise HTTPException(status_code=500, detail=f"Failed to upload photo: {str(e)}")
+
+        photo_worker.wake()
+        return PhotoResponse.model_validate(photo)
+
+    async def upload_photos(
+        self, plant_id: UUID, files: list[UploadFile], caption: str | None = None
+    ) -> PhotoBatchUploadResponse:
+        """
+        Upload several photos for a plant in one request.
+
+        The plant is looked up once, originals are stored concurrently, and all
+        photo rows and processing jobs are inserted with one statement each.
+        Files that fail validation or storage are reported individually.
+        """
+        if len(files) > settings.max_batch_upload_files:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many files. Maximum per batch: {settings.max_batch_upload_files}",
+            )
+
         # Verify plant exists
         plant = await self.plant_repo.get_by_id(plant_id)
         if not plant:
             raise HTTPException(status_code=404, detail="Plant not found")
 
+        results = [PhotoUploadResult(filename=file.filename or "") for file in files]
+
+        async def store(index: int, file: UploadFile) -> dict | None:
+            try:
+                content, file_ext = await self._read_upload(file)
+            except HTTPException as e:
+                results[index].error = e.detail
+                return None
+
+            file_key = self._generate_key(file_ext)
+            mime_type = self._guess_mime_type(file)
+            try:
+                await self.storage.save(file_key, content, content_type=mime_type)
+            except StorageError as e:
+                results[index].error = f"Failed to store photo: {str(e)}"
+                return None
+
+            return {
+                "index": index,
+                "plant_id": plant_id,
+                "file_path": file_key,
+                "thumbnail_path": None,
+                "original_filename": file.filename or file_key.rsplit("/", 1)[-1],
+                "file_size": len(content),
+                "mime_type": mime_type,
+                "caption": caption,
+            }
+
+        stored = [
+            row
+            for row in await asyncio.gather(
+                *(store(index, file) for index, file in enumerate(files))
+            )
+            if row is not None
+        ]
+
+        if stored:
+            indexes = [row.pop("index") for row in stored]
+            try:
+                photos = await self.photo_repo.create_many(stored)
+                await self.job_repo.enqueue([photo.id for photo in photos])
+                await self.db.commit()
+            except Exception as e:
+                await self._delete_files(*(row["file_path"] for row in stored))
+                raise HTTPException(
+                    status_code=500, detail=f"Failed to upload photos: {str(e)}"
+                )
+
+            for index, photo in zip(indexes, photos, strict=True):
+                results[index].success = True
+                results[index].photo = PhotoResponse.model_validate(photo)
+            photo_worker.wake()
+
+        uploaded = sum(1 for result in results if result.success)
+        return PhotoBatchUploadResponse(
+            uploaded=uploaded, failed=len(results) - uploaded, results=results
+        )
+
+    async def get_processing_status(self, photo_id: UUID) -> PhotoProcessingStatusResponse:
+        """Get the post-processing status of a photo."""
+        photo = await self.photo_repo.get_by_id(photo_id)
+        if not photo:
+            raise HTTPException(status_code=404, detail="Photo not found")
+
+        job = await self.job_repo.get_latest_by_photo_id(photo_id)
+        return PhotoProcessingStatusResponse(
+            photo_id=photo.id,
+            processing_status=photo.processing_status,
+            attempts=job.attempts if job else 0,
+            last_error=job.last_error if job else None,
+            thumbnail_path=photo.thumbnail_path,
+        )
+
+    async def _read_upload(self, file: UploadFile) -> tuple[bytes, str]:
+        """Read an uploaded file, validating its extension and size."""
         # Validate file extension
         file_ext = Path(file.filename or "").suffix.lower()
         if file_ext not in self.ALLOWED_EXTENSIONS:
@@ -69,56 +211,35 @@ class PhotoService:
 
         # Read file content
         content = await file.read()
-        file_size = len(content)
 
         # Validate file size
-        if file_size > self.MAX_FILE_SIZE:
+        if len(content) > self.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=400,
                 detail=f"File too large. Maximum size: {self.MAX_FILE_SIZE / (1024 * 1024)}MB",
             )
 
-        # Generate unique filename
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        file_path = self.UPLOAD_DIR / unique_filename
-        thumbnail_path = self.THUMBNAIL_DIR / f"thumb_{unique_filename}"
+        PHOTO_UPLOAD_BYTES.observe(len(content))
+        return content, file_ext
 
-        try:
-            # Save original file
-            with open(file_path, "wb") as f:
-                f.write(content)
-
-            # Open image and get dimensions
-            with Image.open(file_path) as img:
-                width, height = img.size
-                mime_type = Image.MIME.get(img.format, file.content_type or "image/jpeg")
-
-                # Create thumbnail
-                img.thumbnail(self.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                img.save(thumbnail_path, optimize=True, quality=85)
-
-            # Create database record
-            photo = await self.photo_repo.create(
-                plant_id=plant_id,
-                file_path=str(file_path),
-                thumbnail_path=str(thumbnail_path),
-                original_filename=file.filename or unique_filename,
-                file_size=file_size,
-                mime_type=mime_type,
-                width=width,
-                height=height,
-                caption=caption,
-            )
+    def _generate_key(self, file_ext: str) -> str:
+        """Generate a unique storage key for a photo."""
+        return f"{self.PHOTO_PREFIX}/{uuid.uuid4()}{file_ext}"
 
-            return PhotoResponse.model_validate(photo)
+    def _guess_mime_type(self, file: UploadFile) -> str:
+        """Guess the MIME type until the processing worker reads the real one."""
+        guessed, _ = mimetypes.guess_type(file.filename or "")
+        return guessed or file.content_type or "image/jpeg"
 
-        except Exception as e:
-            # Clean up files if database operation fails
-            if file_path.exists():
-                file_path.unlink()
-            if thumbnail_path.exists():
-                thumbnail_path.unlink()
-            raise HTTPException(status_code=500, detail=f"Failed to upload photo: {str(e)}")
+    async def _delete_files(self, *keys: str | None) -> None:
+        """Delete stored files, logging failures instead of raising."""
+        for key in keys:
+            if not key:
+                continue
+            try:
+                await self.storage.delete(key)
+            except StorageError as e:
+                logger.warning(f"Failed to delete photo file {key}: {e}")
 
     async def update_photo(self, photo_id: UUID, photo_data: PhotoUpdate) -> PhotoResponse:
         """Update photo metadata."""
@@ -133,19 +254,8 @@ class PhotoService:
         if not photo:
             raise HTTPException(status_code=404, detail="Photo not found")
 
-        # Delete files from filesystem
-        try:
-            file_path = Path(photo.file_path)
-            if file_path.exists():
-                file_path.unlink()
-
-            if photo.thumbnail_path:
-                thumbnail_path = Path(photo.thumbnail_path)
-                if thumbnail_path.exists():
-                    thumbnail_path.unlink()
-        except Exception as e:
-            # Log error but continue with database deletion
-            print(f"Warning: Failed to delete photo files: {str(e)}")
+        # Delete files from storage, continuing with database deletion on failure
+        await self._delete_files(photo.file_path, photo.upright_path, photo.thumbnail_path)
 
         # Delete database record
         success = await self.photo_repo.delete(photo_id)
@@ -0,0 +1,125 @@
+"""Service for reconciling stored photo files with the database."""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.repositories.photo_repository import PhotoRepository
+from app.schemas.storage import PlantStorageUsage, StorageReconciliationReport
+from app.services.photo_processing_service import PhotoProcessingService
+from app.services.photo_service import PhotoService
+from app.storage import StorageBackend, StorageError, get_storage
+
+logger = logging.getLogger(__name__)
+
+
+class StorageReconciliationService:
+    """
+    Finds orphaned files and photo rows whose files or thumbnails are missing.
+
+    Both passes work in batches of ``storage_gc_batch_size``: the storage listing
+    is consumed incrementally and the photos table is streamed with a
+    server-side cursor, so memory use does not grow with the number of files.
+    """
+
+    MISSING_KEYS_SAMPLE_SIZE = 100
+
+    def __init__(self, db: AsyncSession, storage: StorageBackend | None = None):
+        """Initialize the service."""
+        self.db = db
+        self.photo_repo = PhotoRepository(db)
+        self.storage = storage or get_storage()
+        self.batch_size = settings.storage_gc_batch_size
+
+    async def reconcile(self, dry_run: bool = False) -> StorageReconciliationReport:
+        """Remove orphaned files and report missing files and per-plant usage."""
+        report = StorageReconciliationReport(dry_run=dry_run)
+        await self._collect_orphans(report)
+        await self._check_photo_rows(report)
+        return report
+
+    async def _collect_orphans(self, report: StorageReconciliationReport) -> None:
+        """
+        Delete files no photo row references.
+
+        Files newer than the grace period are skipped: an upload stores its
+        file before the photo row is committed. At most ``storage_gc_max_deletions``
+        files are removed per run; the rest are picked up by the next run.
+        """
+        cutoff = datetime.utcnow() - timedelta(hours=settings.storage_gc_grace_hours)
+
+        for prefix in (
+            PhotoService.PHOTO_PREFIX,
+            PhotoProcessingService.UPRIGHT_PREFIX,
+            PhotoProcessingService.THUMBNAIL_PREFIX,
+        ):
+            async for batch in self.storage.iter_objects(prefix, self.batch_size):
+                report.files_scanned += len(batch)
+                referenced = await self.photo_repo.get_referenced_paths(
+                    [stored.key for stored in batch]
+                )
+
+                for stored in batch:
+                    if stored.key in referenced or stored.modified_at > cutoff:
+                        continue
+
+                    report.orphaned_files += 1
+                    report.orphaned_bytes += stored.size
+                    if report.dry_run or report.deleted_files >= settings.storage_gc_max_deletions:
+                        continue
+
+                    try:
+                        await self.storage.delete(stored.key)
+                        report.deleted_files += 1
+                    except StorageError as e:
+                        logger.warning(f"Failed to delete orphaned file {stored.key}: {e}")
+
+    async def _check_photo_rows(self, report: StorageReconciliationReport) -> None:
+        """Find photo rows whose files or thumbnails are missing and total storage per plant."""
+        usage: dict = {}
+
+        async for rows in self.photo_repo.stream_storage_rows(self.batch_size):
+            report.photos_scanned += len(rows)
+            upright_rows = [row for row in rows if row.upright_path is not None]
+            thumbnail_rows = [row for row in rows if row.thumbnail_path is not None]
+            exists, uprights_exist, thumbnails_exist = await asyncio.gather(
+                asyncio.gather(*(self.storage.exists(row.file_path) for row in rows)),
+                asyncio.gather(*(self.storage.exists(row.upright_path) for row in upright_rows)),
+                asyncio.gather(
+                    *(self.storage.exists(row.thumbnail_path) for row in thumbnail_rows)
+                ),
+            )
+
+            # The upright copy is the file served in place of the original
+            for row, upright_exists in zip(upright_rows, uprights_exist, strict=True):
+                if not upright_exists:
+                    report.missing_files += 1
+                    if len(report.missing_file_keys) < self.MISSING_KEYS_SAMPLE_SIZE:
+                        report.missing_file_keys.append(row.upright_path)
+
+            for row, thumbnail_exists in zip(thumbnail_rows, thumbnails_exist, strict=True):
+                if not thumbnail_exists:
+                    report.missing_thumbnails += 1
+                    if len(report.missing_thumbnail_keys) < self.MISSING_KEYS_SAMPLE_SIZE:
+                        report.missing_thumbnail_keys.append(row.thumbnail_path)
+
+            for row, file_exists in zip(rows, exists, strict=True):
+                if not file_exists:
+                    report.missing_files += 1
+                    if len(report.missing_file_keys) < self.MISSING_KEYS_SAMPLE_SIZE:
+                        report.missing_file_keys.append(row.file_path)
+                    continue
+
+                photo_count, total_bytes = usage.get(row.plant_id, (0, 0))
+                usage[row.plant_id] = (photo_count + 1, total_bytes + row.file_size)
+
+        report.usage_by_plant = sorted(
+            (
+                PlantStorageUsage(plant_id=plant_id, photo_count=photo_count, bytes=total_bytes)
+                for plant_id, (photo_count, total_bytes) in usage.items()
+            ),
+            key=lambda plant_usage: plant_usage.bytes,
+            reverse=True,
+        )
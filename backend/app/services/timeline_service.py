@@ -2,7 +2,9 @@
 Timeline service for aggregating plant activities
 """
 
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import select
@@ -15,11 +17,23 @@ from app.models.growth_log import GrowthLog
 from app.models.photo import Photo
 
 
+@dataclass(slots=True)
+class TimelineEntry:
+    """A plant activity, serialized as a ``TimelineItem``."""
+
+    id: str
+    type: str
+    timestamp: datetime
+    title: str
+    description: str
+    details: dict[str, Any]
+
+
 class TimelineService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_plant_timeline(self, plant_id: UUID) -> list[dict]:
+    async def get_plant_timeline(self, plant_id: UUID) -> list[TimelineEntry]:
         """
         Get timeline of all activities for a plant, sorted chronologically
         """
@@ -36,17 +50,17 @@ class TimelineService:
 
         for log in watering_logs:
             timeline_items.append(
-                {
-                    "id": str(log.id),
-                    "type": "watering",
-                    "timestamp": log.watered_at.isoformat(),
-                    "title": "Watered",
-                    "description": f"Amount: {log.amount}" if log.amount else "Watered",
-                    "details": {
+                TimelineEntry(
+                    id=str(log.id),
+                    type="watering",
+                    timestamp=log.watered_at,
+                    title="Watered",
+                    description=f"Amount: {log.amount}" if log.amount else "Watered",
+                    details={
                         "amount": log.amount,
                         "notes": log.notes,
                     },
-                }
+                )
             )
 
         # Get fertilization logs
@@ -60,20 +74,20 @@ class TimelineService:
 
         for log in fertilization_logs:
             timeline_items.append(
-                {
-                    "id": str(log.id),
-                    "type": "fertilization",
-                    "timestamp": log.fertilized_at.isoformat(),
-                    "title": "Fertilized",
-                    "description": f"Type: {log.fertilizer_type}"
+                TimelineEntry(
+                    id=str(log.id),
+                    type="fertilization",
+                    timestamp=log.fertilized_at,
+                    title="Fertilized",
+                    description=f"Type: {log.fertilizer_type}"
                     if log.fertilizer_type
                     else "Fertilized",
-                    "details": {
+                    details={
                         "fertilizer_type": log.fertilizer_type,
                         "amount": log.amount,
                         "notes": log.notes,
                     },
-                }
+                )
             )
 
         # Get treatment applications
@@ -88,22 +102,22 @@ class TimelineService:
 
         for app, treatment in treatment_applications:
             timeline_items.append(
-                {
-                    "id": str(app.id),
-                    "type": "treatment_application",
-                    "timestamp": app.applied_at.isoformat(),
-                    "title": f"Treatment Applied: {treatment.issue_name}",
-                    "description": f"Product: {treatment.product_name}"
+                TimelineEntry(
+                    id=str(app.id),
+                    type="treatment_application",
+                    timestamp=app.applied_at,
+                    title=f"Treatment Applied: {treatment.issue_name}",
+                    description=f"Product: {treatment.product_name}"
                     if treatment.product_name
                     else f"Treating {treatment.issue_name}",
-                    "details": {
-                        "treatment_id": str(treatment.id),
+                    details={
+                        "treatment_id": treatment.id,
                         "issue_type": treatment.issue_type,
                         "issue_name": treatment.issue_name,
                         "product_name": treatment.product_name,
                         "notes": app.notes,
                     },
-                }
+                )
             )
 
         # Get treatments (start/end events)
@@ -116,43 +130,43 @@ class TimelineService:
         for treatment in treatments:
             # Treatment start
             timeline_items.append(
-                {
-                    "id": str(treatment.id) + "_start",
-                    "type": "treatment_start",
-                    "timestamp": datetime.combine(
+                TimelineEntry(
+                    id=str(treatment.id) + "_start",
+                    type="treatment_start",
+                    timestamp=datetime.combine(
                         treatment.start_date, datetime.min.time()
-                    ).isoformat(),
-                    "title": f"Treatment Started: {treatment.issue_name}",
-                    "description": f"{treatment.issue_type} - {treatment.treatment_type}",
-                    "details": {
-                        "treatment_id": str(treatment.id),
+                    ),
+                    title=f"Treatment Started: {treatment.issue_name}",
+                    description=f"{treatment.issue_type} - {treatment.treatment_type}",
+                    details={
+                        "treatment_id": treatment.id,
                         "issue_type": treatment.issue_type,
                         "issue_name": treatment.issue_name,
                         "treatment_type": treatment.treatment_type,
                         "product_name": treatment.product_name,
                         "status": treatment.status,
                     },
-                }
+                )
             )
 
             # Treatment end
             if treatment.end_date:
                 timeline_items.append(
-                    {
-                        "id": str(treatment.id) + "_end",
-                        "type": "treatment_end",
-                        "timestamp": datetime.combine(
+                    TimelineEntry(
+                        id=str(treatment.id) + "_end",
+                        type="treatment_end",
+                        timestamp=datetime.combine(
                             treatment.end_date, datetime.min.time()
-                        ).isoformat(),
-                        "title": f"Treatment Ended: {treatment.issue_name}",
-                        "description": f"Status: {treatment.status}",
-                        "details": {
-                            "treatment_id": str(treatment.id),
+                        ),
+                        title=f"Treatment Ended: {treatment.issue_name}",
+                        description=f"Status: {treatment.status}",
+                        details={
+                            "treatment_id": treatment.id,
                             "issue_type": treatment.issue_type,
                             "issue_name": treatment.issue_name,
                             "status": treatment.status,
                         },
-                    }
+                    )
                 )
 
         # Get growth logs
@@ -176,49 +190,49 @@ class TimelineService:
                 description += f" - {log.health_status.capitalize()}"
 
             timeline_items.append(
-                {
-                    "id": str(log.id),
-                    "type": "growth_log",
-                    "timestamp": log.measured_at.isoformat(),
-                    "title": "Growth Measured",
-                    "description": description,
-                    "details": {
+                TimelineEntry(
+                    id=str(log.id),
+                    type="growth_log",
+                    timestamp=log.measured_at,
+                    title="Growth Measured",
+                    description=description,
+                    details={
                         "height_cm": log.height_cm,
                         "width_cm": log.width_cm,
                         "health_status": log.health_status,
                         "notes": log.notes,
-                        "photo_id": str(log.photo_id) if log.photo_id else None,
+                        "photo_id": log.photo_id,
                     },
-                }
+                )
             )
 
         # Get photos
         photo_query = (
             select(Photo)
             .where(Photo.plant_id == plant_id)
-            .order_by(Photo.created_at.desc())
+            .order_by(Photo.taken_at.desc().nulls_last(), Photo.created_at.desc())
         )
         photo_result = await self.db.execute(photo_query)
         photos = photo_result.scalars().all()
 
         for photo in photos:
             timeline_items.append(
-                {
-                    "id": str(photo.id),
-                    "type": "photo",
-                    "timestamp": photo.created_at.isoformat(),
-                    "title": "Photo Added",
-                    "description": photo.caption if photo.caption else "Photo uploaded",
-                    "details": {
-                        "photo_id": str(photo.id),
+                TimelineEntry(
+                    id=str(photo.id),
+                    type="photo",
+                    timestamp=(photo.taken_at or photo.created_at),
+                    title="Photo Added",
+                    description=photo.caption if photo.caption else "Photo uploaded",
+                    details={
+                        "photo_id": photo.id,
                         "caption": photo.caption,
                         "file_path": photo.file_path,
                         "thumbnail_path": photo.thumbnail_path,
                     },
-                }
+                )
             )
 
         # Sort all timeline items by timestamp (most recent first)
-        timeline_items.sort(key=lambda x: x["timestamp"], reverse=True)
+        timeline_items.sort(key=lambda x: x.timestamp, reverse=True)
 
         return timeline_items
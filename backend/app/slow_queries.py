@@ -0,0 +1,262 @@
+"""
+Slow query log.
+
+Statements slower than ``slow_query_threshold_ms`` are kept in a per-process
+ring buffer with their normalized SQL, parameters, the repository (or
+other app) method that ran them and the active trace id. A sample of them, set by
+``slow_query_explain_sample_rate``, also gets an ``EXPLAIN (ANALYZE, BUFFERS)``
+plan, captured in the background on a separate connection and rolled back.
+Statements that write, lock rows or have side effects are only ``EXPLAIN``ed.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import random
+import re
+import sys
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from types import FrameType
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.metrics import DB_SLOW_QUERIES
+from app.tracing import current_trace_id
+
+try:
+    import greenlet
+except ImportError:  # pragma: no cover - installed with sqlalchemy[asyncio]
+    greenlet = None
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = str(Path(__file__).resolve().parent)
+REPOSITORY_DIR = str(Path(APP_DIR) / "repositories")
+# Frames of the instrumentation itself are never the caller
+_OWN_FILES = {__file__, str(Path(APP_DIR) / "query_stats.py"), str(Path(APP_DIR) / "database.py")}
+
+MAX_STATEMENT_LENGTH = 10_000
+MAX_PARAMETER_LENGTH = 200
+
+# Re-running these with ANALYZE could write, take locks or notify listeners
+_UNSAFE_TO_ANALYZE = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|COPY|CALL|SHARE|pg_\w*advisory\w*|pg_notify|nextval|setval)\b",
+    re.IGNORECASE,
+)
+
+_explaining: contextvars.ContextVar[bool] = contextvars.ContextVar("explaining", default=False)
+
+
+class PlanStatus(str, Enum):
+    """Whether a plan was captured for a slow query."""
+
+    NOT_SAMPLED = "not_sampled"
+    PENDING = "pending"
+    CAPTURED = "captured"
+    FAILED = "failed"
+
+
+@dataclass
+class SlowQuery:
+    """A statement that exceeded the slow query threshold."""
+
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: list[str] | None
+    caller: str | None
+    trace_id: str | None = None
+    plan_status: PlanStatus = PlanStatus.NOT_SAMPLED
+    plan: str | None = None
+    plan_error: str | None = None
+
+
+@dataclass
+class SlowQueryGroup:
+    """Slow queries sharing the same normalized statement."""
+
+    statement: str
+    last_seen: datetime
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    callers: list[str] = field(default_factory=list)
+    plan: str | None = None
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse whitespace and replace literals and placeholder lists with ``?``."""
+    sql = re.sub(r"\s+", " ", statement).strip()
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\$\d+|%\(\w+\)s|(?<![\w$.])\d+(?:\.\d+)?\b", "?", sql)
+    # IN (?, ?, ?) and multi-row VALUES differ only in their length
+    sql = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(?, ...)", sql)
+    sql = re.sub(r"(\(\?, \.\.\.\))(?:\s*,\s*\(\?, \.\.\.\))+", r"\1, ...", sql)
+    return sql[:MAX_STATEMENT_LENGTH]
+
+
+def _format_parameters(parameters) -> list[str] | None:
+    if not settings.slow_query_log_parameters or parameters is None:
+        return None
+    values = parameters.values() if isinstance(parameters, dict) else parameters
+    formatted = []
+    for value in values:
+        if isinstance(value, bytes | bytearray | memoryview):
+            formatted.append(f"<{len(value)} bytes>")
+        else:
+            formatted.append(repr(value)[:MAX_PARAMETER_LENGTH])
+    return formatted
+
+
+def _frames() -> list[FrameType]:
+    """
+    Frames of the current call stack, innermost first.
+
+    Under the async engine, statements run in a greenlet started by
+    ``greenlet_spawn``. Its stack ends there, so the awaiting coroutines are
+    found through the parent greenlet, which is suspended in ``greenlet_spawn``.
+    """
+    frames = []
+    frame = sys._getframe(1)
+    current = greenlet.getcurrent() if greenlet else None
+    while True:
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        current = current.parent if current is not None else None
+        if current is None or current.gr_frame is None:
+            return frames
+        frame = current.gr_frame
+
+
+def find_caller() -> str | None:
+    """The innermost repository method on the stack, else the innermost app function."""
+    app_frame = None
+    for frame in _frames():
+        filename = frame.f_code.co_filename
+        if not filename.startswith(APP_DIR) or filename in _OWN_FILES:
+            continue
+        if filename.startswith(REPOSITORY_DIR):
+            app_frame = frame
+            break
+        app_frame = app_frame or frame
+
+    if app_frame is None:
+        return None
+    code = app_frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{app_frame.f_lineno})"
+
+
+class SlowQueryLog:
+    """Ring buffer of the latest slow queries in this process."""
+
+    def __init__(self, size: int):
+        self._entries: deque[SlowQuery] = deque(maxlen=size)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._explain_tasks: set[asyncio.Task] = set()
+
+    def observe(self, statement: str, parameters, elapsed: float) -> None:
+        """Record a statement if it took longer than the threshold."""
+        threshold = settings.slow_query_threshold_ms
+        if threshold is None or elapsed * 1000 < threshold or _explaining.get():
+            return
+
+        entry = SlowQuery(
+            id=next(self._ids),
+            recorded_at=datetime.utcnow(),
+            duration_ms=round(elapsed * 1000, 3),
+            statement=normalize_sql(statement),
+            parameters=_format_parameters(parameters),
+            caller=find_caller(),
+            trace_id=current_trace_id(),
+        )
+        with self._lock:
+            self._entries.append(entry)
+        DB_SLOW_QUERIES.inc()
+        logger.warning(
+            f"Slow query ({entry.duration_ms:.0f}ms) from {entry.caller or 'unknown'}: "
+            f"{entry.statement[:200]}"
+        )
+
+        if random.random() < settings.slow_query_explain_sample_rate:
+            self._schedule_explain(entry, statement, parameters)
+
+    def _schedule_explain(self, entry: SlowQuery, statement: str, parameters) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Sync engine outside the event loop
+        if len(self._explain_tasks) >= settings.slow_query_max_concurrent_explains:
+            return
+
+        entry.plan_status = PlanStatus.PENDING
+        # A fresh context, so the EXPLAIN is not counted against the request
+        task = loop.create_task(
+            self._explain(entry, statement, parameters), context=contextvars.Context()
+        )
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    async def _explain(self, entry: SlowQuery, statement: str, parameters) -> None:
+        from app import database
+
+        _explaining.set(True)
+        options = "ANALYZE, BUFFERS" if not _UNSAFE_TO_ANALYZE.search(statement) else "COSTS"
+        timeout_ms = int(settings.slow_query_explain_timeout_seconds * 1000)
+        try:
+            async with database.engine.connect() as connection:
+                # Never committed: the transaction is rolled back when the connection closes
+                await connection.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN ({options}) {statement}",
+                    tuple(parameters) if isinstance(parameters, list) else parameters,
+                )
+                entry.plan = "\n".join(row[0] for row in result)
+            entry.plan_status = PlanStatus.CAPTURED
+        except Exception as e:
+            entry.plan_error = str(e)[:500]
+            entry.plan_status = PlanStatus.FAILED
+            logger.info(f"Could not explain slow query {entry.id}: {e}")
+
+    def entries(self, limit: int | None = None, caller: str | None = None) -> list[SlowQuery]:
+        """Recorded slow queries, newest first."""
+        with self._lock:
+            entries = list(reversed(self._entries))
+        if caller:
+            entries = [entry for entry in entries if entry.caller and caller in entry.caller]
+        return entries[:limit]
+
+    def top(self, limit: int = 20) -> list["SlowQueryGroup"]:
+        """Recorded slow queries grouped by normalized statement, by total time."""
+        groups: dict[str, SlowQueryGroup] = {}
+        for entry in self.entries():
+            group = groups.get(entry.statement)
+            if group is None:
+                # Entries are newest first, so the first one seen has the latest plan
+                group = groups[entry.statement] = SlowQueryGroup(
+                    statement=entry.statement, last_seen=entry.recorded_at
+                )
+            group.count += 1
+            group.total_ms += entry.duration_ms
+            group.max_ms = max(group.max_ms, entry.duration_ms)
+            if entry.caller and entry.caller not in group.callers:
+                group.callers.append(entry.caller)
+            if group.plan is None and entry.plan is not None:
+                group.plan = entry.plan
+        return sorted(groups.values(), key=lambda group: group.total_ms, reverse=True)[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(settings.slow_query_log_size)
@@ -0,0 +1,52 @@
+"""File storage backends."""
+
+from functools import lru_cache
+
+from app.config import settings
+from app.storage.base import StorageBackend, StorageError, StoredObject
+from app.storage.local import LocalStorage
+
+
+@lru_cache
+def get_storage() -> StorageBackend:
+    """Get the process-wide storage backend configured in settings."""
+    if settings.storage_backend == "local":
+        return LocalStorage(settings.upload_dir)
+
+    if settings.storage_backend == "s3":
+        from app.storage.s3 import S3Storage
+
+        endpoint_url = settings.minio_endpoint
+        if endpoint_url and "://" not in endpoint_url:
+            scheme = "https" if settings.minio_secure else "http"
+            endpoint_url = f"{scheme}://{endpoint_url}"
+
+        return S3Storage(
+            endpoint_url=endpoint_url,
+            bucket=settings.minio_bucket,
+            access_key=settings.minio_access_key,
+            secret_key=settings.minio_secret_key,
+            region=settings.minio_region,
+            max_pool_connections=settings.storage_max_pool_connections,
+            multipart_threshold=settings.storage_multipart_threshold_mb * 1024 * 1024,
+            presigned_url_expiry=settings.storage_presigned_url_expiry_seconds,
+        )
+
+    raise ValueError(f"Unknown storage backend: {settings.storage_backend}")
+
+
+async def close_storage() -> None:
+    """Close the storage backend if it has been created."""
+    if get_storage.cache_info().currsize:
+        await get_storage().close()
+        get_storage.cache_clear()
+
+
+__all__ = [
+    "StorageBackend",
+    "StorageError",
+    "StoredObject",
+    "LocalStorage",
+    "get_storage",
+    "close_storage",
+]
@@ -0,0 +1,73 @@
+"""Storage backend interface for uploaded files."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+
+class StorageError(Exception):
+    """Raised when a storage backend operation fails."""
+
+
+@dataclass
+class StoredObject:
+    """A file found while listing a storage backend."""
+
+    key: str
+    size: int
+    modified_at: datetime
+
+
+class StorageBackend(ABC):
+    """
+    Abstract storage backend.
+
+    Files are addressed by keys such as ``photos/<uuid>.jpg``. Keys are what
+    gets persisted in the database, so they must not depend on the backend.
+    """
+
+    @abstractmethod
+    async def save(self, key: str, data: bytes, content_type: str | None = None) -> None:
+        """Store ``data`` under ``key``, replacing any existing object."""
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes:
+        """Read the object stored under ``key``."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete the object stored under ``key``. Missing objects are ignored."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check whether an object exists under ``key``."""
+
+    @abstractmethod
+    def iter_objects(
+        self, prefix: str, batch_size: int = 1000
+    ) -> AsyncIterator[list[StoredObject]]:
+        """
+        List objects under ``prefix`` in batches of at most ``batch_size``.
+
+        Listing is incremental, so callers never hold the full listing in memory.
+        """
+
+    async def presigned_url(
+        self, key: str, content_type: str | None = None, expires_in: int | None = None
+    ) -> str | None:
+        """
+        Get a time-limited download URL for ``key``.
+
+        Returns None when the backend cannot serve files directly, in which case
+        the API streams the file itself.
+        """
+        return None
+
+    def local_path(self, key: str) -> Path | None:
+        """Get the filesystem path for ``key`` if the backend is disk based."""
+        return None
+
+    async def close(self) -> None:
+        """Release any clients or connections held by the backend."""
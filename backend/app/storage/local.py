@@ -0,0 +1,94 @@
+"""Local filesystem storage backend."""
+
+import asyncio
+import itertools
+import os
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from pathlib import Path
+
+from app.storage.base import StorageBackend, StorageError, StoredObject
+
+
+class LocalStorage(StorageBackend):
+    """Stores files in a directory on the local filesystem."""
+
+    def __init__(self, root: str | Path):
+        """Initialize the backend rooted at ``root``."""
+        self.root = Path(root).resolve()
+
+    def _resolve(self, key: str) -> Path:
+        """Map a key to a path, refusing keys that escape the root directory."""
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root):
+            raise StorageError(f"Invalid storage key: {key}")
+        return path
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Write atomically: fsync a temporary file, then rename it into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    async def save(self, key: str, data: bytes, content_type: str | None = None) -> None:
+        """Store ``data`` under ``key``."""
+        await asyncio.to_thread(self._write, self._resolve(key), data)
+
+    async def read(self, key: str) -> bytes:
+        """Read the file stored under ``key``."""
+        path = self._resolve(key)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError as e:
+            raise StorageError(f"File not found: {key}") from e
+
+    async def delete(self, key: str) -> None:
+        """Delete the file stored under ``key``."""
+        path = self._resolve(key)
+        await asyncio.to_thread(path.unlink, missing_ok=True)
+
+    async def exists(self, key: str) -> bool:
+        """Check whether a file exists under ``key``."""
+        return await asyncio.to_thread(self._resolve(key).is_file)
+
+    def _scan(self, directory: Path) -> Iterator[StoredObject]:
+        """Walk ``directory`` depth-first with ``os.scandir``, yielding files lazily."""
+        pending = [directory]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        yield StoredObject(
+                            key=Path(entry.path).relative_to(self.root).as_posix(),
+                            size=stat.st_size,
+                            modified_at=datetime.utcfromtimestamp(stat.st_mtime),
+                        )
+
+    async def iter_objects(
+        self, prefix: str, batch_size: int = 1000
+    ) -> AsyncIterator[list[StoredObject]]:
+        """List files under ``prefix`` in batches."""
+        scanner = self._scan(self._resolve(prefix))
+        while batch := await asyncio.to_thread(
+            lambda: list(itertools.islice(scanner, batch_size))
+        ):
+            yield batch
+
+    def local_path(self, key: str) -> Path:
+        """Get the filesystem path for ``key``."""
+        return self._resolve(key)
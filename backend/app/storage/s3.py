@@ -0,0 +1,211 @@
+"""S3-compatible (MinIO, AWS S3) storage backend."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+
+from app.storage.base import StorageBackend, StorageError, StoredObject
+
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+    from botocore.exceptions import ClientError
+except ImportError:  # pragma: no cover - optional dependency
+    AioConfig = None
+    get_session = None
+    ClientError = Exception
+
+# S3 rejects multipart parts smaller than 5MB (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3Storage(StorageBackend):
+    """
+    Stores files in an S3-compatible bucket.
+
+    A single client is shared per process; its connection pool is sized by
+    ``max_pool_connections``. Payloads above ``multipart_threshold`` bytes are
+    uploaded as concurrent multipart parts.
+    """
+
+    def __init__(
+        self,
+        endpoint_url: str | None,
+        bucket: str,
+        access_key: str | None,
+        secret_key: str | None,
+        region: str = "us-east-1",
+        max_pool_connections: int = 20,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        multipart_concurrency: int = 4,
+        presigned_url_expiry: int = 3600,
+    ):
+        """Initialize the backend. The client is created lazily on first use."""
+        if get_session is None:
+            raise RuntimeError(
+                "S3 storage requires the 'aiobotocore' package. "
+                "Install it with: poetry install --extras s3"
+            )
+
+        self.endpoint_url = endpoint_url
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.max_pool_connections = max_pool_connections
+        self.multipart_threshold = max(multipart_threshold, MIN_PART_SIZE)
+        self.multipart_concurrency = multipart_concurrency
+        self.presigned_url_expiry = presigned_url_expiry
+
+        self._exit_stack: AsyncExitStack | None = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """Get the shared client, creating it on first use."""
+        if self._client is not None:
+            return self._client
+
+        async with self._client_lock:
+            if self._client is None:
+                exit_stack = AsyncExitStack()
+                session = get_session()
+                self._client = await exit_stack.enter_async_context(
+                    session.create_client(
+                        "s3",
+                        endpoint_url=self.endpoint_url,
+                        region_name=self.region,
+                        aws_access_key_id=self.access_key,
+                        aws_secret_access_key=self.secret_key,
+                        config=AioConfig(
+                            max_pool_connections=self.max_pool_connections,
+                            signature_version="s3v4",
+                            s3={"addressing_style": "path"},
+                        ),
+                    )
+                )
+                self._exit_stack = exit_stack
+
+        return self._client
+
+    async def save(self, key: str, data: bytes, content_type: str | None = None) -> None:
+        """Store ``data`` under ``key``."""
+        client = await self._get_client()
+        extra_args = {"ContentType": content_type} if content_type else {}
+
+        try:
+            if len(data) <= self.multipart_threshold:
+                await client.put_object(Bucket=self.bucket, Key=key, Body=data, **extra_args)
+            else:
+                await self._multipart_upload(client, key, data, extra_args)
+        except ClientError as e:
+            raise StorageError(f"Failed to store {key}: {e}") from e
+
+    async def _multipart_upload(self, client, key: str, data: bytes, extra_args: dict) -> None:
+        """Upload ``data`` in parts, aborting the upload if any part fails."""
+        upload = await client.create_multipart_upload(Bucket=self.bucket, Key=key, **extra_args)
+        upload_id = upload["UploadId"]
+        semaphore = asyncio.Semaphore(self.multipart_concurrency)
+
+        async def upload_part(part_number: int, offset: int) -> dict:
+            async with semaphore:
+                response = await client.upload_part(
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data[offset : offset + self.multipart_threshold],
+                )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        try:
+            parts = await asyncio.gather(
+                *(
+                    upload_part(part_number, offset)
+                    for part_number, offset in enumerate(
+                        range(0, len(data), self.multipart_threshold), start=1
+                    )
+                )
+            )
+            await client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except BaseException:
+            await client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            raise
+
+    async def read(self, key: str) -> bytes:
+        """Read the object stored under ``key``."""
+        client = await self._get_client()
+        try:
+            response = await client.get_object(Bucket=self.bucket, Key=key)
+            async with response["Body"] as stream:
+                return await stream.read()
+        except ClientError as e:
+            raise StorageError(f"Failed to read {key}: {e}") from e
+
+    async def delete(self, key: str) -> None:
+        """Delete the object stored under ``key``."""
+        client = await self._get_client()
+        try:
+            await client.delete_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            raise StorageError(f"Failed to delete {key}: {e}") from e
+
+    async def exists(self, key: str) -> bool:
+        """Check whether an object exists under ``key``."""
+        client = await self._get_client()
+        try:
+            await client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise StorageError(f"Failed to check {key}: {e}") from e
+
+    async def iter_objects(
+        self, prefix: str, batch_size: int = 1000
+    ) -> AsyncIterator[list[StoredObject]]:
+        """List objects under ``prefix`` one page at a time."""
+        client = await self._get_client()
+        paginator = client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=prefix.rstrip("/") + "/",
+            PaginationConfig={"PageSize": min(batch_size, 1000)},
+        )
+        async for page in pages:
+            batch = [
+                StoredObject(
+                    key=item["Key"],
+                    size=item["Size"],
+                    modified_at=item["LastModified"].replace(tzinfo=None),
+                )
+                for item in page.get("Contents", [])
+            ]
+            if batch:
+                yield batch
+
+    async def presigned_url(
+        self, key: str, content_type: str | None = None, expires_in: int | None = None
+    ) -> str:
+        """Get a presigned GET URL so clients download directly from the bucket."""
+        client = await self._get_client()
+        params = {"Bucket": self.bucket, "Key": key}
+        if content_type:
+            params["ResponseContentType"] = content_type
+        return await client.generate_presigned_url(
+            "get_object",
+            Params=params,
+            ExpiresIn=expires_in or self.presigned_url_expiry,
+        )
+
+    async def close(self) -> None:
+        """Close the shared client and its connection pool."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._client = None
@@ -0,0 +1,209 @@
+"""
+OpenTelemetry tracing.
+
+Disabled unless ``tracing_exporter`` is set; the spans created in app code
+are then no-ops. When enabled, requests (FastAPI), scheduled jobs, queue work
+and image processing start traces, and public service and repository methods
+and SQL statements (from the query tracking cursor hooks) add spans to them.
+Methods and statements outside any trace (queue polling, health checks) get
+no spans, so idle processes stay quiet.
+
+Exporters: ``otlp`` (OTLP over HTTP, for a collector), ``console`` (stdout)
+and ``file`` (OTLP/JSON lines in ``tracing_file_path``, for tests and local
+debugging). The SDK and instrumentations are in the ``tracing`` extra.
+"""
+
+import functools
+import importlib
+import inspect
+import logging
+import pkgutil
+import threading
+from collections.abc import Callable, Sequence
+
+from opentelemetry import trace
+
+from app.config import settings
+
+try:
+    from google.protobuf.json_format import MessageToJson
+    from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+        SpanExporter,
+        SpanExportResult,
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+except ImportError:  # pragma: no cover - optional dependency
+    TracerProvider = None
+    SpanExporter = object
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("app")
+
+# Public methods of the classes in these packages get a span per call
+INSTRUMENTED_PACKAGES = ("app.repositories", "app.services")
+EXCLUDED_URLS = "/health,/metrics"
+MAX_STATEMENT_LENGTH = 2000
+
+_provider = None
+
+
+class OTLPJsonFileSpanExporter(SpanExporter):
+    """Appends each exported batch to a file as one OTLP/JSON line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence["ReadableSpan"]) -> "SpanExportResult":
+        line = MessageToJson(encode_spans(spans), indent=None)
+        with self._lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _exporter() -> tuple["SpanExporter", bool]:
+    """Build the configured exporter and whether to batch its exports."""
+    if settings.tracing_exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        # Falls back to OTEL_EXPORTER_OTLP_ENDPOINT, then http://localhost:4318
+        endpoint = settings.tracing_otlp_endpoint
+        if endpoint:
+            endpoint = f"{endpoint.rstrip('/')}/v1/traces"
+        return OTLPSpanExporter(endpoint=endpoint), True
+    if settings.tracing_exporter == "console":
+        return ConsoleSpanExporter(), False
+    if settings.tracing_exporter == "file":
+        return OTLPJsonFileSpanExporter(settings.tracing_file_path), False
+    raise ValueError(f"Unknown tracing exporter: {settings.tracing_exporter}")
+
+
+def _traced(func: Callable, name: str) -> Callable:
+    """Wrap a method in a span, created only when a trace is already active."""
+    attributes = {"code.namespace": func.__module__, "code.function": func.__qualname__}
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not trace.get_current_span().get_span_context().is_valid:
+                return await func(*args, **kwargs)
+            with tracer.start_as_current_span(name, attributes=attributes):
+                return await func(*args, **kwargs)
+
+        wrapper = async_wrapper
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not trace.get_current_span().get_span_context().is_valid:
+                return func(*args, **kwargs)
+            with tracer.start_as_current_span(name, attributes=attributes):
+                return func(*args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def instrument_package(package_name: str) -> int:
+    """Trace the public methods of every class defined in a package. Returns the count."""
+    package = importlib.import_module(package_name)
+    count = 0
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package_name}.{module_info.name}")
+        for cls in vars(module).values():
+            if not inspect.isclass(cls) or cls.__module__ != module.__name__:
+                continue
+            for attr, value in list(vars(cls).items()):
+                if (
+                    attr.startswith("_")
+                    or not inspect.isfunction(value)
+                    or inspect.isasyncgenfunction(value)
+                    or getattr(value, "__traced__", False)
+                ):
+                    continue
+                setattr(cls, attr, _traced(value, f"{cls.__name__}.{attr}"))
+                count += 1
+    return count
+
+
+def setup_tracing(service_name: str, app=None) -> bool:
+    """
+    Configure tracing for this process, if enabled. Returns whether it is.
+
+    For the API, call it after all middleware has been added, so the request
+    span wraps them.
+    """
+    global _provider
+    if settings.tracing_exporter == "none" or _provider is not None:
+        return _provider is not None
+    if TracerProvider is None:
+        raise RuntimeError(
+            "Tracing requires the OpenTelemetry SDK. Install it with: poetry install --extras tracing"
+        )
+
+    exporter, batch = _exporter()
+    provider = TracerProvider(
+        resource=Resource.create({
+            "service.name": service_name,
+            "deployment.environment": settings.environment,
+        }),
+        sampler=ParentBased(root=TraceIdRatioBased(settings.tracing_sample_rate)),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
+    )
+    trace.set_tracer_provider(provider)
+    _provider = provider
+
+    methods = sum(instrument_package(package) for package in INSTRUMENTED_PACKAGES)
+    if app is not None:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+        FastAPIInstrumentor.instrument_app(
+            app,
+            tracer_provider=provider,
+            excluded_urls=EXCLUDED_URLS,
+            exclude_spans=["receive", "send"],
+        )
+
+    logger.info(
+        f"Tracing enabled: {settings.tracing_exporter} exporter, {methods} methods instrumented"
+    )
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop exporting."""
+    global _provider
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+
+
+def start_db_span(statement: str):
+    """Start a client span for a SQL statement, if inside a trace. The caller ends it."""
+    if _provider is None or not trace.get_current_span().get_span_context().is_valid:
+        return None
+    operation = statement.split(None, 1)[0].upper() if statement.strip() else "SQL"
+    return tracer.start_span(
+        operation,
+        kind=trace.SpanKind.CLIENT,
+        attributes={"db.system": "postgresql", "db.statement": statement[:MAX_STATEMENT_LENGTH]},
+    )
+
+
+def current_trace_id() -> str | None:
+    """Hex id of the active trace, if any."""
+    span_context = trace.get_current_span().get_span_context()
+    return format(span_context.trace_id, "032x") if span_context.is_valid else None
@@ -0,0 +1,203 @@
+"""Image processing helpers run in a process pool."""
+
+import asyncio
+import io
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime
+
+from PIL import ExifTags, Image, ImageOps
+
+from app.config import settings
+from app.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+EXIF_DATETIME_FORMAT = "%Y:%m:%d %H:%M:%S"
+
+_executor: ProcessPoolExecutor | None = None
+
+
+class ImageTooLargeError(ValueError):
+    """Raised for images with more pixels than ``image_max_pixels``."""
+
+
+@dataclass
+class ProcessedImage:
+    """Result of processing an uploaded image."""
+
+    width: int
+    height: int
+    mime_type: str | None
+    thumbnail: bytes
+    # Re-encoded upright copy, set only when EXIF orientation required a rotation
+    upright: bytes | None = None
+    taken_at: datetime | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+
+
+def _parse_exif_datetime(value) -> datetime | None:
+    """Parse an EXIF ``YYYY:MM:DD HH:MM:SS`` timestamp."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.strptime(value.strip("\x00 "), EXIF_DATETIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def _parse_gps_coordinate(value, ref, limit: float) -> float | None:
+    """
+    Convert EXIF degrees/minutes/seconds rationals to signed decimal degrees.
+
+    Returns None for values that are not finite or exceed ``limit`` degrees
+    (90 for latitude, 180 for longitude), as broken camera firmware writes.
+    """
+    try:
+        degrees, minutes, seconds = (float(part) for part in value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    coordinate = degrees + minutes / 60 + seconds / 3600
+    if not math.isfinite(coordinate) or abs(coordinate) > limit:
+        return None
+    return -coordinate if ref in ("S", "W") else coordinate
+
+
+def _read_exif(img: Image.Image) -> tuple[datetime | None, float | None, float | None]:
+    """Extract the capture time and GPS position from an image's EXIF data."""
+    exif = img.getexif()
+    if not exif:
+        return None, None, None
+
+    exif_ifd = exif.get_ifd(ExifTags.IFD.Exif)
+    taken_at = _parse_exif_datetime(
+        exif_ifd.get(ExifTags.Base.DateTimeOriginal) or exif.get(ExifTags.Base.DateTime)
+    )
+
+    gps_ifd = exif.get_ifd(ExifTags.IFD.GPSInfo)
+    latitude = longitude = None
+    if gps_ifd:
+        latitude = _parse_gps_coordinate(
+            gps_ifd.get(ExifTags.GPS.GPSLatitude), gps_ifd.get(ExifTags.GPS.GPSLatitudeRef), 90
+        )
+        longitude = _parse_gps_coordinate(
+            gps_ifd.get(ExifTags.GPS.GPSLongitude), gps_ifd.get(ExifTags.GPS.GPSLongitudeRef), 180
+        )
+
+    return taken_at, latitude, longitude
+
+
+def process_image(
+    content: bytes, thumbnail_size: tuple[int, int], max_pixels: int
+) -> ProcessedImage:
+    """
+    Read image metadata, normalize orientation and render a thumbnail.
+
+    Images with a non-default EXIF orientation get an upright copy here, so
+    clients never need to apply the orientation tag themselves. Images over
+    ``max_pixels`` are refused from their header, before they are decoded.
+
+    This is CPU bound and runs in a worker process, so it must stay a picklable
+    module-level function that only deals in bytes.
+    """
+    with Image.open(io.BytesIO(content)) as img:
+        if img.width * img.height > max_pixels:
+            raise ImageTooLargeError(
+                f"Image of {img.width}x{img.height} pixels exceeds the limit of {max_pixels}"
+            )
+        image_format = img.format
+        mime_type = Image.MIME.get(image_format)
+        taken_at, latitude, longitude = _read_exif(img)
+
+        upright_copy = None
+        orientation = img.getexif().get(ExifTags.Base.Orientation, 1)
+        if orientation != 1:
+            # exif_transpose also resets the orientation tag on the result
+            upright = ImageOps.exif_transpose(img)
+            rotated = io.BytesIO()
+            upright.save(
+                rotated, format=image_format, exif=upright.getexif().tobytes(), quality=95
+            )
+            upright_copy = rotated.getvalue()
+            img = upright
+
+        width, height = img.size
+        img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+        thumbnail = io.BytesIO()
+        img.save(thumbnail, format=image_format, optimize=True, quality=85)
+
+    return ProcessedImage(
+        width=width,
+        height=height,
+        mime_type=mime_type,
+        thumbnail=thumbnail.getvalue(),
+        upright=upright_copy,
+        taken_at=taken_at,
+        latitude=latitude,
+        longitude=longitude,
+    )
+
+
+def get_image_executor() -> ProcessPoolExecutor:
+    """Get the shared, bounded process pool for image work."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.image_processing_workers or os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _reset_image_executor(broken: ProcessPoolExecutor) -> None:
+    """Drop a broken pool, so the next call to ``get_image_executor`` starts a new one."""
+    global _executor
+    # Concurrent callers may all see the same pool break; only replace it once
+    if _executor is broken:
+        _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def process_image_async(
+    content: bytes, thumbnail_size: tuple[int, int]
+) -> ProcessedImage:
+    """
+    Run ``process_image`` in the shared process pool.
+
+    A worker dying (such as being killed for memory) breaks the whole pool,
+    so the pool is replaced and the image retried once on the new one.
+    """
+    loop = asyncio.get_running_loop()
+    args = (content, thumbnail_size, settings.image_max_pixels)
+    # The span covers the pool round trip; the child process itself is not traced
+    with tracer.start_as_current_span(
+        "process image", attributes={"image.bytes": len(content)}
+    ) as span:
+        executor = get_image_executor()
+        try:
+            image = await loop.run_in_executor(executor, process_image, *args)
+        except BrokenProcessPool:
+            logger.warning("Image process pool is broken, restarting it")
+            _reset_image_executor(executor)
+            image = await loop.run_in_executor(get_image_executor(), process_image, *args)
+        span.set_attributes({
+            "image.width": image.width,
+            "image.height": image.height,
+            "image.mime_type": image.mime_type,
+            "image.thumbnail_bytes": len(image.thumbnail),
+        })
+    return image
+
+
+def shutdown_image_executor() -> None:
+    """Shut down the process pool if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
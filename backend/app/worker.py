@@ -0,0 +1,61 @@
+"""
+Background worker entry point, separate from the API.
+
+Runs the scheduler and the queue workers (photo processing, notification
+delivery) in their own process with their own database pool, so heavy jobs
+never share an event loop with API requests. Run API processes with
+API_BACKGROUND_JOBS_ENABLED=false when using it.
+
+Usage:
+    python -m app.worker
+"""
+
+import asyncio
+import logging
+import signal
+
+from app import database
+from app.background import start_background_jobs, stop_background_jobs
+from app.config import settings
+from app.metrics import mark_process_dead
+from app.query_stats import install_query_hooks
+from app.storage import close_storage
+from app.tracing import setup_tracing, shutdown_tracing
+from app.utils.image_processor import shutdown_image_executor
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    """Run background jobs until SIGINT or SIGTERM."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("Starting background worker...")
+    start_background_jobs()
+    try:
+        await stop.wait()
+    finally:
+        logger.info("Shutting down background worker...")
+        await stop_background_jobs()
+        await close_storage()
+        shutdown_image_executor()
+        await database.engine.dispose()
+        shutdown_tracing()
+        mark_process_dead()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    database.configure_engine(settings.worker_db_pool_size, settings.worker_db_max_overflow)
+    install_query_hooks()
+    setup_tracing(f"{settings.tracing_service_name}-worker")
+    asyncio.run(run())
+
+
+# The guard matters: the image process pool uses the spawn start method,
+# which re-imports this module in every child process
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Background workers that drain database-backed job queues."""
@@ -0,0 +1,74 @@
+"""Polling loop shared by the queue workers."""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+
+class QueueWorker(ABC):
+    """
+    Repeatedly claims and handles batches from a database-backed queue.
+
+    Several workers (in one or many processes) can run at once; queues are
+    claimed with ``SKIP LOCKED`` so each item is handled by exactly one of them.
+    While full batches keep coming back the queue is drained without pausing,
+    otherwise the worker sleeps until the next poll or an explicit ``wake()``.
+    """
+
+    name = "queue worker"
+
+    def __init__(self, batch_size: int, poll_interval: float):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker loop is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the worker loop on the running event loop."""
+        if self.running:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name=self.name.replace(" ", "-"))
+        logger.info(f"{self.name.capitalize()} started")
+
+    async def stop(self) -> None:
+        """Stop the worker loop, letting in-flight work finish."""
+        if not self.running:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info(f"{self.name.capitalize()} stopped")
+
+    def wake(self) -> None:
+        """Check the queue immediately instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Error in {self.name}: {e}", exc_info=True)
+                claimed = 0
+
+            # Keep draining while the queue is full, otherwise wait for work
+            if claimed < self.batch_size and not self._stopping:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    @abstractmethod
+    async def run_once(self) -> int:
+        """Claim and handle one batch. Returns the number of items claimed."""
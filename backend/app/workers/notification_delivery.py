@@ -0,0 +1,42 @@
+"""Background worker for the notification delivery outbox."""
+
+import logging
+from datetime import timedelta
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.notification_delivery_repository import NotificationDeliveryRepository
+from app.services.notification_delivery_service import NotificationDeliveryService
+from app.tracing import tracer
+from app.workers.base import QueueWorker
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDeliveryWorker(QueueWorker):
+    """Polls the ``notification_deliveries`` outbox and sends claimed batches."""
+
+    name = "notification delivery worker"
+
+    async def run_once(self) -> int:
+        """Claim and send one batch of deliveries. Returns the number claimed."""
+        async with AsyncSessionLocal() as db:
+            deliveries = await NotificationDeliveryRepository(db).claim_batch(
+                self.batch_size,
+                lock_timeout=timedelta(seconds=settings.notification_delivery_lock_timeout_seconds),
+                max_attempts=settings.notification_delivery_max_attempts,
+            )
+            if deliveries:
+                with tracer.start_as_current_span(
+                    "notification delivery batch", attributes={"deliveries": len(deliveries)}
+                ) as span:
+                    sent = await NotificationDeliveryService(db).deliver(deliveries)
+                    span.set_attribute("deliveries.sent", sent)
+                logger.info(f"Delivered {sent}/{len(deliveries)} notifications")
+        return len(deliveries)
+
+
+delivery_worker = NotificationDeliveryWorker(
+    batch_size=settings.notification_delivery_batch_size,
+    poll_interval=settings.notification_delivery_poll_interval_seconds,
+)
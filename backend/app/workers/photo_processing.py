@@ -0,0 +1,54 @@
+"""Background worker for the photo post-processing queue."""
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from opentelemetry.trace import Status, StatusCode
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.photo_job import PhotoJob
+from app.repositories.photo_job_repository import PhotoJobRepository
+from app.services.photo_processing_service import PhotoProcessingService
+from app.tracing import tracer
+from app.workers.base import QueueWorker
+
+logger = logging.getLogger(__name__)
+
+
+class PhotoProcessingWorker(QueueWorker):
+    """Polls the ``photo_jobs`` table and processes claimed jobs concurrently."""
+
+    name = "photo processing worker"
+
+    async def run_once(self) -> int:
+        """Claim and process one batch of jobs. Returns the number claimed."""
+        async with AsyncSessionLocal() as db:
+            jobs = await PhotoJobRepository(db).claim_batch(
+                self.batch_size,
+                lock_timeout=timedelta(seconds=settings.photo_job_lock_timeout_seconds),
+                max_attempts=settings.photo_job_max_attempts,
+            )
+
+        await asyncio.gather(*(self._process(job) for job in jobs))
+        return len(jobs)
+
+    async def _process(self, job: PhotoJob) -> None:
+        with tracer.start_as_current_span(
+            "photo job", attributes={"photo_job.id": str(job.id), "photo.id": str(job.photo_id)}
+        ) as span:
+            async with AsyncSessionLocal() as db:
+                try:
+                    await PhotoProcessingService(db).process_job(job)
+                except Exception as e:
+                    # Left running; the job is reclaimed after the lock timeout
+                    logger.error(f"Error processing photo job {job.id}: {e}", exc_info=True)
+                    span.record_exception(e)
+                    span.set_status(Status(StatusCode.ERROR, str(e)))
+
+
+photo_worker = PhotoProcessingWorker(
+    batch_size=settings.photo_worker_concurrency,
+    poll_interval=settings.photo_worker_poll_interval_seconds,
+)
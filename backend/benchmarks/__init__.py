@@ -0,0 +1 @@
+"""Performance benchmarks and load tests (run against a dedicated database)."""
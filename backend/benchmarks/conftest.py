@@ -0,0 +1,134 @@
+"""
+Fixtures for the benchmark suite.
+
+Benchmarks run against a dedicated database, given by ``BENCHMARK_DATABASE_URL``,
+which is emptied and filled with a seeded garden before the run. Results are
+saved as JSON under ``.benchmarks/`` (``<counter>_<plants>-plants.json``)
+for comparison between runs.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from uuid import UUID
+
+import pytest
+
+BENCHMARK_DATABASE_URL = os.environ.get("BENCHMARK_DATABASE_URL")
+if BENCHMARK_DATABASE_URL:
+    # Must happen before the app reads its settings
+    os.environ["DATABASE_URL"] = BENCHMARK_DATABASE_URL
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    # Measure the work behind each endpoint, not dashboard cache hits
+    os.environ.setdefault("RESPONSE_CACHE_SECONDS", "0")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("garden", "benchmark data")
+    group.addoption("--plants", type=int, default=1000, help="Number of plants to generate")
+    group.addoption("--seed", type=int, default=42, help="Seed for the data generator")
+    group.addoption(
+        "--reuse-data",
+        action="store_true",
+        help="Benchmark the data already in the database instead of regenerating it",
+    )
+
+
+def pytest_configure(config):
+    if not BENCHMARK_DATABASE_URL:
+        pytest.exit(
+            "Set BENCHMARK_DATABASE_URL to a dedicated database; its data will be replaced.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    option = config.option
+    if not (option.benchmark_save or option.benchmark_autosave or option.benchmark_json):
+        # Name saved runs by size, so runs of the same garden are easy to compare
+        option.benchmark_save = f"{option.plants}-plants"
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    output_json["garden"] = {
+        "plants": config.getoption("--plants"),
+        "seed": config.getoption("--seed"),
+        "reused": config.getoption("--reuse-data"),
+    }
+
+
+@dataclass
+class Garden:
+    """Facts about the generated data that benchmarks need for their requests."""
+
+    plants: int
+    location_id: UUID
+    busiest_plant_id: UUID
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """A single event loop for the session, so the engine's pool survives between tests."""
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def garden(request, runner) -> Garden:
+    from sqlalchemy import func, select
+
+    from app.database import AsyncSessionLocal, engine
+    from app.models.plant import Plant
+    from app.models.watering import WateringLog
+    from benchmarks import datagen
+
+    async def prepare() -> Garden:
+        if not request.config.getoption("--reuse-data"):
+            await datagen.reset(engine)
+            await datagen.generate(
+                engine, request.config.getoption("--plants"), seed=request.config.getoption("--seed")
+            )
+
+        async with AsyncSessionLocal() as db:
+            plants = await db.scalar(select(func.count(Plant.id)))
+            location_id = await db.scalar(
+                select(Plant.location_id)
+                .where(Plant.location_id.is_not(None))
+                .group_by(Plant.location_id)
+                .order_by(func.count().desc(), Plant.location_id)
+                .limit(1)
+            )
+            busiest_plant_id = await db.scalar(
+                select(WateringLog.plant_id)
+                .group_by(WateringLog.plant_id)
+                .order_by(func.count().desc(), WateringLog.plant_id)
+                .limit(1)
+            )
+            if not plants or location_id is None or busiest_plant_id is None:
+                pytest.exit("The benchmark database has no garden; run without --reuse-data")
+        return Garden(plants, location_id, busiest_plant_id)
+
+    garden = runner.run(prepare())
+    yield garden
+    runner.run(engine.dispose())
+
+
+@pytest.fixture(scope="session")
+def client(runner, garden):
+    """Call the app in-process, without a server or network in the measurement."""
+    import httpx
+
+    from app.main import app
+
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+    yield client
+    runner.run(client.aclose())
+
+
+@pytest.fixture
+def get(runner, client):
+    """Return a synchronous ``get(url, **params)`` that asserts a 200 response."""
+
+    def get(url: str, **params):
+        response = runner.run(client.get(url, params=params))
+        assert response.status_code == 200, response.text
+        return response
+
+    return get
@@ -0,0 +1,373 @@
+"""
+Seeded synthetic garden data generator.
+
+Creates locations, plants, watering and fertilization schedules and logs,
+treatments, growth logs and photo records with realistic distributions.
+The same seed and size always produce the same data, so benchmark runs are
+comparable. Rows are written with ``COPY`` in chunks of plants, so memory
+stays flat from 10^3 up to 10^6 plants.
+
+Usage (``--reset`` empties the garden tables first):
+    DATABASE_URL=postgresql+asyncpg://.../plants_bench \\
+        python -m benchmarks.datagen --plants 100000 --seed 42 --reset
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+# (common name, scientific name, category, indoor share)
+SPECIES = [
+    ("Monstera", "Monstera deliciosa", "other", 1.0),
+    ("Snake Plant", "Dracaena trifasciata", "other", 1.0),
+    ("Pothos", "Epipremnum aureum", "other", 1.0),
+    ("Fiddle Leaf Fig", "Ficus lyrata", "tree", 1.0),
+    ("Peace Lily", "Spathiphyllum wallisii", "flower", 1.0),
+    ("Boston Fern", "Nephrolepis exaltata", "other", 0.8),
+    ("Orchid", "Phalaenopsis amabilis", "flower", 1.0),
+    ("Aloe", "Aloe vera", "other", 0.7),
+    ("Basil", "Ocimum basilicum", "other", 0.5),
+    ("Rose", "Rosa gallica", "flower", 0.05),
+    ("Lavender", "Lavandula angustifolia", "flower", 0.1),
+    ("Tulip", "Tulipa gesneriana", "flower", 0.0),
+    ("Hydrangea", "Hydrangea macrophylla", "flower", 0.0),
+    ("Sunflower", "Helianthus annuus", "flower", 0.0),
+    ("Japanese Maple", "Acer palmatum", "tree", 0.0),
+    ("Olive Tree", "Olea europaea", "tree", 0.1),
+    ("Lemon Tree", "Citrus limon", "tree", 0.3),
+    ("Apple Tree", "Malus domestica", "tree", 0.0),
+    ("Boxwood", "Buxus sempervirens", "other", 0.0),
+    ("Bamboo", "Phyllostachys aurea", "grass", 0.1),
+    ("Pampas Grass", "Cortaderia selloana", "grass", 0.0),
+    ("Fescue", "Festuca glauca", "grass", 0.0),
+    ("Tomato", "Solanum lycopersicum", "other", 0.1),
+    ("Mint", "Mentha spicata", "other", 0.4),
+]
+SPECIES_WEIGHTS = [8, 7, 7, 4, 5, 4, 5, 4, 3, 6, 4, 3, 3, 2, 2, 2, 2, 2, 2, 2, 1, 1, 3, 2]
+
+LOCATION_NAMES = [
+    "Living Room", "Kitchen", "Bedroom", "Office", "Balcony", "Greenhouse",
+    "Front Yard", "Back Garden", "Patio", "Veranda", "Raised Bed", "Orchard",
+]
+# Most gardens share a few timezones; UTC at 8:00 matches the default for plants without one
+TIMEZONES = ["UTC", "Europe/Paris", "Europe/London", "America/New_York", "America/Los_Angeles",
+             "Asia/Tokyo", "Australia/Sydney"]
+TIMEZONE_WEIGHTS = [40, 20, 10, 12, 8, 5, 5]
+
+ISSUES = [("pest", "Aphids"), ("pest", "Spider mites"), ("pest", "Mealybugs"),
+          ("disease", "Powdery mildew"), ("disease", "Root rot"), ("disease", "Leaf spot")]
+TREATMENT_TYPES = ["chemical", "organic", "manual", "biological"]
+HEALTH_STATUSES = ["excellent", "good", "fair", "poor"]
+HEALTH_WEIGHTS = [30, 45, 18, 7]
+
+# Tables written by the generator, children first (the order they are emptied in)
+GARDEN_TABLES = [
+    "notification_deliveries", "notifications", "photo_jobs", "growth_logs", "photos",
+    "treatment_applications", "treatments", "fertilization_logs", "fertilization_schedules",
+    "watering_logs", "watering_schedules", "plants", "locations",
+]
+
+
+@dataclass
+class GardenProfile:
+    """Shape of the generated garden. Means are per plant unless noted."""
+
+    plants_per_location: int = 25
+    unlocated_share: float = 0.15
+    watering_share: float = 0.9
+    fertilization_share: float = 0.5
+    treatment_share: float = 0.1
+    mean_watering_logs: float = 8.0
+    mean_fertilization_logs: float = 2.0
+    mean_treatment_applications: float = 2.0
+    mean_growth_logs: float = 3.0
+    mean_photos: float = 1.5
+    history_days: int = 365
+
+
+class GardenGenerator:
+    """Generates rows deterministically from a seed."""
+
+    def __init__(self, seed: int, profile: GardenProfile, today: date):
+        self.rng = random.Random(seed)
+        self.profile = profile
+        self.today = today
+        self.now = datetime.combine(today, datetime.min.time()) + timedelta(hours=6)
+
+    def new_id(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def count(self, mean: float) -> int:
+        """Draw a long-tailed count: most plants have a few rows, some have many."""
+        return int(self.rng.expovariate(1 / mean)) if mean > 0 else 0
+
+    def past(self, max_days: int, min_days: int = 0) -> datetime:
+        """A random moment between ``min_days`` and ``max_days`` ago."""
+        seconds = self.rng.randint(min_days * 86400, max(max_days, min_days) * 86400)
+        return self.now - timedelta(seconds=seconds)
+
+    def locations(self, count: int) -> list[dict]:
+        rows = []
+        for index in range(count):
+            name = LOCATION_NAMES[index % len(LOCATION_NAMES)]
+            is_indoor = name in ("Living Room", "Kitchen", "Bedroom", "Office", "Greenhouse")
+            rows.append({
+                "id": self.new_id(),
+                "name": f"{name} {index // len(LOCATION_NAMES) + 1}",
+                "type": "indoor" if is_indoor else "outdoor",
+                "zone": self.rng.choice([None, "North", "South", "East", "West"]),
+                "timezone": self.rng.choices(TIMEZONES, TIMEZONE_WEIGHTS)[0],
+                "reminder_hour": self.rng.choices([7, 8, 9, 18], [20, 60, 15, 5])[0],
+                "created_at": self.past(self.profile.history_days),
+            })
+        return rows
+
+    def plants(self, start: int, count: int, locations: list[dict]) -> dict[str, list[dict]]:
+        """Generate ``count`` plants and everything that belongs to them."""
+        profile = self.profile
+        tables: dict[str, list[dict]] = {
+            name: [] for name in (
+                "plants", "watering_schedules", "watering_logs", "fertilization_schedules",
+                "fertilization_logs", "treatments", "treatment_applications", "photos",
+                "growth_logs",
+            )
+        }
+
+        for index in range(start, start + count):
+            common, scientific, category, indoor_share = self.rng.choices(
+                SPECIES, SPECIES_WEIGHTS
+            )[0]
+            location = None
+            if self.rng.random() >= profile.unlocated_share:
+                location = self.rng.choice(locations)
+            plant_type = (
+                location["type"] if location
+                else "indoor" if self.rng.random() < indoor_share else "outdoor"
+            )
+            created_at = self.past(profile.history_days)
+            plant_id = self.new_id()
+            tables["plants"].append({
+                "id": plant_id,
+                "name": f"{common} #{index + 1}",
+                "scientific_name": scientific,
+                "type": plant_type,
+                "category": category,
+                "species": scientific.split()[0],
+                "location_id": location["id"] if location else None,
+                "acquisition_date": (created_at - timedelta(days=self.rng.randint(0, 700))).date(),
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+
+            if self.rng.random() < profile.watering_share:
+                self._care(
+                    tables, "watering", plant_id, created_at,
+                    frequencies=([1, 2, 3, 4, 7, 10, 14], [5, 15, 20, 10, 30, 10, 10]),
+                    mean_logs=profile.mean_watering_logs,
+                )
+            if self.rng.random() < profile.fertilization_share:
+                self._care(
+                    tables, "fertilization", plant_id, created_at,
+                    frequencies=([14, 21, 30, 60], [20, 20, 45, 15]),
+                    mean_logs=profile.mean_fertilization_logs,
+                )
+            if self.rng.random() < profile.treatment_share:
+                self._treatment(tables, plant_id)
+
+            photo_ids = []
+            for _ in range(self.count(profile.mean_photos)):
+                photo_id = self.new_id()
+                photo_ids.append(photo_id)
+                taken_at = self.past(profile.history_days)
+                width, height = self.rng.choice([(4032, 3024), (3024, 4032), (1920, 1080)])
+                tables["photos"].append({
+                    "id": photo_id,
+                    "plant_id": plant_id,
+                    "file_path": f"photos/{photo_id}.jpg",
+                    "thumbnail_path": f"thumbnails/thumb_{photo_id}.jpg",
+                    "original_filename": f"IMG_{self.rng.randint(1000, 9999)}.jpg",
+                    "file_size": self.rng.randint(800_000, 6_000_000),
+                    "mime_type": "image/jpeg",
+                    "width": width,
+                    "height": height,
+                    "taken_at": taken_at,
+                    "processing_status": "ready",
+                    "created_at": taken_at,
+                })
+
+            height_cm = self.rng.uniform(5, 80)
+            measurements = sorted(
+                self.past(profile.history_days) for _ in range(self.count(profile.mean_growth_logs))
+            )
+            for measured_at in measurements:
+                height_cm *= self.rng.uniform(1.0, 1.15)
+                tables["growth_logs"].append({
+                    "id": self.new_id(),
+                    "plant_id": plant_id,
+                    "photo_id": self.rng.choice(photo_ids) if photo_ids and self.rng.random() < 0.3 else None,
+                    "measured_at": measured_at,
+                    "height_cm": round(height_cm, 1),
+                    "width_cm": round(height_cm * self.rng.uniform(0.4, 1.2), 1),
+                    "health_status": self.rng.choices(HEALTH_STATUSES, HEALTH_WEIGHTS)[0],
+                    "created_at": measured_at,
+                })
+
+        return tables
+
+    def _care(
+        self,
+        tables: dict[str, list[dict]],
+        kind: str,
+        plant_id: uuid.UUID,
+        created_at: datetime,
+        frequencies: tuple[list[int], list[int]],
+        mean_logs: float,
+    ) -> None:
+        """Add a watering or fertilization schedule and logs spaced roughly by its frequency."""
+        frequency = self.rng.choices(*frequencies)[0]
+        schedule_id = self.new_id()
+        is_active = self.rng.random() < 0.95
+        schedule = {
+            "id": schedule_id,
+            "plant_id": plant_id,
+            "frequency_days": frequency,
+            "start_date": created_at.date(),
+            "is_active": is_active,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+        if kind == "fertilization":
+            schedule["fertilizer_type"] = self.rng.choice(["liquid", "granular", "organic"])
+        tables[f"{kind}_schedules"].append(schedule)
+
+        # The latest log lands anywhere from on time to a couple of periods overdue
+        logged_at = self.now - timedelta(days=self.rng.uniform(0, frequency * 2))
+        at_column = "watered_at" if kind == "watering" else "fertilized_at"
+        for _ in range(self.count(mean_logs)):
+            if logged_at < created_at:
+                break
+            tables[f"{kind}_logs"].append({
+                "id": self.new_id(),
+                "plant_id": plant_id,
+                f"{kind}_schedule_id": schedule_id,
+                at_column: logged_at,
+                "created_at": logged_at,
+            })
+            logged_at -= timedelta(days=frequency * self.rng.uniform(0.8, 1.3))
+
+    def _treatment(self, tables: dict[str, list[dict]], plant_id: uuid.UUID) -> None:
+        issue_type, issue_name = self.rng.choice(ISSUES)
+        started_at = self.past(120)
+        is_active = self.rng.random() < 0.4
+        treatment_id = self.new_id()
+        tables["treatments"].append({
+            "id": treatment_id,
+            "plant_id": plant_id,
+            "issue_type": issue_type,
+            "issue_name": issue_name,
+            "treatment_type": self.rng.choice(TREATMENT_TYPES),
+            "start_date": started_at.date(),
+            "end_date": None if is_active else (started_at + timedelta(days=self.rng.randint(7, 30))).date(),
+            "status": "active" if is_active else "completed",
+            "created_at": started_at,
+            "updated_at": started_at,
+        })
+        for _ in range(self.count(self.profile.mean_treatment_applications)):
+            applied_at = started_at + timedelta(days=self.rng.uniform(0, 20))
+            tables["treatment_applications"].append({
+                "id": self.new_id(),
+                "treatment_id": treatment_id,
+                "applied_at": min(applied_at, self.now),
+                "created_at": min(applied_at, self.now),
+            })
+
+
+async def _copy(connection: AsyncConnection, table: str, rows: list[dict]) -> None:
+    """Bulk load rows with COPY through the asyncpg driver connection."""
+    if not rows:
+        return
+    columns = list(rows[0])
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table, records=[tuple(row.get(column) for column in columns) for row in rows],
+        columns=columns,
+    )
+
+
+async def reset(engine: AsyncEngine) -> None:
+    """Empty every table the generator writes to."""
+    async with engine.begin() as connection:
+        await connection.execute(text(f"TRUNCATE {', '.join(GARDEN_TABLES)} CASCADE"))
+
+
+async def generate(
+    engine: AsyncEngine,
+    plants: int,
+    seed: int = 42,
+    profile: GardenProfile | None = None,
+    chunk_size: int = 5000,
+    today: date | None = None,
+) -> Counter:
+    """
+    Generate a garden of ``plants`` plants and return the row count per table.
+
+    Each chunk of plants is committed separately, so an interrupted run
+    leaves complete plants behind.
+    """
+    profile = profile or GardenProfile()
+    generator = GardenGenerator(seed, profile, today or date.today())
+    counts: Counter = Counter()
+
+    locations = generator.locations(max(3, plants // profile.plants_per_location))
+    async with engine.begin() as connection:
+        await _copy(connection, "locations", locations)
+    counts["locations"] = len(locations)
+
+    for start in range(0, plants, chunk_size):
+        tables = generator.plants(start, min(chunk_size, plants - start), locations)
+        async with engine.begin() as connection:
+            # Parents before children, for the foreign keys
+            for table, rows in tables.items():
+                await _copy(connection, table, rows)
+                counts[table] += len(rows)
+
+    async with engine.begin() as connection:
+        await connection.execute(text("ANALYZE"))
+    return counts
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic garden for benchmarks")
+    parser.add_argument("--plants", type=int, default=1000, help="Number of plants (10^3 to 10^6)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Plants per transaction")
+    parser.add_argument(
+        "--reset", action="store_true", help="Empty the garden tables before generating"
+    )
+    args = parser.parse_args()
+
+    from app.database import engine
+
+    if args.reset:
+        await reset(engine)
+
+    start = time.perf_counter()
+    counts = await generate(engine, args.plants, seed=args.seed, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+
+    for table, count in counts.items():
+        print(f"{table:>24}: {count}")
+    print(f"Generated {sum(counts.values())} rows in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,447 @@
+"""
+HTTP load-test harness.
+
+Drives the API with a weighted mix of requests modeled on real traffic and
+reports latency percentiles and throughput per operation. Runs the ASGI app
+in-process by default, or targets a running server with ``--url``.
+
+Without ``--rate``, ``--concurrency`` virtual users send requests back to back
+(closed loop). With ``--rate``, requests are started on a fixed schedule and
+latency is measured from the scheduled start, so a stalled server is not
+hidden by clients waiting on it (open loop).
+
+Usage:
+    python -m benchmarks.load --profile mixed --concurrency 20 --duration 60 \\
+        --slo p95=250 --slo log_watering.p99=500 --max-error-rate 0.01 --json load.json
+
+Exits with status 1 when an SLO is not met. Write traffic adds rows, so point
+it at a benchmark database (see ``benchmarks.datagen``).
+"""
+
+import argparse
+import asyncio
+import io
+import itertools
+import json
+import logging
+import math
+import os
+import random
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+
+API = "/api/v1"
+SEARCH_TERMS = ["rose", "fern", "mon", "tree", "lily", "basil", "Ficus", "aloe"]
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class Targets:
+    """Existing records that requests refer to, fetched once before the run."""
+
+    plant_ids: list[str]
+    location_ids: list[str]
+    photo: bytes
+
+
+@dataclass
+class Request:
+    method: str
+    url: str
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class Operation:
+    """One kind of request, picked with probability proportional to ``weight``."""
+
+    name: str
+    weight: int
+    build: Callable[[random.Random, Targets], Request]
+
+
+@dataclass
+class Profile:
+    name: str
+    description: str
+    operations: list[Operation]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _plant(rng: random.Random, targets: Targets) -> str:
+    return rng.choice(targets.plant_ids)
+
+
+def _calendar(rng: random.Random, targets: Targets) -> Request:
+    start = date.today().replace(day=1)
+    return Request("GET", f"{API}/dashboard/calendar", {"params": {
+        "start_date": start.isoformat(), "end_date": (start + timedelta(days=34)).isoformat(),
+    }})
+
+
+def _log_watering(rng: random.Random, targets: Targets) -> Request:
+    plant_id = _plant(rng, targets)
+    return Request("POST", f"{API}/watering/plants/{plant_id}/logs", {"json": {
+        "plant_id": plant_id, "watered_at": _now(), "amount": "250ml",
+    }})
+
+
+def _log_fertilization(rng: random.Random, targets: Targets) -> Request:
+    plant_id = _plant(rng, targets)
+    return Request("POST", f"{API}/fertilization/plants/{plant_id}/logs", {"json": {
+        "plant_id": plant_id, "fertilized_at": _now(), "fertilizer_type": "liquid",
+    }})
+
+
+def _log_growth(rng: random.Random, targets: Targets) -> Request:
+    plant_id = _plant(rng, targets)
+    return Request("POST", f"{API}/growth/plants/{plant_id}/growth", {"json": {
+        "plant_id": plant_id, "measured_at": _now(), "height_cm": round(rng.uniform(5, 150), 1),
+        "health_status": "good",
+    }})
+
+
+def _upload_photo(rng: random.Random, targets: Targets) -> Request:
+    return Request("POST", f"{API}/photos/plants/{_plant(rng, targets)}/photos", {
+        "files": {"file": ("load.jpg", targets.photo, "image/jpeg")},
+    })
+
+
+OPERATIONS = {
+    operation.name: operation for operation in [
+        Operation("dashboard_overview", 1, lambda rng, t: Request("GET", f"{API}/dashboard/overview")),
+        Operation("dashboard_tasks", 1, lambda rng, t: Request("GET", f"{API}/dashboard/tasks")),
+        Operation("dashboard_treatments", 1, lambda rng, t: Request(
+            "GET", f"{API}/dashboard/treatments/active"
+        )),
+        Operation("dashboard_activities", 1, lambda rng, t: Request(
+            "GET", f"{API}/dashboard/activities/recent", {"params": {"limit": 10}}
+        )),
+        Operation("dashboard_calendar", 1, _calendar),
+        Operation("list_plants", 1, lambda rng, t: Request(
+            "GET", f"{API}/plants/", {"params": {"skip": rng.randrange(0, 500, 50), "limit": 50}}
+        )),
+        Operation("search_plants", 1, lambda rng, t: Request(
+            "GET", f"{API}/plants/search", {"params": {"q": rng.choice(SEARCH_TERMS)}}
+        )),
+        Operation("location_plants", 1, lambda rng, t: Request(
+            "GET", f"{API}/plants/location/{rng.choice(t.location_ids)}"
+        )),
+        Operation("get_plant", 1, lambda rng, t: Request("GET", f"{API}/plants/{_plant(rng, t)}")),
+        Operation("plant_timeline", 1, lambda rng, t: Request(
+            "GET", f"{API}/plants/{_plant(rng, t)}/timeline"
+        )),
+        Operation("watering_due", 1, lambda rng, t: Request(
+            "GET", f"{API}/watering/due", {"params": {"days_ahead": 1}}
+        )),
+        Operation("log_watering", 1, _log_watering),
+        Operation("log_fertilization", 1, _log_fertilization),
+        Operation("log_growth", 1, _log_growth),
+        Operation("upload_photo", 1, _upload_photo),
+    ]
+}
+
+
+def _profile(name: str, description: str, weights: dict[str, int]) -> Profile:
+    return Profile(name, description, [
+        Operation(op, weight, OPERATIONS[op].build) for op, weight in weights.items()
+    ])
+
+
+PROFILES = {
+    profile.name: profile for profile in [
+        _profile("dashboard", "Open dashboards polling their widgets", {
+            "dashboard_overview": 4, "dashboard_tasks": 4, "dashboard_activities": 3,
+            "dashboard_treatments": 2, "dashboard_calendar": 1,
+        }),
+        _profile("care", "Gardeners logging care from the plant pages", {
+            "get_plant": 4, "plant_timeline": 2, "watering_due": 2, "log_watering": 6,
+            "log_fertilization": 1, "log_growth": 1,
+        }),
+        _profile("browse", "Browsing and searching the collection", {
+            "list_plants": 4, "search_plants": 3, "location_plants": 2, "get_plant": 3,
+            "plant_timeline": 1,
+        }),
+        _profile("uploads", "Photo uploads with the page reloads around them", {
+            "upload_photo": 1, "get_plant": 1, "plant_timeline": 1,
+        }),
+        _profile("mixed", "Typical day: mostly dashboard polling, some care logging and uploads", {
+            "dashboard_overview": 10, "dashboard_tasks": 10, "dashboard_activities": 6,
+            "dashboard_treatments": 3, "dashboard_calendar": 2, "list_plants": 6,
+            "search_plants": 4, "location_plants": 2, "get_plant": 8, "plant_timeline": 3,
+            "watering_due": 3, "log_watering": 8, "log_fertilization": 2, "log_growth": 2,
+            "upload_photo": 1,
+        }),
+    ]
+}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class OperationStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    def summary(self, elapsed: float) -> dict:
+        """Latencies in milliseconds, throughput in requests per second."""
+        values = sorted(self.latencies)
+        summary = {
+            "requests": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "rps": self.count / elapsed if elapsed else 0.0,
+            "mean": sum(values) / len(values) * 1000 if values else 0.0,
+        }
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = percentile(values, pct) * 1000
+        summary["max"] = values[-1] * 1000 if values else 0.0
+        return summary
+
+
+@dataclass
+class LoadResult:
+    profile: str
+    elapsed: float
+    operations: dict[str, OperationStats]
+    status_codes: dict[int | str, int]
+
+    def summary(self) -> dict:
+        total = OperationStats()
+        for stats in self.operations.values():
+            total.latencies.extend(stats.latencies)
+            total.errors += stats.errors
+        return {
+            "total": total.summary(self.elapsed),
+            "operations": {
+                name: stats.summary(self.elapsed) for name, stats in sorted(self.operations.items())
+            },
+        }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    profile: Profile,
+    targets: Targets,
+    concurrency: int,
+    duration: float,
+    warmup: float = 0.0,
+    rate: float | None = None,
+    seed: int = 42,
+) -> LoadResult:
+    """
+    Send requests for ``warmup + duration`` seconds and collect the latencies
+    of those started after the warmup.
+
+    Each virtual user draws its operations from its own seeded generator, so
+    the request sequence is reproducible for a given seed and concurrency.
+    """
+    names = [op.name for op in profile.operations]
+    weights = [op.weight for op in profile.operations]
+    by_name = {op.name: op for op in profile.operations}
+    stats = {name: OperationStats() for name in names}
+    status_codes: dict[int | str, int] = {}
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+    slots = itertools.count()
+
+    async def user(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        while True:
+            if rate:
+                # Open loop: take the next slot of the shared schedule
+                scheduled = start + next(slots) / rate
+                if scheduled >= deadline:
+                    return
+                await asyncio.sleep(max(0.0, scheduled - loop.time()))
+            else:
+                scheduled = loop.time()
+                if scheduled >= deadline:
+                    return
+
+            name = rng.choices(names, weights)[0]
+            request = by_name[name].build(rng, targets)
+            try:
+                response = await client.request(request.method, request.url, **request.kwargs)
+                status = response.status_code
+                failed = status >= 400
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+                failed = True
+            latency = loop.time() - scheduled
+
+            if scheduled >= measure_from:
+                stats[name].latencies.append(latency)
+                stats[name].errors += failed
+                status_codes[status] = status_codes.get(status, 0) + 1
+
+    await asyncio.gather(*(user(i) for i in range(concurrency)))
+    # Throughput counts the requests started within the measured window
+    return LoadResult(profile.name, duration, stats, status_codes)
+
+
+def check_slos(summary: dict, slos: list[str], max_error_rate: float | None) -> list[str]:
+    """
+    Return the SLOs that were not met.
+
+    An SLO is ``[operation.]metric=limit_ms``, e.g. ``p95=250`` for all
+    requests or ``log_watering.p99=500`` for one operation.
+    """
+    violations = []
+    for slo in slos:
+        key, _, limit = slo.partition("=")
+        operation, _, metric = key.rpartition(".")
+        stats = summary["operations"].get(operation) if operation else summary["total"]
+        if stats is None:
+            violations.append(f"{slo}: operation {operation!r} was not exercised")
+        elif metric not in stats:
+            violations.append(f"{slo}: unknown metric {metric!r}")
+        elif stats[metric] > float(limit):
+            violations.append(f"{key} was {stats[metric]:.1f}ms, limit {float(limit):g}ms")
+
+    if max_error_rate is not None:
+        for name, stats in [("total", summary["total"]), *summary["operations"].items()]:
+            if stats["error_rate"] > max_error_rate:
+                violations.append(
+                    f"{name} error rate was {stats['error_rate']:.2%}, limit {max_error_rate:.2%}"
+                )
+    return violations
+
+
+def format_report(result: LoadResult, summary: dict) -> str:
+    header = f"{'operation':<22}{'requests':>9}{'errors':>8}{'rps':>9}{'mean':>9}"
+    header += "".join(f"{f'p{pct}':>9}" for pct in PERCENTILES) + f"{'max':>9}"
+    lines = [f"Profile {result.profile}: {result.elapsed:.1f}s measured (ms)", header]
+    rows = [*summary["operations"].items(), ("total", summary["total"])]
+    for name, stats in rows:
+        line = f"{name:<22}{stats['requests']:>9}{stats['errors']:>8}{stats['rps']:>9.1f}"
+        line += "".join(
+            f"{stats[key]:>9.1f}" for key in ("mean", *(f"p{pct}" for pct in PERCENTILES), "max")
+        )
+        lines.append(line)
+    codes = ", ".join(f"{code}: {count}" for code, count in sorted(result.status_codes.items(), key=str))
+    lines.append(f"Status codes: {codes}")
+    return "\n".join(lines)
+
+
+def _sample_photo(size: tuple[int, int] = (1600, 1200)) -> bytes:
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", size, (40, 110, 50))
+    draw = ImageDraw.Draw(image)
+    rng = random.Random(0)
+    for _ in range(200):
+        x, y = rng.randrange(size[0]), rng.randrange(size[1])
+        draw.ellipse((x, y, x + 60, y + 40), fill=(rng.randrange(256), 160, rng.randrange(120)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+async def fetch_targets(client: httpx.AsyncClient, max_plants: int = 1000) -> Targets:
+    """Collect plant and location ids for requests to use."""
+    plants = await client.get(f"{API}/plants/", params={"limit": max_plants})
+    plants.raise_for_status()
+    plant_ids = [plant["id"] for plant in plants.json()]
+    location_ids = sorted({plant["location_id"] for plant in plants.json() if plant["location_id"]})
+    if not plant_ids or not location_ids:
+        raise SystemExit("The target has no plants or locations; generate data with benchmarks.datagen")
+    return Targets(plant_ids, location_ids, _sample_photo())
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the API and report latency percentiles")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mixed")
+    parser.add_argument("--url", help="Base URL of a running server (default: the app in-process)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before")
+    parser.add_argument("--rate", type=float, help="Requests per second to start (open loop)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--slo", action="append", default=[], metavar="[OPERATION.]METRIC=MS",
+        help="Fail if a latency exceeds its limit, e.g. p95=250 or log_watering.p99=500",
+    )
+    parser.add_argument("--max-error-rate", type=float, help="Fail above this error rate (0-1)")
+    parser.add_argument("--json", dest="json_path", help="Write the report to this JSON file")
+    parser.add_argument("--list", action="store_true", help="List the profiles and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for profile in PROFILES.values():
+            print(f"{profile.name:<10} {profile.description}")
+        return 0
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30)
+    else:
+        os.environ.setdefault("ENVIRONMENT", "benchmark")
+        from app.main import app
+
+        # Keep the app's warnings (slow queries, N+1) from interleaving with the report
+        logging.getLogger("app").setLevel(logging.ERROR)
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=30
+        )
+
+    profile = PROFILES[args.profile]
+    async with client:
+        targets = await fetch_targets(client)
+        result = await run_load(
+            client, profile, targets, args.concurrency, args.duration,
+            warmup=args.warmup, rate=args.rate, seed=args.seed,
+        )
+
+    summary = result.summary()
+    print(format_report(result, summary))
+    violations = check_slos(summary, args.slo, args.max_error_rate)
+
+    if args.json_path:
+        report = {
+            "profile": profile.name,
+            "target": args.url or "in-process",
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "config": {
+                "concurrency": args.concurrency, "duration": args.duration,
+                "warmup": args.warmup, "rate": args.rate, "seed": args.seed,
+            },
+            "status_codes": {str(code): count for code, count in result.status_codes.items()},
+            **summary,
+            "slo": {"checks": args.slo, "max_error_rate": args.max_error_rate,
+                    "violations": violations},
+        }
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if violations:
+        print("\nSLO violations:", file=sys.stderr)
+        for violation in violations:
+            print(f"  {violation}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
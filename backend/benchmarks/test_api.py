@@ -0,0 +1,59 @@
+"""Benchmarks for the read endpoints the frontend calls most."""
+
+from datetime import date, timedelta
+
+API = "/api/v1"
+
+
+def test_list_plants(benchmark, get):
+    benchmark(get, f"{API}/plants/", limit=100)
+
+
+def test_list_plants_filtered(benchmark, get, garden):
+    benchmark(get, f"{API}/plants/", plant_type="outdoor", location_id=str(garden.location_id))
+
+
+def test_search_plants(benchmark, get):
+    benchmark(get, f"{API}/plants/search", q="rose")
+
+
+def test_plants_by_location(benchmark, get, garden):
+    benchmark(get, f"{API}/plants/location/{garden.location_id}")
+
+
+def test_plant_timeline(benchmark, get, garden):
+    benchmark(get, f"{API}/plants/{garden.busiest_plant_id}/timeline")
+
+
+def test_watering_due(benchmark, get):
+    benchmark(get, f"{API}/watering/due", days_ahead=1)
+
+
+def test_dashboard_overview(benchmark, get):
+    benchmark(get, f"{API}/dashboard/overview")
+
+
+def test_dashboard_tasks(benchmark, get):
+    benchmark(get, f"{API}/dashboard/tasks")
+
+
+def test_dashboard_active_treatments(benchmark, get):
+    benchmark(get, f"{API}/dashboard/treatments/active")
+
+
+def test_dashboard_recent_activities(benchmark, get):
+    benchmark(get, f"{API}/dashboard/activities/recent", limit=20)
+
+
+def test_dashboard_calendar_month(benchmark, get):
+    start = date.today().replace(day=1)
+    benchmark(
+        get,
+        f"{API}/dashboard/calendar",
+        start_date=start.isoformat(),
+        end_date=(start + timedelta(days=34)).isoformat(),
+    )
+
+
+def test_list_locations(benchmark, get):
+    benchmark(get, f"{API}/locations/")
@@ -0,0 +1,40 @@
+"""Benchmarks for the scheduled jobs."""
+
+from datetime import datetime, time, timezone
+
+from sqlalchemy import delete
+
+from app.database import AsyncSessionLocal
+from app.models.notification import Notification
+from app.services.notification_service import NotificationService
+
+# Reminders for unlocated plants and most generated locations fire at 08:00 UTC
+REMINDER_TIME = datetime.combine(datetime.now(timezone.utc).date(), time(8), tzinfo=timezone.utc)
+
+
+async def _clear_notifications() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Notification))
+        await db.commit()
+
+
+async def _check_due_tasks() -> int:
+    async with AsyncSessionLocal() as db:
+        return await NotificationService(db).check_due_tasks(now=REMINDER_TIME)
+
+
+def test_check_due_tasks(benchmark, runner, garden):
+    """Create the reminders for the busiest hour of the day, starting from none."""
+    created = benchmark.pedantic(
+        lambda: runner.run(_check_due_tasks()),
+        setup=lambda: runner.run(_clear_notifications()),
+        rounds=5,
+        iterations=1,
+    )
+    assert created > 0
+
+
+def test_check_due_tasks_already_sent(benchmark, runner, garden):
+    """Rerun the same hour, when every reminder already exists."""
+    runner.run(_check_due_tasks())
+    assert benchmark(lambda: runner.run(_check_due_tasks())) == 0
@@ -0,0 +1,81 @@
+"""
+Benchmarks for serializing the timeline and calendar payloads.
+
+``response_model`` is the path these endpoints used to take: the service
+built dicts, which FastAPI validated against the response model before
+dumping them. ``orjson`` is the current path, where the service's
+dataclasses are serialized once. The payloads come from the benchmark garden.
+"""
+
+from collections.abc import Callable
+from datetime import date, timedelta
+
+import orjson
+import pytest
+from pydantic import TypeAdapter
+
+from app.responses import ORJSONResponse
+from app.schemas.dashboard import CalendarEvent
+from app.schemas.timeline import TimelineItem
+
+
+@pytest.fixture(scope="module")
+def timeline(runner, garden):
+    from app.database import AsyncSessionLocal
+    from app.services.timeline_service import TimelineService
+
+    async def load():
+        async with AsyncSessionLocal() as db:
+            return await TimelineService(db).get_plant_timeline(garden.busiest_plant_id)
+
+    return runner.run(load())
+
+
+@pytest.fixture(scope="module")
+def calendar(runner, garden):
+    from app.database import AsyncSessionLocal
+    from app.services.calendar_service import CalendarService
+
+    async def load():
+        start = date.today()
+        async with AsyncSessionLocal() as db:
+            return await CalendarService(db).get_calendar_events(start, start + timedelta(days=90))
+
+    return runner.run(load())
+
+
+def response_model(adapter: TypeAdapter, entries) -> Callable[[], bytes]:
+    # The dicts the services used to return, with every value already a string
+    dicts = orjson.loads(ORJSONResponse(entries).body)
+    return lambda: adapter.dump_json(adapter.validate_python(dicts))
+
+
+@pytest.mark.parametrize(
+    ("payload", "model"), [("timeline", list[TimelineItem]), ("calendar", list[CalendarEvent])]
+)
+def test_orjson_matches_response_model(request, payload, model):
+    # Both paths must send the same bytes for the comparison to be fair
+    entries = request.getfixturevalue(payload)
+    assert entries
+    adapter = TypeAdapter(model)
+    assert ORJSONResponse(entries).body == response_model(adapter, entries)()
+
+
+@pytest.mark.benchmark(group="timeline serialization")
+def test_timeline_response_model(benchmark, timeline):
+    benchmark(response_model(TypeAdapter(list[TimelineItem]), timeline))
+
+
+@pytest.mark.benchmark(group="timeline serialization")
+def test_timeline_orjson(benchmark, timeline):
+    benchmark(lambda: ORJSONResponse(timeline).body)
+
+
+@pytest.mark.benchmark(group="calendar serialization")
+def test_calendar_response_model(benchmark, calendar):
+    benchmark(response_model(TypeAdapter(list[CalendarEvent]), calendar))
+
+
+@pytest.mark.benchmark(group="calendar serialization")
+def test_calendar_orjson(benchmark, calendar):
+    benchmark(lambda: ORJSONResponse(calendar).body)
@@ -0,0 +1,95 @@
+"""
+Shared fixtures for the test suite.
+
+Settings are read from the environment when ``app.config`` is first
+imported, so test defaults are set here, before any app module loads.
+
+Tests that use the database run against a dedicated database given by
+``TEST_DATABASE_URL``, migrated to head at the start of the run and emptied
+after each test; they are skipped when it is not set.
+"""
+
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+# Must happen before the app reads its settings
+os.environ["ENVIRONMENT"] = "test"
+os.environ.setdefault("API_BACKGROUND_JOBS_ENABLED", "false")
+# Every request does its work instead of hitting the dashboard cache
+os.environ.setdefault("RESPONSE_CACHE_SECONDS", "0")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Migrate the test database; skips the test when none is configured."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("Set TEST_DATABASE_URL to a dedicated database to run database tests")
+
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config("alembic.ini"), "head")
+
+
+@pytest.fixture
+async def db(database):
+    """A session on the test database, whose tables are emptied after the test."""
+    from sqlalchemy import text
+
+    from app.database import AsyncSessionLocal, Base
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with AsyncSessionLocal() as session:
+        await session.execute(text(f"TRUNCATE {tables} CASCADE"))
+        await session.commit()
+
+
+@pytest.fixture
+async def events(database):
+    """Events published on the notification channel, as they are received."""
+    import asyncio
+    import json
+
+    import asyncpg
+
+    from app.config import settings
+    from app.events import NOTIFICATION_CHANNEL
+
+    received: asyncio.Queue = asyncio.Queue()
+    connection = await asyncpg.connect(settings.database_url.replace("+asyncpg", "", 1))
+    await connection.add_listener(
+        NOTIFICATION_CHANNEL, lambda *args: received.put_nowait(json.loads(args[-1]))
+    )
+    yield received
+    await connection.close()
+
+
+@pytest.fixture
+async def client(db):
+    """An HTTP client calling the app in process."""
+    import httpx
+
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def plant(db):
+    """A plant without a location."""
+    from app.models.plant import Plant
+
+    plant = Plant(name="Fern", type="indoor", category="other")
+    db.add(plant)
+    await db.commit()
+    return plant
@@ -0,0 +1,108 @@
+"""Tests for image processing in the process pool."""
+
+import asyncio
+import io
+import os
+
+import pytest
+from PIL import ExifTags, Image
+
+from app.config import settings
+from app.utils import image_processor
+from app.utils.image_processor import (
+    ImageTooLargeError,
+    get_image_executor,
+    process_image,
+    process_image_async,
+    shutdown_image_executor,
+)
+
+
+def _jpeg(width: int = 640, height: int = 480) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "green").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def image_pool(monkeypatch):
+    monkeypatch.setattr(settings, "image_processing_workers", 1)
+    yield
+    shutdown_image_executor()
+
+
+def test_process_image_renders_thumbnail():
+    image = process_image(_jpeg(), (300, 300), max_pixels=1_000_000)
+
+    assert (image.width, image.height) == (640, 480)
+    assert image.mime_type == "image/jpeg"
+    assert Image.open(io.BytesIO(image.thumbnail)).size == (300, 225)
+
+
+def test_process_image_refuses_images_over_pixel_limit(monkeypatch):
+    content = _jpeg()
+
+    def fail_load(self):
+        raise AssertionError("pixels were decoded")
+
+    monkeypatch.setattr(Image.Image, "load", fail_load)
+
+    with pytest.raises(ImageTooLargeError):
+        process_image(content, (300, 300), max_pixels=640 * 480 - 1)
+
+
+async def test_process_image_async_uses_configured_pixel_limit(image_pool, monkeypatch):
+    monkeypatch.setattr(settings, "image_max_pixels", 1000)
+
+    with pytest.raises(ImageTooLargeError):
+        await process_image_async(_jpeg(), (300, 300))
+
+
+async def test_process_image_async_replaces_broken_pool(image_pool):
+    loop = asyncio.get_running_loop()
+    broken = get_image_executor()
+    # A worker exiting abruptly breaks the pool, as when it is killed for memory
+    with pytest.raises(Exception):
+        await loop.run_in_executor(broken, os._exit, 1)
+
+    image = await process_image_async(_jpeg(), (300, 300))
+
+    assert image.width == 640
+    assert image_processor._executor is not None
+    assert image_processor._executor is not broken
+
+
+@pytest.mark.parametrize(
+    ("value", "ref", "limit", "expected"),
+    [
+        ((51, 30, 36), "N", 90, 51.51),
+        ((51, 30, 36), "S", 90, -51.51),
+        ((179, 0, 0), "W", 180, -179.0),
+        ((91, 0, 0), "N", 90, None),
+        ((181, 0, 0), "E", 180, None),
+        ((float("nan"), 0, 0), "N", 90, None),
+        ((float("inf"), 0, 0), "E", 180, None),
+        ((51, 30), "N", 90, None),
+        (None, "N", 90, None),
+    ],
+)
+def test_parse_gps_coordinate(value, ref, limit, expected):
+    coordinate = image_processor._parse_gps_coordinate(value, ref, limit)
+
+    assert coordinate == pytest.approx(expected)
+
+
+def test_process_image_ignores_out_of_range_gps():
+    exif = Image.Exif()
+    gps = exif.get_ifd(ExifTags.IFD.GPSInfo)
+    gps[ExifTags.GPS.GPSLatitudeRef] = "N"
+    gps[ExifTags.GPS.GPSLatitude] = (95.0, 0.0, 0.0)
+    gps[ExifTags.GPS.GPSLongitudeRef] = "E"
+    gps[ExifTags.GPS.GPSLongitude] = (10.0, 0.0, 0.0)
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), "green").save(buffer, format="JPEG", exif=exif)
+
+    image = process_image(buffer.getvalue(), (300, 300), max_pixels=1_000_000)
+
+    assert image.latitude is None
+    assert image.longitude == pytest.approx(10.0)
@@ -0,0 +1,37 @@
+"""Tests for the locations API."""
+
+import pytest
+
+from app.models.location import Location
+
+
+@pytest.fixture
+async def location(db):
+    location = Location(name="Greenhouse", type="outdoor", timezone="Europe/Paris")
+    db.add(location)
+    await db.commit()
+    return location
+
+
+@pytest.mark.parametrize("field", ["timezone", "reminder_hour"])
+async def test_update_rejects_null_for_required_fields(client, location, field):
+    response = await client.put(f"/api/v1/locations/{location.id}", json={field: None})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", field]
+
+
+async def test_update_leaves_omitted_fields_alone(client, location):
+    response = await client.put(f"/api/v1/locations/{location.id}", json={"reminder_hour": 7})
+
+    assert response.status_code == 200
+    assert response.json()["timezone"] == "Europe/Paris"
+    assert response.json()["reminder_hour"] == 7
+
+
+async def test_update_rejects_unknown_timezone(client, location):
+    response = await client.put(
+        f"/api/v1/locations/{location.id}", json={"timezone": "Mars/Olympus_Mons"}
+    )
+
+    assert response.status_code == 422
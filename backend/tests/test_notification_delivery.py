@@ -0,0 +1,457 @@
+"""Tests for email and webhook delivery and the delivery worker."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import UUID, uuid4
+
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import select, update
+
+from app import delivery
+from app.config import settings
+from app.delivery import DeliveryError, RateLimiter
+from app.delivery.email import EmailSender
+from app.delivery.webhook import WebhookSender
+from app.models.notification_delivery import (
+    DeliveryChannel,
+    DeliveryStatus,
+    NotificationDelivery,
+)
+from app.services.notification_delivery_service import NotificationDeliveryService
+from app.workers.notification_delivery import NotificationDeliveryWorker
+
+NOTIFICATIONS = [
+    {"title": "Water the fern", "message": "Due today"},
+    {"title": "Feed the palm", "message": "Overdue by 2 days"},
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class SmtpHandler:
+    """Collects received messages; ``data_reply`` or ``rcpt_reply`` simulate errors."""
+
+    def __init__(self):
+        self.messages = []
+        self.data_reply = None
+        self.rcpt_reply = None
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if self.rcpt_reply:
+            return self.rcpt_reply
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.data_reply:
+            return self.data_reply
+        self.messages.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def smtp_server():
+    handler = SmtpHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+async def email_sender(smtp_server):
+    sender = EmailSender(
+        host=smtp_server.hostname,
+        port=smtp_server.port,
+        sender="plants@example.com",
+        timeout=5,
+        rate_per_minute=6000,
+    )
+    yield sender
+    await sender.close()
+
+
+class WebhookSink:
+    """
+    A local HTTP server recording webhook requests.
+
+    Each request is answered with the next queued ``(status, delay)``
+    response, or 200 once the queue is empty.
+    """
+
+    def __init__(self):
+        self.requests: list[tuple[dict, bytes]] = []
+        self.responses: list[tuple[int, float]] = []
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                sink.requests.append((dict(self.headers), body))
+                status, delay = sink.responses.pop(0) if sink.responses else (200, 0)
+                time.sleep(delay)
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def webhook_sink():
+    sink = WebhookSink()
+    yield sink
+    sink.close()
+
+
+@pytest.fixture
+async def webhook_sender():
+    sender = WebhookSender(secret="s3cret", timeout=0.5, rate_per_minute=6000)
+    yield sender
+    await sender.close()
+
+
+async def test_email_sender_sends_one_message_per_batch(email_sender, smtp_server):
+    await email_sender.send("a@example.com, b@example.com", NOTIFICATIONS)
+
+    [envelope] = smtp_server.handler.messages
+    assert envelope.mail_from == "plants@example.com"
+    assert envelope.rcpt_tos == ["a@example.com", "b@example.com"]
+    content = envelope.content.decode()
+    assert "Subject: 2 plant care reminders" in content
+    assert "Water the fern" in content and "Overdue by 2 days" in content
+
+
+async def test_email_sender_reuses_its_connection(email_sender, smtp_server):
+    await email_sender.send("a@example.com", NOTIFICATIONS[:1])
+    await email_sender.send("a@example.com", NOTIFICATIONS[1:])
+
+    assert len(smtp_server.handler.messages) == 2
+    assert email_sender._smtp.is_connected
+
+
+async def test_email_sender_temporary_failure_is_retryable(email_sender, smtp_server):
+    smtp_server.handler.data_reply = "451 Try again later"
+
+    with pytest.raises(DeliveryError) as error:
+        await email_sender.send("a@example.com", NOTIFICATIONS)
+
+    assert not error.value.permanent
+    smtp_server.handler.data_reply = None
+    await email_sender.send("a@example.com", NOTIFICATIONS)
+    assert len(smtp_server.handler.messages) == 1
+
+
+async def test_email_sender_refused_recipients_are_permanent(email_sender, smtp_server):
+    smtp_server.handler.rcpt_reply = "550 No such user"
+
+    with pytest.raises(DeliveryError) as error:
+        await email_sender.send("nobody@example.com", NOTIFICATIONS)
+
+    assert error.value.permanent
+
+
+async def test_email_sender_unreachable_server_is_retryable():
+    sender = EmailSender(host="127.0.0.1", port=_free_port(), sender="plants@example.com")
+
+    with pytest.raises(DeliveryError) as error:
+        await sender.send("a@example.com", NOTIFICATIONS)
+
+    assert not error.value.permanent
+    await sender.close()
+
+
+async def test_webhook_sender_posts_signed_json(webhook_sender, webhook_sink):
+    await webhook_sender.send(webhook_sink.url, NOTIFICATIONS)
+
+    [(headers, body)] = webhook_sink.requests
+    assert json.loads(body) == {"notifications": NOTIFICATIONS}
+    expected = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+    assert headers["X-Plants-Signature"] == f"sha256={expected}"
+
+
+@pytest.mark.parametrize(
+    ("status", "permanent"), [(500, False), (503, False), (429, False), (400, True), (404, True)]
+)
+async def test_webhook_sender_error_statuses(webhook_sender, webhook_sink, status, permanent):
+    webhook_sink.responses.append((status, 0))
+
+    with pytest.raises(DeliveryError) as error:
+        await webhook_sender.send(webhook_sink.url, NOTIFICATIONS)
+
+    assert error.value.permanent is permanent
+
+
+async def test_webhook_sender_timeout_is_retryable(webhook_sender, webhook_sink):
+    webhook_sink.responses.append((200, 1.0))
+
+    with pytest.raises(DeliveryError) as error:
+        await webhook_sender.send(webhook_sink.url, NOTIFICATIONS)
+
+    assert not error.value.permanent
+
+
+async def test_rate_limiter_allows_a_burst_then_waits_for_tokens():
+    limiter = RateLimiter(rate_per_minute=600, burst=3)  # a token every 0.1s
+
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire()
+    burst = time.monotonic() - start
+    for _ in range(2):
+        await limiter.acquire()
+    total = time.monotonic() - start
+
+    assert burst < 0.05
+    assert 0.18 <= total < 0.5
+
+
+async def test_rate_limiter_refills_while_idle():
+    limiter = RateLimiter(rate_per_minute=600, burst=2)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    await asyncio.sleep(0.25)
+    start = time.monotonic()
+    await limiter.acquire()
+    await limiter.acquire()
+
+    assert time.monotonic() - start < 0.05
+
+
+async def test_rate_limiter_takes_a_token_per_notification():
+    limiter = RateLimiter(rate_per_minute=600, burst=3)
+
+    start = time.monotonic()
+    await limiter.acquire(3)
+    batch = time.monotonic() - start
+    await limiter.acquire(2)
+
+    assert batch < 0.05
+    assert 0.18 <= time.monotonic() - start < 0.5
+
+
+async def test_rate_limiter_batch_over_burst_leaves_the_bucket_in_debt():
+    limiter = RateLimiter(rate_per_minute=600, burst=3)
+
+    start = time.monotonic()
+    await limiter.acquire(5)
+    batch = time.monotonic() - start
+    await limiter.acquire()
+
+    assert batch < 0.05
+    # Two tokens owed plus the one taken
+    assert 0.28 <= time.monotonic() - start < 0.6
+
+
+async def test_rate_limiter_default_burst_is_a_tenth_of_a_minute():
+    assert RateLimiter(rate_per_minute=60).capacity == 10
+    assert RateLimiter(rate_per_minute=3).capacity == 1
+
+
+@pytest.fixture
+async def delivery_settings(monkeypatch, smtp_server):
+    monkeypatch.setattr(settings, "smtp_host", smtp_server.hostname)
+    monkeypatch.setattr(settings, "smtp_port", smtp_server.port)
+    monkeypatch.setattr(settings, "notification_webhook_timeout_seconds", 0.5)
+    monkeypatch.setattr(settings, "notification_delivery_max_attempts", 3)
+    monkeypatch.setattr(settings, "notification_delivery_retry_base_seconds", 30)
+    yield
+    await delivery.close_senders()
+
+
+@pytest.fixture
+def worker(delivery_settings):
+    return NotificationDeliveryWorker(batch_size=10, poll_interval=1)
+
+
+async def _queue(db, channel: str, target: str, **values) -> UUID:
+    queued = NotificationDelivery(
+        notification_id=uuid4(),
+        channel=channel,
+        target=target,
+        payload=NOTIFICATIONS[0],
+        **values,
+    )
+    db.add(queued)
+    await db.commit()
+    return queued.id
+
+
+async def _reload(db, delivery_id) -> NotificationDelivery | None:
+    db.expire_all()
+    return await db.scalar(
+        select(NotificationDelivery).where(NotificationDelivery.id == delivery_id)
+    )
+
+
+async def _make_due(db, delivery_id) -> None:
+    await db.execute(
+        update(NotificationDelivery)
+        .where(NotificationDelivery.id == delivery_id)
+        .values(run_after=datetime.utcnow())
+    )
+    await db.commit()
+
+
+async def test_worker_sends_and_removes_deliveries(db, worker, webhook_sink, smtp_server):
+    webhook_id = await _queue(db, DeliveryChannel.WEBHOOK.value, webhook_sink.url)
+    email_id = await _queue(db, DeliveryChannel.EMAIL.value, "a@example.com")
+
+    assert await worker.run_once() == 2
+
+    assert len(webhook_sink.requests) == 1
+    assert len(smtp_server.handler.messages) == 1
+    assert await _reload(db, webhook_id) is None
+    assert await _reload(db, email_id) is None
+
+
+@pytest.mark.parametrize("response", [(503, 0), (200, 1.0)], ids=["5xx", "timeout"])
+async def test_worker_retries_with_backoff(db, worker, webhook_sink, response):
+    queued_id = await _queue(db, DeliveryChannel.WEBHOOK.value, webhook_sink.url)
+    webhook_sink.responses.append(response)
+
+    before = datetime.utcnow()
+    await worker.run_once()
+
+    retry = await _reload(db, queued_id)
+    assert retry.status == DeliveryStatus.QUEUED.value
+    assert retry.attempts == 1
+    assert retry.last_error
+    # Full jitter up to the base delay on the first retry
+    assert before <= retry.run_after <= datetime.utcnow() + timedelta(seconds=30)
+
+    await worker.run_once()
+    assert (await _reload(db, queued_id)).attempts == 1  # not due yet
+
+    await _make_due(db, queued_id)
+    await worker.run_once()
+    assert await _reload(db, queued_id) is None
+    assert len(webhook_sink.requests) == 2
+
+
+async def test_worker_backoff_grows_with_attempts(db, worker, webhook_sink, monkeypatch):
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+    queued_id = await _queue(db, DeliveryChannel.WEBHOOK.value, webhook_sink.url)
+    webhook_sink.responses.extend([(503, 0), (503, 0)])
+
+    delays = []
+    for _ in range(2):
+        start = datetime.utcnow()
+        await worker.run_once()
+        retry = await _reload(db, queued_id)
+        delays.append(round((retry.run_after - start).total_seconds()))
+        await _make_due(db, queued_id)
+
+    assert delays == [30, 60]
+
+
+async def test_worker_gives_up_after_max_attempts(db, worker, webhook_sink):
+    queued_id = await _queue(db, DeliveryChannel.WEBHOOK.value, webhook_sink.url)
+    webhook_sink.responses.extend([(503, 0)] * 3)
+
+    for _ in range(3):
+        await worker.run_once()
+        await _make_due(db, queued_id)
+
+    failed = await _reload(db, queued_id)
+    assert failed.status == DeliveryStatus.FAILED.value
+    assert failed.attempts == 3
+    assert "503" in failed.last_error
+    assert await worker.run_once() == 0
+    assert len(webhook_sink.requests) == 3
+
+
+async def test_worker_fails_permanent_errors_immediately(db, worker, webhook_sink):
+    queued_id = await _queue(db, DeliveryChannel.WEBHOOK.value, webhook_sink.url)
+    webhook_sink.responses.append((410, 0))
+
+    await worker.run_once()
+
+    failed = await _reload(db, queued_id)
+    assert failed.status == DeliveryStatus.FAILED.value
+    assert failed.attempts == 1
+
+
+async def test_worker_fails_abandoned_deliveries_out_of_attempts(db, worker, webhook_sink):
+    lock_timeout = timedelta(seconds=settings.notification_delivery_lock_timeout_seconds)
+    stale = datetime.utcnow() - lock_timeout - timedelta(seconds=1)
+    queued_id = await _queue(
+        db,
+        DeliveryChannel.WEBHOOK.value,
+        webhook_sink.url,
+        status=DeliveryStatus.RUNNING.value,
+        attempts=3,
+        locked_at=stale,
+    )
+
+    assert await worker.run_once() == 0
+
+    failed = await _reload(db, queued_id)
+    assert failed.status == DeliveryStatus.FAILED.value
+    assert webhook_sink.requests == []
+
+
+async def test_worker_rate_limits_each_delivery_in_a_batch(db, worker, webhook_sink, monkeypatch):
+    taken = []
+
+    async def acquire(self, tokens=1):
+        taken.append(tokens)
+
+    monkeypatch.setattr(RateLimiter, "acquire", acquire)
+    for _ in range(3):
+        await _queue(db, DeliveryChannel.WEBHOOK.value, webhook_sink.url)
+
+    assert await worker.run_once() == 3
+
+    assert len(webhook_sink.requests) == 1
+    assert taken == [3]
+
+
+async def test_delete_expired_failures_keeps_recent_and_pending_deliveries(db, monkeypatch):
+    monkeypatch.setattr(settings, "notification_cleanup_batch_size", 2)
+    old = datetime.utcnow() - timedelta(
+        days=settings.notification_delivery_failed_retention_days + 1
+    )
+    expired = [
+        await _queue(
+            db,
+            DeliveryChannel.EMAIL.value,
+            "a@example.com",
+            status=DeliveryStatus.FAILED.value,
+            created_at=old,
+        )
+        for _ in range(3)
+    ]
+    recent = await _queue(
+        db, DeliveryChannel.EMAIL.value, "a@example.com", status=DeliveryStatus.FAILED.value
+    )
+    pending = await _queue(db, DeliveryChannel.EMAIL.value, "a@example.com", created_at=old)
+
+    assert await NotificationDeliveryService(db).delete_expired_failures() == 3
+
+    assert [await _reload(db, delivery_id) for delivery_id in expired] == [None] * 3
+    assert await _reload(db, recent) is not None
+    assert await _reload(db, pending) is not None
@@ -0,0 +1,55 @@
+"""Tests for notification change events sent over LISTEN/NOTIFY."""
+
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy import func, select
+
+from app.models.notification import Notification
+from app.repositories.notification_repository import NotificationRepository
+from app.schemas.notification import NotificationCreate
+
+
+async def _next(events: asyncio.Queue) -> dict:
+    return await asyncio.wait_for(events.get(), timeout=5)
+
+
+async def test_create_many_publishes_one_small_event_for_a_large_digest(db, events):
+    # Serialized, the plant ids alone are well over the 8000-byte NOTIFY limit
+    digest = NotificationCreate(
+        type="watering_due",
+        title="250 plants need watering",
+        message="Water the greenhouse",
+        plant_ids=[uuid4() for _ in range(250)],
+    )
+    single = NotificationCreate(type="treatment_reminder", title="Treat", message="Spray")
+
+    await NotificationRepository(db).create_many([digest, single])
+
+    assert await _next(events) == {"event": "notifications.created", "unread": 2, "count": 2}
+    assert events.empty()
+    plant_counts = await db.scalars(select(func.cardinality(Notification.plant_ids)))
+    assert sorted(plant_counts, key=lambda count: count or 0) == [None, 250]
+
+
+async def test_single_changes_publish_the_notification_id_and_type(db, events):
+    repository = NotificationRepository(db)
+    notification = await repository.create(
+        NotificationCreate(type="watering_due", title="Water", message="Water the fern")
+    )
+    created = await _next(events)
+
+    await repository.mark_as_read(notification.id)
+
+    assert created == {
+        "event": "notification.created",
+        "unread": 1,
+        "notification_id": str(notification.id),
+        "type": "watering_due",
+    }
+    assert await _next(events) == {
+        "event": "notification.read",
+        "unread": 0,
+        "notification_id": str(notification.id),
+        "type": "watering_due",
+    }
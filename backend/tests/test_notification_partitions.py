@@ -0,0 +1,110 @@
+"""Tests for notification partition maintenance."""
+
+from datetime import datetime
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.models.notification import Notification, NotificationType
+from app.repositories.notification_repository import (
+    DEFAULT_PARTITION,
+    NotificationRepository,
+    _add_months,
+)
+from app.services.notification_service import NotificationService
+
+
+def _this_month():
+    return datetime.utcnow().date().replace(day=1)
+
+
+async def _partition_of(db, notification_id) -> str:
+    return await db.scalar(
+        text("SELECT tableoid::regclass::text FROM notifications WHERE id = :id"),
+        {"id": notification_id},
+    )
+
+
+async def test_ensure_partitions_moves_rows_out_of_default_partition(db):
+    month = _add_months(_this_month(), 1)
+    name = month.strftime("notifications_%Y_%m")
+    await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    notification = Notification(
+        type=NotificationType.WATERING_DUE,
+        title="Water the fern",
+        message="Due today",
+        created_at=datetime.combine(month, datetime.min.time()),
+    )
+    db.add(notification)
+    await db.commit()
+    assert await _partition_of(db, notification.id) == DEFAULT_PARTITION
+
+    created = await NotificationRepository(db).ensure_partitions(1)
+
+    assert created == [name]
+    assert await _partition_of(db, notification.id) == name
+    default = await db.scalar(
+        text(
+            "SELECT partdefid::regclass::text FROM pg_partitioned_table "
+            "WHERE partrelid = 'notifications'::regclass"
+        )
+    )
+    assert default == DEFAULT_PARTITION
+
+
+async def test_ensure_partitions_skips_existing_months(db):
+    repo = NotificationRepository(db)
+    await repo.ensure_partitions(2)
+
+    assert await repo.ensure_partitions(2) == []
+
+
+async def test_cleanup_drops_expired_partitions_when_creating_fails(db, monkeypatch):
+    expired = _add_months(_this_month(), -(settings.notification_retention_months + 2))
+    name = expired.strftime("notifications_%Y_%m")
+    await db.execute(
+        text(
+            f"CREATE TABLE {name} PARTITION OF notifications FOR VALUES "
+            f"FROM ('{expired}') TO ('{_add_months(expired, 1)}')"
+        )
+    )
+    await db.commit()
+
+    async def fail(self, months_ahead):
+        raise RuntimeError("lock timeout")
+
+    monkeypatch.setattr(NotificationRepository, "ensure_partitions", fail)
+
+    assert await NotificationService(db).cleanup_old_notifications() == 1
+    assert name not in await NotificationRepository(db).get_partitions()
+
+
+async def test_drop_expired_partitions_deletes_stray_default_rows_in_batches(db):
+    expired = _add_months(_this_month(), -(settings.notification_retention_months + 2))
+    name = expired.strftime("notifications_%Y_%m")
+    await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    stray = [
+        Notification(
+            type=NotificationType.WATERING_DUE,
+            title=f"Water plant {i}",
+            message="Due today",
+            created_at=datetime.combine(expired, datetime.min.time()),
+        )
+        for i in range(5)
+    ]
+    recent = Notification(
+        type=NotificationType.WATERING_DUE,
+        title="Water the fern",
+        message="Due today",
+        created_at=datetime.combine(_add_months(_this_month(), 120), datetime.min.time()),
+    )
+    db.add_all([*stray, recent])
+    await db.commit()
+    assert {await _partition_of(db, n.id) for n in [*stray, recent]} == {DEFAULT_PARTITION}
+
+    await NotificationRepository(db).drop_expired_partitions(
+        settings.notification_retention_months, batch_size=2
+    )
+
+    remaining = await db.scalars(text(f"SELECT id FROM {DEFAULT_PARTITION}"))
+    assert list(remaining) == [recent.id]
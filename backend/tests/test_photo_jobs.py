@@ -0,0 +1,166 @@
+"""Tests for the photo processing job queue."""
+
+import io
+from datetime import datetime, timedelta
+
+import pytest
+from PIL import ExifTags, Image
+from sqlalchemy import select
+
+from app.commands.backfill_photo_exif import backfill
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.photo import Photo, PhotoProcessingStatus
+from app.models.photo_job import PhotoJob, PhotoJobStatus
+from app.repositories.photo_job_repository import PhotoJobRepository
+from app.services.photo_processing_service import PhotoProcessingService
+from app.storage import LocalStorage
+from app.utils.image_processor import shutdown_image_executor
+
+LOCK_TIMEOUT = timedelta(minutes=5)
+MAX_ATTEMPTS = 3
+
+
+@pytest.fixture
+async def photo(db, plant):
+    photo = Photo(
+        plant_id=plant.id,
+        file_path="photos/a.jpg",
+        original_filename="a.jpg",
+        file_size=100,
+        mime_type="image/jpeg",
+        processing_status=PhotoProcessingStatus.PROCESSING.value,
+    )
+    db.add(photo)
+    await db.commit()
+    return photo
+
+
+async def _add_job(db, photo, **values) -> PhotoJob:
+    job = PhotoJob(photo_id=photo.id, **values)
+    db.add(job)
+    await db.commit()
+    return job
+
+
+async def _claim() -> list[PhotoJob]:
+    # A session of its own, as the worker uses
+    async with AsyncSessionLocal() as session:
+        return await PhotoJobRepository(session).claim_batch(10, LOCK_TIMEOUT, MAX_ATTEMPTS)
+
+
+async def test_claim_batch_claims_queued_jobs(db, photo):
+    job = await _add_job(db, photo)
+
+    claimed = await _claim()
+
+    assert [c.id for c in claimed] == [job.id]
+    assert claimed[0].status == PhotoJobStatus.RUNNING.value
+    assert claimed[0].attempts == 1
+
+
+async def test_claim_batch_skips_jobs_not_yet_due(db, photo):
+    await _add_job(db, photo, run_after=datetime.utcnow() + timedelta(minutes=1))
+
+    assert await _claim() == []
+
+
+async def test_claim_batch_reclaims_stale_running_jobs(db, photo):
+    stale = datetime.utcnow() - LOCK_TIMEOUT - timedelta(seconds=1)
+    job = await _add_job(
+        db, photo, status=PhotoJobStatus.RUNNING.value, attempts=1, locked_at=stale
+    )
+
+    claimed = await _claim()
+
+    assert [c.id for c in claimed] == [job.id]
+    assert claimed[0].attempts == 2
+
+
+async def test_claim_batch_leaves_recently_locked_jobs(db, photo):
+    await _add_job(
+        db, photo, status=PhotoJobStatus.RUNNING.value, attempts=1, locked_at=datetime.utcnow()
+    )
+
+    assert await _claim() == []
+
+
+async def test_claim_batch_fails_stale_jobs_out_of_attempts(db, photo):
+    stale = datetime.utcnow() - LOCK_TIMEOUT - timedelta(seconds=1)
+    job = await _add_job(
+        db, photo, status=PhotoJobStatus.RUNNING.value, attempts=MAX_ATTEMPTS, locked_at=stale
+    )
+
+    assert await _claim() == []
+
+    await db.refresh(job)
+    await db.refresh(photo)
+    assert job.status == PhotoJobStatus.FAILED.value
+    assert job.attempts == MAX_ATTEMPTS
+    assert job.locked_at is None
+    assert photo.processing_status == PhotoProcessingStatus.FAILED.value
+
+
+async def test_enqueue_skips_photos_with_active_jobs(db, photo, plant):
+    other = Photo(
+        plant_id=plant.id,
+        file_path="photos/b.jpg",
+        original_filename="b.jpg",
+        file_size=100,
+        mime_type="image/jpeg",
+    )
+    db.add(other)
+    await db.commit()
+    repo = PhotoJobRepository(db)
+
+    assert await repo.enqueue([photo.id]) == 1
+    assert await repo.enqueue([photo.id, other.id]) == 1
+    await db.commit()
+
+    jobs = (await db.scalars(select(PhotoJob))).all()
+    assert sorted(str(job.photo_id) for job in jobs) == sorted([str(photo.id), str(other.id)])
+
+
+async def test_enqueue_requeues_photos_whose_job_failed(db, photo):
+    await _add_job(db, photo, status=PhotoJobStatus.FAILED.value, attempts=MAX_ATTEMPTS)
+
+    assert await PhotoJobRepository(db).enqueue([photo.id]) == 1
+
+
+async def test_backfill_does_not_queue_photos_twice(db, photo):
+    await backfill(batch_size=10, missing_only=True, dry_run=False)
+    await backfill(batch_size=10, missing_only=True, dry_run=False)
+
+    jobs = (await db.scalars(select(PhotoJob))).all()
+    assert [job.photo_id for job in jobs] == [photo.id]
+
+
+@pytest.fixture
+def image_pool(monkeypatch):
+    monkeypatch.setattr(settings, "image_processing_workers", 1)
+    yield
+    shutdown_image_executor()
+
+
+async def test_process_job_keeps_the_original_and_stores_an_upright_copy(
+    db, photo, tmp_path, image_pool
+):
+    # Taken sideways: stored 64x32, displayed 32x64
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = 6
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 32), "green").save(buffer, format="JPEG", exif=exif.tobytes())
+    original = buffer.getvalue()
+    storage = LocalStorage(tmp_path)
+    await storage.save(photo.file_path, original)
+    job = await _add_job(db, photo, status=PhotoJobStatus.RUNNING.value, attempts=1)
+
+    assert await PhotoProcessingService(db, storage).process_job(job)
+
+    await db.refresh(photo)
+    assert await storage.read(photo.file_path) == original
+    assert photo.file_size == 100
+    assert photo.upright_path == "upright/upright_a.jpg"
+    assert Image.open(io.BytesIO(await storage.read(photo.upright_path))).size == (32, 64)
+    assert (photo.width, photo.height) == (32, 64)
+    assert photo.processing_status == PhotoProcessingStatus.READY.value
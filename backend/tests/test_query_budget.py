@@ -0,0 +1,155 @@
+"""Tests for per-request query budgets in strict mode."""
+
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.config import settings
+from app.models.fertilization import FertilizationLog, FertilizationSchedule
+from app.models.location import Location
+from app.models.plant import Plant
+from app.models.treatment import Treatment
+from app.models.watering import WateringLog, WateringSchedule
+from app.query_stats import (
+    QueryBudgetExceededError,
+    _is_strict,
+    install_query_hooks,
+    track_queries,
+)
+
+TODAY = date.today()
+
+# Installed by app.main on import; these tests also run without it
+install_query_hooks()
+
+ENDPOINTS = [
+    "/api/v1/locations/",
+    "/api/v1/watering/due?days_ahead=30",
+    "/api/v1/fertilization/due?days_ahead=30",
+    f"/api/v1/dashboard/calendar?start_date={TODAY - timedelta(days=30)}"
+    f"&end_date={TODAY + timedelta(days=60)}",
+]
+
+
+async def _grow_garden(db, plants: int) -> None:
+    """Plants spread over locations, each with schedules, logs and a treatment."""
+    locations = [Location(name=f"Room {i}", type="indoor") for i in range(max(1, plants // 3))]
+    db.add_all(locations)
+    await db.flush()
+    for i in range(plants):
+        plant = Plant(
+            name=f"Plant {i}",
+            type="indoor",
+            category="other",
+            location_id=locations[i % len(locations)].id,
+        )
+        db.add(plant)
+        await db.flush()
+        start = TODAY - timedelta(days=20 + i)
+        db.add_all(
+            [
+                WateringSchedule(plant_id=plant.id, frequency_days=7, start_date=start),
+                WateringLog(plant_id=plant.id, watered_at=datetime.utcnow() - timedelta(days=i)),
+                FertilizationSchedule(
+                    plant_id=plant.id, frequency_days=14, start_date=start, fertilizer_type="liquid"
+                ),
+                FertilizationLog(
+                    plant_id=plant.id, fertilized_at=datetime.utcnow() - timedelta(days=2 * i)
+                ),
+                Treatment(
+                    plant_id=plant.id,
+                    issue_type="pest",
+                    issue_name="Aphids",
+                    treatment_type="organic",
+                    start_date=TODAY - timedelta(days=i),
+                    end_date=TODAY + timedelta(days=i),
+                ),
+            ]
+        )
+    await db.commit()
+
+
+async def _query_count(client, url: str) -> int:
+    response = await client.get(url)
+    assert response.status_code == 200, response.text
+    # Server-Timing: db;dur=1.23;desc="4 queries", total;dur=5.67
+    return int(response.headers["Server-Timing"].split('desc="')[1].split(" ")[0])
+
+
+def test_strict_in_test_environment():
+    assert settings.environment == "test"
+    assert _is_strict()
+
+
+def test_strict_when_configured(monkeypatch):
+    monkeypatch.setattr(settings, "environment", "production")
+    assert not _is_strict()
+
+    monkeypatch.setattr(settings, "query_budget_strict", True)
+    assert _is_strict()
+
+
+async def test_track_queries_raises_past_budget_in_strict_mode(db):
+    with track_queries(budget=2) as stats:
+        await db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 2"))
+        with pytest.raises(QueryBudgetExceededError, match="budget of 2 exceeded by: SELECT 3"):
+            await db.execute(text("SELECT 3"))
+
+    assert stats.count == 3
+    assert stats.over_budget
+
+
+async def test_statement_refused_over_budget_keeps_other_timings(db):
+    connection = await db.connection()
+    # The timing of a statement still running on this connection
+    running = (object(), time.perf_counter(), None)
+    starts = connection.info.setdefault("query_starts", [])
+    starts.append(running)
+    try:
+        with track_queries(budget=0):
+            with pytest.raises(QueryBudgetExceededError):
+                await db.execute(text("SELECT 1"))
+        assert starts == [running]
+
+        # A statement failing in the database drops its own timing only
+        with pytest.raises(DBAPIError):
+            await db.execute(text("SELECT 1 / 0"))
+        assert starts == [running]
+    finally:
+        starts.clear()
+
+
+async def test_track_queries_only_counts_when_not_strict(db, monkeypatch):
+    monkeypatch.setattr(settings, "environment", "production")
+
+    with track_queries(budget=1) as stats:
+        await db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 2"))
+
+    assert stats.over_budget
+
+
+@pytest.mark.parametrize("url", ENDPOINTS)
+async def test_endpoint_queries_do_not_grow_with_the_garden(client, db, url):
+    await _grow_garden(db, plants=2)
+    small = await _query_count(client, url)
+    await _grow_garden(db, plants=12)
+
+    assert await _query_count(client, url) == small
+
+
+@pytest.mark.parametrize("url", ENDPOINTS)
+async def test_endpoint_fails_over_budget_in_strict_mode(client, db, url, monkeypatch):
+    await _grow_garden(db, plants=6)
+    queries = await _query_count(client, url)
+
+    monkeypatch.setattr(settings, "query_budget", queries)
+    assert await _query_count(client, url) == queries
+
+    monkeypatch.setattr(settings, "query_budget", queries - 1)
+    with pytest.raises(QueryBudgetExceededError):
+        await client.get(url)
@@ -0,0 +1,101 @@
+"""Tests for clearing the response caches when the tables behind them change."""
+
+import asyncio
+import json
+
+import asyncpg
+import pytest
+from sqlalchemy import update
+
+from app.config import settings
+from app.events import NOTIFICATION_CHANNEL, notification_broadcaster
+from app.models.location import Location
+from app.models.plant import Plant
+from app.response_cache import CACHE_INVALIDATED_EVENT, ResponseCache, _caches
+
+
+class CountingCache:
+    """A cache of the plants table, counting how often its entry is built."""
+
+    def __init__(self):
+        self.cache = ResponseCache("test", tables={"plants"})
+        self.builds = 0
+
+    async def build(self):
+        self.builds += 1
+        return {"build": self.builds}
+
+    async def get(self) -> None:
+        await self.cache._get("key", self.build, None)
+
+    @property
+    def cached(self) -> bool:
+        return "key" in self.cache._entries
+
+
+@pytest.fixture
+def plants_cache(monkeypatch):
+    monkeypatch.setattr(settings, "response_cache_seconds", 30.0)
+    counting = CountingCache()
+    yield counting
+    _caches.remove(counting.cache)
+
+
+async def _next(events: asyncio.Queue) -> dict:
+    return await asyncio.wait_for(events.get(), timeout=5)
+
+
+async def test_bulk_update_clears_the_cache(db, plant, plants_cache, events):
+    await plants_cache.get()
+    await plants_cache.get()
+    assert plants_cache.builds == 1
+
+    await db.execute(update(Plant).where(Plant.id == plant.id).values(name="Palm"))
+    await db.commit()
+
+    await plants_cache.get()
+    assert plants_cache.builds == 2
+    # Other processes are told too
+    assert await _next(events) == {"event": CACHE_INVALIDATED_EVENT, "tables": ["plants"]}
+
+
+async def test_unrelated_changes_keep_the_cache(db, plants_cache):
+    await plants_cache.get()
+
+    db.add(Location(name="Greenhouse", type="outdoor"))
+    await db.commit()
+
+    await plants_cache.get()
+    assert plants_cache.builds == 1
+
+
+async def test_rolled_back_changes_keep_the_cache(db, plant, plants_cache, events):
+    await plants_cache.get()
+
+    await db.execute(update(Plant).values(name="Palm"))
+    await db.rollback()
+
+    await plants_cache.get()
+    assert plants_cache.builds == 1
+    # The next transaction changing the table is still published
+    await db.execute(update(Plant).values(name="Palm"))
+    await db.commit()
+    assert await _next(events) == {"event": CACHE_INVALIDATED_EVENT, "tables": ["plants"]}
+
+
+async def test_invalidation_from_another_process_clears_the_cache(database, plants_cache):
+    connection = await asyncpg.connect(settings.database_url.replace("+asyncpg", "", 1))
+    invalidation = json.dumps({"event": CACHE_INVALIDATED_EVENT, "tables": ["plants"]})
+    notification_broadcaster.start()
+    try:
+        await plants_cache.get()
+        # Sent until the broadcaster, which connects in the background, receives it
+        async with asyncio.timeout(5):
+            while plants_cache.cached:
+                await connection.execute(
+                    "SELECT pg_notify($1, $2)", NOTIFICATION_CHANNEL, invalidation
+                )
+                await asyncio.sleep(0.05)
+    finally:
+        await notification_broadcaster.close()
+        await connection.close()
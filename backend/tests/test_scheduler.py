@@ -0,0 +1,200 @@
+"""Tests for the background job scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import select
+
+from app.config import settings
+from app.models.job_run import JobRun, JobRunStatus, JobTrigger
+from app.scheduler import (
+    DUE_TASKS_CATCH_UP_HOURS,
+    JOBS_BY_ID,
+    SCHEDULER_LOCK_ID,
+    SchedulerLeaderElection,
+    _schedule_jobs,
+    check_due_tasks_job,
+    run_job,
+    scheduler,
+)
+from app.services.job_run_service import JobResult
+from app.services.notification_service import NotificationService
+
+
+@pytest.fixture
+async def job_store(database):
+    """The scheduler started paused on the persistent job store, emptied afterwards."""
+    scheduler.start(paused=True)
+    yield scheduler
+    scheduler.remove_all_jobs()
+    scheduler.shutdown(wait=False)
+
+
+async def test_schedule_jobs_registers_every_job(job_store):
+    _schedule_jobs()
+
+    assert {job.id for job in job_store.get_jobs()} == set(JOBS_BY_ID)
+
+
+async def test_schedule_jobs_removes_jobs_no_longer_defined(job_store):
+    job_store.add_job(run_job, CronTrigger(hour=4), args=("retired_job",), id="retired_job")
+
+    _schedule_jobs()
+
+    assert job_store.get_job("retired_job") is None
+    assert {job.id for job in job_store.get_jobs()} == set(JOBS_BY_ID)
+
+
+async def test_schedule_jobs_keeps_missed_run_times(job_store):
+    _schedule_jobs()
+    missed = datetime.now(timezone.utc) - timedelta(minutes=5)
+    job_store.get_job("check_due_tasks").modify(next_run_time=missed)
+
+    _schedule_jobs()
+
+    assert job_store.get_job("check_due_tasks").next_run_time == missed
+
+
+@pytest.fixture
+def checked_hours(monkeypatch):
+    """The ``now`` of every due task check, which is replaced by a recorder."""
+    hours = []
+
+    async def check_due_tasks(self, now=None):
+        hours.append(now)
+        return 1
+
+    monkeypatch.setattr(NotificationService, "check_due_tasks", check_due_tasks)
+    return hours
+
+
+async def _succeeded_run(db, hours_ago: int) -> None:
+    db.add(
+        JobRun(
+            job_id="check_due_tasks",
+            trigger=JobTrigger.SCHEDULED.value,
+            status=JobRunStatus.SUCCEEDED.value,
+            started_at=datetime.utcnow() - timedelta(hours=hours_ago),
+        )
+    )
+    await db.commit()
+
+
+def _assert_consecutive_hours(hours: list[datetime], count: int) -> None:
+    assert len(hours) == count
+    assert all(hour.minute == hour.second == hour.microsecond == 0 for hour in hours)
+    assert all(b - a == timedelta(hours=1) for a, b in zip(hours, hours[1:]))
+    assert datetime.now(timezone.utc) - hours[-1] < timedelta(hours=1)
+
+
+async def test_check_due_tasks_job_checks_this_hour_on_first_run(db, checked_hours):
+    result = await check_due_tasks_job(db)
+
+    _assert_consecutive_hours(checked_hours, 1)
+    assert result.items_processed == 1
+
+
+async def test_check_due_tasks_job_catches_up_missed_hours(db, checked_hours):
+    await _succeeded_run(db, hours_ago=3)
+
+    result = await check_due_tasks_job(db)
+
+    _assert_consecutive_hours(checked_hours, 3)
+    assert result.items_processed == 3
+    assert result.details == {"hours_checked": 3}
+
+
+async def test_check_due_tasks_job_ignores_failed_runs(db, checked_hours):
+    await _succeeded_run(db, hours_ago=4)
+    db.add(
+        JobRun(
+            job_id="check_due_tasks",
+            trigger=JobTrigger.SCHEDULED.value,
+            status=JobRunStatus.FAILED.value,
+            started_at=datetime.utcnow() - timedelta(hours=1),
+        )
+    )
+    await db.commit()
+
+    await check_due_tasks_job(db)
+
+    _assert_consecutive_hours(checked_hours, 4)
+
+
+async def test_check_due_tasks_job_catches_up_at_most_a_day(db, checked_hours):
+    await _succeeded_run(db, hours_ago=100)
+
+    await check_due_tasks_job(db)
+
+    _assert_consecutive_hours(checked_hours, DUE_TASKS_CATCH_UP_HOURS)
+
+
+ADMIN_HEADERS = {"X-Admin-Token": "admin-secret"}
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", ADMIN_HEADERS["X-Admin-Token"])
+
+
+@pytest.fixture
+async def leader(database):
+    """This process as the scheduler leader; its stored jobs are removed afterwards."""
+    election = SchedulerLeaderElection(
+        settings.database_url.replace("+asyncpg", "", 1), SCHEDULER_LOCK_ID, retry_interval=0.1
+    )
+    election.start()
+    async with asyncio.timeout(5):
+        while not election.is_leader:
+            await asyncio.sleep(0.05)
+    yield election
+    scheduler.remove_all_jobs()
+    await election.stop()
+
+
+@pytest.fixture
+def cleanup_runs(monkeypatch):
+    """The tasks running the cleanup job, which is replaced by a recorder."""
+    tasks = []
+
+    async def cleanup(db):
+        tasks.append(asyncio.current_task())
+        return JobResult(3)
+
+    monkeypatch.setitem(JOBS_BY_ID["cleanup_old_notifications"], "task", cleanup)
+    return tasks
+
+
+async def test_trigger_job_hands_the_run_to_the_leader(client, db, admin, leader, cleanup_runs):
+    response = await client.post(
+        "/api/v1/admin/jobs/cleanup_old_notifications/run", headers=ADMIN_HEADERS
+    )
+
+    assert response.status_code == 202
+    assert response.json()["status"] == JobRunStatus.RUNNING.value
+    run_id = UUID(response.json()["id"])
+    async with asyncio.timeout(5):
+        while True:
+            run = await db.get(JobRun, run_id, populate_existing=True)
+            if run.status != JobRunStatus.RUNNING.value:
+                break
+            await asyncio.sleep(0.05)
+    assert run.status == JobRunStatus.SUCCEEDED.value
+    assert run.trigger == JobTrigger.MANUAL.value
+    assert run.items_processed == 3
+    # Run by the scheduler, not by the request
+    assert len(cleanup_runs) == 1
+    assert scheduler.get_jobs(jobstore="manual") == []
+
+
+async def test_trigger_job_without_a_leader_is_refused(client, db, admin, cleanup_runs):
+    response = await client.post(
+        "/api/v1/admin/jobs/cleanup_old_notifications/run", headers=ADMIN_HEADERS
+    )
+
+    assert response.status_code == 503
+    assert (await db.scalars(select(JobRun))).all() == []
+    assert cleanup_runs == []
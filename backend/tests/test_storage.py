@@ -0,0 +1,202 @@
+"""Tests for the local filesystem and S3 storage backends."""
+
+import socket
+from datetime import datetime
+
+import boto3
+import httpx
+import pytest
+from moto.server import ThreadedMotoServer
+
+from app.storage import LocalStorage, StorageError
+from app.storage.s3 import MIN_PART_SIZE, S3Storage
+
+BUCKET = "plants-test"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def s3_endpoint():
+    """A moto S3 server on a local port, shared by the module's tests."""
+    port = _free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def s3_client(s3_endpoint):
+    """A synchronous client for setting up and inspecting the bucket."""
+    client = boto3.client(
+        "s3",
+        endpoint_url=s3_endpoint,
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+    client.create_bucket(Bucket=BUCKET)
+    yield client
+    for page in client.get_paginator("list_objects_v2").paginate(Bucket=BUCKET):
+        for item in page.get("Contents", []):
+            client.delete_object(Bucket=BUCKET, Key=item["Key"])
+    client.delete_bucket(Bucket=BUCKET)
+
+
+@pytest.fixture
+async def local_storage(tmp_path):
+    return LocalStorage(tmp_path / "uploads")
+
+
+@pytest.fixture
+async def s3_storage(s3_endpoint, s3_client):
+    storage = S3Storage(
+        endpoint_url=s3_endpoint,
+        bucket=BUCKET,
+        access_key="testing",
+        secret_key="testing",
+        multipart_threshold=MIN_PART_SIZE,
+    )
+    yield storage
+    await storage.close()
+
+
+@pytest.fixture(params=["local", "s3"])
+def storage(request):
+    """Each backend in turn, for behaviour both must share."""
+    return request.getfixturevalue(f"{request.param}_storage")
+
+
+async def test_save_and_read(storage):
+    await storage.save("photos/a.jpg", b"jpeg bytes", "image/jpeg")
+
+    assert await storage.read("photos/a.jpg") == b"jpeg bytes"
+
+
+async def test_save_replaces_existing_object(storage):
+    await storage.save("photos/a.jpg", b"old")
+    await storage.save("photos/a.jpg", b"new")
+
+    assert await storage.read("photos/a.jpg") == b"new"
+
+
+async def test_read_missing_object_raises(storage):
+    with pytest.raises(StorageError):
+        await storage.read("photos/missing.jpg")
+
+
+async def test_exists(storage):
+    await storage.save("photos/a.jpg", b"data")
+
+    assert await storage.exists("photos/a.jpg")
+    assert not await storage.exists("photos/missing.jpg")
+
+
+async def test_delete(storage):
+    await storage.save("photos/a.jpg", b"data")
+
+    await storage.delete("photos/a.jpg")
+
+    assert not await storage.exists("photos/a.jpg")
+
+
+async def test_delete_missing_object_is_ignored(storage):
+    await storage.delete("photos/missing.jpg")
+
+
+async def test_iter_objects_lists_prefix_in_batches(storage):
+    keys = {f"photos/{i}.jpg" for i in range(5)} | {"photos/thumbnails/0_thumb.jpg"}
+    for key in keys:
+        await storage.save(key, b"12345")
+    await storage.save("exports/other.csv", b"elsewhere")
+
+    batches = [batch async for batch in storage.iter_objects("photos", batch_size=2)]
+
+    assert all(len(batch) <= 2 for batch in batches)
+    objects = [obj for batch in batches for obj in batch]
+    assert {obj.key for obj in objects} == keys
+    assert all(obj.size == 5 for obj in objects)
+    assert all(isinstance(obj.modified_at, datetime) for obj in objects)
+    assert all(obj.modified_at.tzinfo is None for obj in objects)
+
+
+async def test_iter_objects_missing_prefix_is_empty(storage):
+    assert [batch async for batch in storage.iter_objects("photos")] == []
+
+
+@pytest.mark.parametrize("key", ["../outside.jpg", "photos/../../outside.jpg", "/etc/passwd"])
+async def test_local_storage_rejects_keys_outside_root(local_storage, key):
+    with pytest.raises(StorageError):
+        await local_storage.save(key, b"data")
+    with pytest.raises(StorageError):
+        await local_storage.read(key)
+    with pytest.raises(StorageError):
+        local_storage.local_path(key)
+
+
+async def test_local_storage_has_no_presigned_urls(local_storage):
+    await local_storage.save("photos/a.jpg", b"data")
+
+    assert await local_storage.presigned_url("photos/a.jpg") is None
+    assert local_storage.local_path("photos/a.jpg") == local_storage.root / "photos" / "a.jpg"
+
+
+async def test_local_storage_leaves_no_temporary_files(local_storage):
+    await local_storage.save("photos/a.jpg", b"data")
+
+    assert [p.name for p in (local_storage.root / "photos").iterdir()] == ["a.jpg"]
+
+
+async def test_s3_large_payload_uses_multipart_upload(s3_storage, s3_client):
+    data = bytes(range(256)) * (MIN_PART_SIZE * 2 // 256 + 1000)
+
+    await s3_storage.save("photos/large.jpg", data, "image/jpeg")
+
+    head = s3_client.head_object(Bucket=BUCKET, Key="photos/large.jpg")
+    # Multipart ETags end with the number of parts
+    assert head["ETag"].strip('"').endswith("-3")
+    assert head["ContentType"] == "image/jpeg"
+    assert await s3_storage.read("photos/large.jpg") == data
+    assert s3_client.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+
+
+async def test_s3_failed_multipart_upload_is_aborted(s3_storage, s3_client, monkeypatch):
+    client = await s3_storage._get_client()
+    upload_part = client.upload_part
+
+    async def failing_upload_part(**kwargs):
+        if kwargs["PartNumber"] == 2:
+            raise ConnectionError("connection reset")
+        return await upload_part(**kwargs)
+
+    monkeypatch.setattr(client, "upload_part", failing_upload_part)
+
+    with pytest.raises(ConnectionError):
+        await s3_storage.save("photos/large.jpg", b"x" * (MIN_PART_SIZE * 2 + 1))
+
+    assert s3_client.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+    assert not await s3_storage.exists("photos/large.jpg")
+
+
+async def test_s3_presigned_url_downloads_object(s3_storage):
+    await s3_storage.save("photos/a.jpg", b"jpeg bytes", "image/jpeg")
+
+    url = await s3_storage.presigned_url("photos/a.jpg", content_type="image/jpeg", expires_in=60)
+
+    assert "X-Amz-Expires=60" in url
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url)
+    assert response.status_code == 200
+    assert response.content == b"jpeg bytes"
+    assert response.headers["content-type"] == "image/jpeg"
+
+
+async def test_s3_presigned_url_uses_default_expiry(s3_storage):
+    url = await s3_storage.presigned_url("photos/a.jpg")
+
+    assert f"X-Amz-Expires={s3_storage.presigned_url_expiry}" in url
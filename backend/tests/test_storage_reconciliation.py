@@ -0,0 +1,86 @@
+"""Tests for reconciling stored photo files with the photos table."""
+
+import os
+import time
+
+import pytest
+
+from app.models.photo import Photo
+from app.services.storage_reconciliation_service import StorageReconciliationService
+from app.storage import LocalStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorage(tmp_path)
+
+
+async def _add_photo(db, plant, file_path, thumbnail_path=None, upright_path=None):
+    db.add(
+        Photo(
+            plant_id=plant.id,
+            file_path=file_path,
+            thumbnail_path=thumbnail_path,
+            upright_path=upright_path,
+            original_filename=file_path.rsplit("/", 1)[-1],
+            file_size=4,
+            mime_type="image/jpeg",
+        )
+    )
+    await db.commit()
+
+
+async def _save_old(storage, key):
+    await storage.save(key, b"data")
+    day_ago = time.time() - 2 * 86400
+    os.utime(storage.local_path(key), (day_ago, day_ago))
+
+
+async def test_reconcile_reports_missing_files_and_thumbnails(db, plant, storage):
+    await storage.save("photos/complete.jpg", b"data")
+    await storage.save("thumbnails/thumb_complete.jpg", b"data")
+    await _add_photo(db, plant, "photos/complete.jpg", "thumbnails/thumb_complete.jpg")
+    await storage.save("photos/no-thumb.jpg", b"data")
+    await _add_photo(db, plant, "photos/no-thumb.jpg", "thumbnails/thumb_no-thumb.jpg")
+    await storage.save("photos/pending.jpg", b"data")
+    await _add_photo(db, plant, "photos/pending.jpg")
+    await _add_photo(db, plant, "photos/gone.jpg")
+    await storage.save("photos/sideways.jpg", b"data")
+    await _add_photo(db, plant, "photos/sideways.jpg", upright_path="upright/upright_sideways.jpg")
+
+    report = await StorageReconciliationService(db, storage).reconcile(dry_run=True)
+
+    assert report.photos_scanned == 5
+    assert report.missing_files == 2
+    assert sorted(report.missing_file_keys) == ["photos/gone.jpg", "upright/upright_sideways.jpg"]
+    assert report.missing_thumbnails == 1
+    assert report.missing_thumbnail_keys == ["thumbnails/thumb_no-thumb.jpg"]
+    assert [(u.plant_id, u.photo_count, u.bytes) for u in report.usage_by_plant] == [
+        (plant.id, 4, 16)
+    ]
+
+
+async def test_reconcile_deletes_old_orphans_only(db, plant, storage):
+    await _save_old(storage, "photos/kept.jpg")
+    await _save_old(storage, "thumbnails/thumb_kept.jpg")
+    await _save_old(storage, "upright/upright_kept.jpg")
+    await _add_photo(
+        db, plant, "photos/kept.jpg", "thumbnails/thumb_kept.jpg", "upright/upright_kept.jpg"
+    )
+    await _save_old(storage, "photos/orphan.jpg")
+    await _save_old(storage, "thumbnails/thumb_orphan.jpg")
+    await _save_old(storage, "upright/upright_orphan.jpg")
+    # Uploaded moments ago; its photo row may not be committed yet
+    await storage.save("photos/recent.jpg", b"data")
+
+    report = await StorageReconciliationService(db, storage).reconcile()
+
+    assert report.files_scanned == 7
+    assert report.orphaned_files == report.deleted_files == 3
+    assert not await storage.exists("photos/orphan.jpg")
+    assert not await storage.exists("thumbnails/thumb_orphan.jpg")
+    assert not await storage.exists("upright/upright_orphan.jpg")
+    assert await storage.exists("photos/kept.jpg")
+    assert await storage.exists("thumbnails/thumb_kept.jpg")
+    assert await storage.exists("upright/upright_kept.jpg")
+    assert await storage.exists("photos/recent.jpg")
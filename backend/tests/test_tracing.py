@@ -0,0 +1,89 @@
+"""Tests of the traces exported for a request, read back from the file exporter."""
+
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app import tracing
+from app.api.v1 import api_router
+from app.config import settings
+from app.models.location import Location
+from app.models.plant import Plant
+from app.query_stats import install_query_hooks
+
+
+def _read_spans(path) -> dict[str, dict]:
+    """Spans from OTLP/JSON lines, by span id."""
+    spans = {}
+    for line in path.read_text().splitlines():
+        for resource_spans in json.loads(line)["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                for span in scope_spans["spans"]:
+                    spans[span["spanId"]] = span
+    return spans
+
+
+def _attribute(span: dict, key: str) -> str | None:
+    for attribute in span.get("attributes", []):
+        if attribute["key"] == key:
+            return attribute["value"].get("stringValue")
+    return None
+
+
+@pytest.fixture
+def traced_app(monkeypatch, tmp_path):
+    """An app exporting its traces to a file, which it yields with the app."""
+    if tracing.TracerProvider is None:
+        pytest.skip("Tracing needs the tracing extra")
+
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(settings, "tracing_exporter", "file")
+    monkeypatch.setattr(settings, "tracing_file_path", str(path))
+    install_query_hooks()
+
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api/v1")
+    assert tracing.setup_tracing("plants-manager-test", app)
+    try:
+        yield app, path
+    finally:
+        tracing.shutdown_tracing()
+
+
+async def test_request_spans_nest_service_repository_and_sql(db, traced_app):
+    app, path = traced_app
+    location = Location(name="Greenhouse", type="outdoor")
+    db.add(location)
+    await db.flush()
+    db.add(Plant(name="Fern", type="outdoor", category="other", location_id=location.id))
+    await db.commit()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/locations/")
+    assert response.status_code == 200
+    tracing.shutdown_tracing()
+
+    spans = _read_spans(path)
+    sql = next(
+        span
+        for span in spans.values()
+        if span["kind"] == "SPAN_KIND_CLIENT"
+        and "FROM locations" in (_attribute(span, "db.statement") or "")
+    )
+    chain = [sql]
+    while chain[-1].get("parentSpanId"):
+        chain.append(spans[chain[-1]["parentSpanId"]])
+
+    assert [span["name"] for span in chain[1:]] == [
+        "LocationRepository.get_all_with_plant_counts",
+        "LocationService.get_all_locations",
+        "GET /api/v1/locations/",
+    ]
+    assert chain[-1]["kind"] == "SPAN_KIND_SERVER"
+    assert {span["traceId"] for span in chain} == {chain[0]["traceId"]}
+    assert _attribute(sql, "db.system") == "postgresql"
+    # The per-message ASGI spans are excluded
+    assert not [span for span in spans.values() if span["name"].endswith((" send", " receive"))]
@@ -17,7 +17,7 @@ describe('LocationForm', () => {
 
     expect(screen.getByLabelText(/name/i)).toHaveValue('Living Room')
     expect(screen.getByLabelText(/description/i)).toHaveValue('South-facing window')
-    expect(screen.getByLabelText(/zone/i)).toHaveValue('Main floor')
+    expect(screen.getByLabelText(/^zone$/i)).toHaveValue('Main floor')
     expect(screen.getByRole('button', { name: /update location/i })).toBeInTheDocument()
   })
 
@@ -30,7 +30,7 @@ describe('LocationForm', () => {
     await user.type(screen.getByLabelText(/name/i), 'Kitchen')
     await user.click(screen.getByRole('combobox', { name: /type/i }))
     await user.click(screen.getByRole('option', { name: /indoor/i }))
-    await user.type(screen.getByLabelText(/zone/i), 'Ground floor')
+    await user.type(screen.getByLabelText(/^zone$/i), 'Ground floor')
     await user.type(screen.getByLabelText(/description/i), 'Next to sink')
 
     await user.click(screen.getByRole('button', { name: /create location/i }))
@@ -41,6 +41,8 @@ describe('LocationForm', () => {
         type: 'indoor',
         zone: 'Ground floor',
         description: 'Next to sink',
+        timezone: expect.any(String),
+        reminder_hour: 8,
       })
     })
   })
@@ -63,6 +65,8 @@ describe('LocationForm', () => {
         type: 'outdoor',
         zone: null,
         description: null,
+        timezone: expect.any(String),
+        reminder_hour: 8,
       })
     })
   })
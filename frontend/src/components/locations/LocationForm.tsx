@@ -29,6 +29,8 @@ export function LocationForm({ location, onSubmit, onCancel, isLoading }: Locati
     type: location?.type || 'indoor',
     description: location?.description || '',
     zone: location?.zone || '',
+    timezone: location?.timezone || Intl.DateTimeFormat().resolvedOptions().timeZone || 'UTC',
+    reminder_hour: location?.reminder_hour ?? 8,
   });
 
   const handleSubmit = (e: React.FormEvent) => {
@@ -38,6 +40,8 @@ export function LocationForm({ location, onSubmit, onCancel, isLoading }: Locati
       type: formData.type as 'indoor' | 'outdoor',
       description: formData.description || null,
       zone: formData.zone || null,
+      timezone: formData.timezone,
+      reminder_hour: formData.reminder_hour,
     });
   };
 
@@ -83,6 +87,31 @@ export function LocationForm({ location, onSubmit, onCancel, isLoading }: Locati
         />
       </div>
 
+      <div className="grid grid-cols-2 gap-4">
+        <div className="space-y-2">
+          <Label htmlFor="timezone">Timezone</Label>
+          <Input
+            id="timezone"
+            value={formData.timezone}
+            onChange={(e) => setFormData({ ...formData, timezone: e.target.value })}
+            placeholder="e.g., Europe/Paris"
+            disabled={isLoading}
+          />
+        </div>
+        <div className="space-y-2">
+          <Label htmlFor="reminder_hour">Reminder hour</Label>
+          <Input
+            id="reminder_hour"
+            type="number"
+            min={0}
+            max={23}
+            value={formData.reminder_hour}
+            onChange={(e) => setFormData({ ...formData, reminder_hour: Number(e.target.value) })}
+            disabled={isLoading}
+          />
+        </div>
+      </div>
+
       <div className="space-y-2">
         <Label htmlFor="description">Description</Label>
         <Textarea
@@ -11,11 +11,12 @@ import {
   PopoverContent,
   PopoverTrigger,
 } from '@/components/ui/popover';
-import { useNotificationStats } from '@/hooks/useNotifications';
+import { useNotificationStats, useNotificationStream } from '@/hooks/useNotifications';
 import { NotificationList } from './NotificationList';
 
 export function NotificationBell() {
   const { data: stats } = useNotificationStats();
+  useNotificationStream();
   const [open, setOpen] = useState(false);
 
   const unreadCount = stats?.unread || 0;
@@ -2,6 +2,7 @@
  * NotificationList component - Displays list of notifications
  */
 
+import { useState } from 'react';
 import { formatDistanceToNow } from 'date-fns';
 import { Link } from 'react-router-dom';
 import { Bell, Check, CheckCheck, Droplet, Sprout, X } from 'lucide-react';
@@ -10,6 +11,7 @@ import { ScrollArea } from '@/components/ui/scroll-area';
 import { Separator } from '@/components/ui/separator';
 import {
   useNotifications,
+  useNotificationItems,
   useMarkNotificationAsRead,
   useMarkAllNotificationsAsRead,
   useDeleteNotification,
@@ -36,6 +38,42 @@ const COLOR_MAP = {
   treatment_reminder: 'text-purple-600',
 };
 
+function DigestPlants({ notification, onClose }: { notification: Notification; onClose?: () => void }) {
+  const [expanded, setExpanded] = useState(false);
+  const { data: items = [], isLoading } = useNotificationItems(notification.id, expanded);
+
+  return (
+    <div className="mt-1">
+      <button
+        type="button"
+        className="text-xs text-primary hover:underline"
+        onClick={() => setExpanded(!expanded)}
+      >
+        {expanded ? 'Hide plants' : `Show ${notification.plant_ids?.length ?? 0} plants`}
+      </button>
+      {expanded && (
+        <ul className="mt-1 space-y-0.5">
+          {isLoading ? (
+            <li className="text-xs text-muted-foreground">Loading...</li>
+          ) : (
+            items.map((item) => (
+              <li key={item.plant_id}>
+                <Link
+                  to={`/plants/${item.plant_id}`}
+                  className="text-xs hover:underline"
+                  onClick={onClose}
+                >
+                  {item.plant_name}
+                </Link>
+              </li>
+            ))
+          )}
+        </ul>
+      )}
+    </div>
+  );
+}
+
 export function NotificationList({ onClose }: NotificationListProps) {
   const { data: notifications = [], isLoading } = useNotifications();
   const markAsReadMutation = useMarkNotificationAsRead();
@@ -133,6 +171,10 @@ export function NotificationList({ onClose }: NotificationListProps) {
                             {notification.message}
                           </p>
 
+                          {notification.plant_ids && (
+                            <DigestPlants notification={notification} onClose={onClose} />
+                          )}
+
                           <p className="text-xs text-muted-foreground mt-1">
                             {formatDistanceToNow(new Date(notification.created_at), {
                               addSuffix: true,
@@ -2,8 +2,10 @@
  * React Query hooks for notification management
  */
 
+import { useEffect } from 'react';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { notificationService } from '@/services/notificationService';
+import type { NotificationEvent, NotificationStats } from '@/types/notification';
 
 const NOTIFICATIONS_QUERY_KEY = 'notifications';
 
@@ -14,7 +16,6 @@ export function useNotifications(unreadOnly: boolean = false) {
   return useQuery({
     queryKey: [NOTIFICATIONS_QUERY_KEY, { unreadOnly }],
     queryFn: () => notificationService.getAll(unreadOnly),
-    refetchInterval: 60000, // Refetch every minute
   });
 }
 
@@ -25,10 +26,72 @@ export function useNotificationStats() {
   return useQuery({
     queryKey: [NOTIFICATIONS_QUERY_KEY, 'stats'],
     queryFn: () => notificationService.getStats(),
-    refetchInterval: 30000, // Refetch every 30 seconds
   });
 }
 
+/**
+ * Hook to fetch the plants covered by a digest notification, once expanded
+ */
+export function useNotificationItems(id: string, enabled: boolean) {
+  return useQuery({
+    queryKey: [NOTIFICATIONS_QUERY_KEY, 'items', id],
+    queryFn: () => notificationService.getItems(id),
+    enabled,
+    staleTime: Infinity, // A notification's plants never change
+  });
+}
+
+/**
+ * Hook to keep notification queries up to date from the server event stream.
+ * Mount it once; the browser reconnects automatically if the stream drops.
+ */
+export function useNotificationStream() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const source = notificationService.openStream();
+    const statsKey = [NOTIFICATIONS_QUERY_KEY, 'stats'];
+    const refetchLists = () =>
+      queryClient.invalidateQueries({
+        queryKey: [NOTIFICATIONS_QUERY_KEY],
+        predicate: (query) => query.queryKey[1] !== 'stats' && query.queryKey[1] !== 'items',
+      });
+
+    // Sent on every (re)connect, so changes missed while disconnected are picked up
+    source.addEventListener('stats', (e) => {
+      queryClient.setQueryData<NotificationStats>(statsKey, JSON.parse((e as MessageEvent).data));
+      refetchLists();
+    });
+
+    const onChange = (e: Event) => {
+      const event: NotificationEvent = JSON.parse((e as MessageEvent).data);
+      const delta =
+        event.event === 'notification.created'
+          ? 1
+          : event.event === 'notifications.created'
+            ? (event.count ?? 0)
+            : event.event === 'notification.deleted'
+              ? -1
+              : 0;
+      queryClient.setQueryData<NotificationStats>(statsKey, (stats) =>
+        stats ? { ...stats, total: stats.total + delta, unread: event.unread } : stats
+      );
+      refetchLists();
+    };
+
+    const eventTypes: NotificationEvent['event'][] = [
+      'notification.created',
+      'notifications.created',
+      'notification.read',
+      'notification.deleted',
+      'notifications.read_all',
+    ];
+    eventTypes.forEach((type) => source.addEventListener(type, onChange));
+
+    return () => source.close();
+  }, [queryClient]);
+}
+
 /**
  * Hook to mark a notification as read
  */
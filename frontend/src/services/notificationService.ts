@@ -2,11 +2,18 @@
  * Notification API service
  */
 
-import type { Notification, NotificationStats } from '@/types/notification';
+import type { Notification, NotificationItem, NotificationStats } from '@/types/notification';
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
 
 export const notificationService = {
+  /**
+   * Open the Server-Sent Events stream of notification changes
+   */
+  openStream(): EventSource {
+    return new EventSource(`${API_BASE_URL}/api/v1/notifications/stream`);
+  },
+
   /**
    * Get all notifications
    */
@@ -37,6 +44,22 @@ export const notificationService = {
     return response.json();
   },
 
+  /**
+   * Get the plants covered by a notification (expands digest notifications)
+   */
+  async getItems(id: string): Promise<NotificationItem[]> {
+    const response = await fetch(`${API_BASE_URL}/api/v1/notifications/${id}/items`);
+
+    if (!response.ok) {
+      if (response.status === 404) {
+        throw new Error('Notification not found');
+      }
+      throw new Error(`Failed to fetch notification items: ${response.statusText}`);
+    }
+
+    return response.json();
+  },
+
   /**
    * Mark a notification as read
    */
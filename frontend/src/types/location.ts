@@ -8,6 +8,8 @@ export interface LocationBase {
   description?: string | null;
   zone?: string | null;
   extra_data?: Record<string, any> | null;
+  timezone?: string;
+  reminder_hour?: number;
 }
 
 export interface LocationCreate extends LocationBase {}
@@ -18,6 +20,8 @@ export interface LocationUpdate {
   description?: string | null;
   zone?: string | null;
   extra_data?: Record<string, any> | null;
+  timezone?: string;
+  reminder_hour?: number;
 }
 
 export interface Location extends LocationBase {
@@ -16,12 +16,42 @@ export interface Notification {
   message: string;
   plant_id: string | null;
   plant_name: string | null;
+  location_id: string | null;
+  plant_ids: string[] | null; // Set on digest notifications grouping several plants
   is_read: boolean;
   created_at: string; // ISO datetime string
   read_at: string | null; // ISO datetime string
 }
 
+export interface NotificationItem {
+  plant_id: string;
+  plant_name: string;
+  location_id: string | null;
+  location_name: string | null;
+}
+
+export interface NotificationTypeStats {
+  total: number;
+  unread: number;
+}
+
 export interface NotificationStats {
   total: number;
   unread: number;
+  by_type: Partial<Record<NotificationType, NotificationTypeStats>>;
+}
+
+export type NotificationEventType =
+  | 'notification.created'
+  | 'notifications.created'
+  | 'notification.read'
+  | 'notification.deleted'
+  | 'notifications.read_all';
+
+export interface NotificationEvent {
+  event: NotificationEventType;
+  unread: number;
+  notification_id?: string;
+  type?: NotificationType;
+  count?: number; // notifications.created: how many were created
 }